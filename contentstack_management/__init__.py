@@ -6,6 +6,9 @@ from .user_session.user_session import UserSession
 from .users.user import User
 from .aliases.aliases import Alias
 from .assets.assets import Assets
+from .assets.upload_result import UploadResult
+from .assets.download_result import DownloadResult
+from .assets.folder_tree import FolderTree
 from .branches.branches import Branch
 from .content_types.content_type import ContentType
 from .global_fields.global_fields import GlobalFields
@@ -17,16 +20,25 @@ from .auditlogs.auditlog import Auditlog
 from .environments.environment import Environment
 from .entries.entry import Entry
 from .entry_variants.entry_variants import EntryVariants
-from .contentstack import Client, Region
+from .contentstack import Client, AsyncClient, Region
 from .endpoint import Endpoint
 from ._api_client import _APIClient
 from .common import Parameter
 from ._errors import ArgumentException
+from ._retry import RetryPolicy, RetryBudget
+from ._rate_limiter import RateLimiter
+from ._cache import ResponseCache
+from ._instrumentation import RequestEvent, LatencyAggregator
+from ._streaming import ItemStream
+from ._journal import Journal, SqliteJournal
+from ._transport import Transport, RequestsTransport, Urllib3Transport, StubTransport
 from .locale.locale import Locale
 from .taxonomies.taxonomy import Taxonomy
 from .labels.label import Label
 from .terms.terms import Terms
 from .bulk_operations.bulk_operation import BulkOperation
+from .bulk_operations.bulk_result import BulkResult
+from .bulk_operations.bulk_job import BulkJob
 from .releases.release import Releases
 from .release_items.release_item import ReleaseItems
 from .delivery_token.delivery_token import DeliveryToken
@@ -42,17 +54,34 @@ from .region_refresh import refresh_regions
 
 __all__ = (
 "Client",
+"AsyncClient",
 "Region",
 "Endpoint",
 "_APIClient",
 "Parameter",
 "ArgumentException",
+"RetryPolicy",
+"RetryBudget",
+"RateLimiter",
+"ResponseCache",
+"RequestEvent",
+"LatencyAggregator",
+"ItemStream",
+"Journal",
+"SqliteJournal",
+"Transport",
+"RequestsTransport",
+"Urllib3Transport",
+"StubTransport",
 "Organization",
 "Stack",
 "UserSession",
 "User",
 "Alias",
 "Assets",
+"UploadResult",
+"DownloadResult",
+"FolderTree",
 "Branch",
 "ContentType",
 "GlobalFields",
@@ -69,6 +98,8 @@ __all__ = (
 "Label",
 "Terms",
 "BulkOperation",
+"BulkResult",
+"BulkJob",
 "Releases",
 "ReleaseItems",
 "DeliveryToken",
@@ -102,7 +133,7 @@ __title__ = 'contentstack-management-python'
 __author__ = 'dev-ex'
 __status__ = 'debug'
 __region__ = 'na'
-__version__ = '1.10.0'
+__version__ = '1.11.0'
 __host__ = 'api.contentstack.io'
 __protocol__ = 'https://'
 __api_version__ = 'v3'
@@ -1,8 +1,21 @@
+import threading
+import time
+
 import requests
 
+from ._cache import ResponseCache
+from ._instrumentation import Hooks
+from ._rate_limiter import RateLimiter
+from ._retry import RetryPolicy
+from ._singleflight import SingleFlight
+from ._transport import RequestsTransport, Transport
+
 
 class _APIClient:
-    def __init__(self, endpoint, headers, timeout=30, max_retries: int = 5, oauth_interceptor=None):
+    def __init__(self, endpoint, headers, timeout=30, max_retries: int = 5, oauth_interceptor=None,
+                 pool_connections: int = 10, pool_maxsize: int = 10, pool_idle_timeout: float = None,
+                 retry_policy: RetryPolicy = None, rate_limiter: RateLimiter = None, transport: Transport = None,
+                 cache: ResponseCache = None, coalesce_requests: bool = True):
         """
         The function is a constructor that initializes the endpoint, headers, timeout, and max_retries
         attributes of an object.
@@ -19,6 +32,22 @@ class _APIClient:
         of times a request should be retried if it fails. If a request fails, the code will attempt to
         retry the request up to `max_retries` times before giving up, defaults to 5
         :type max_retries: int (optional)
+        :param pool_connections: The number of per-host connection pools kept by the shared session,
+        defaults to 10
+        :param pool_maxsize: The maximum number of keep-alive connections kept open per host,
+        defaults to 10
+        :param pool_idle_timeout: Number of seconds a pooled connection may stay unused before the
+        pool is flushed and fresh connections are opened. `None` keeps connections until the server
+        closes them
+        :param retry_policy: The `RetryPolicy` deciding when failed requests are retried. When not
+        provided, a policy honoring `max_retries` with exponential backoff is used
+        :param rate_limiter: Optional `RateLimiter` throttling requests per stack `api_key` before
+        they are sent
+        :param transport: The `Transport` sending the requests, e.g. `Urllib3Transport()` or
+        `StubTransport()`. Defaults to a `RequestsTransport` built with the pool options above
+        :param cache: Optional `ResponseCache` serving repeated `GET` requests from memory
+        :param coalesce_requests: Whether identical `GET` requests made concurrently share one
+        request and its response, defaults to True
         """
         
         self.endpoint = endpoint
@@ -27,9 +56,62 @@ class _APIClient:
         self.max_retries = max_retries
         self.oauth_interceptor = oauth_interceptor
         self.oauth = {}  # OAuth token storage
-        pass
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_idle_timeout = pool_idle_timeout
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy(max_retries=max_retries)
+        self.rate_limiter = rate_limiter
+        self.transport = transport
+        self.cache = cache
+        self.singleflight = SingleFlight() if coalesce_requests else None
+        self.hooks = Hooks()
+        self._session_lock = threading.Lock()
+        self._last_used = time.monotonic()
+        self.session = self._new_session()
+
+    def _new_session(self):
+        """
+        Returns the transport shared by every resource of this client. Connections are kept
+        alive and reused across calls, so the TCP and TLS handshakes are paid once per pooled
+        connection instead of once per request.
 
-    def _call_request(self, method, url, headers: dict = None, params=None, data=None, json_data=None, files=None):
+        :return: the configured `transport`, or a new `RequestsTransport`.
+        """
+
+        if self.transport is not None:
+            return self.transport
+        return RequestsTransport(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+
+    def _get_session(self):
+        """
+        Returns the shared transport, flushing pooled connections that have been idle longer than
+        `pool_idle_timeout` so that stale sockets are never reused.
+
+        :return: the shared transport.
+        """
+
+        with self._session_lock:
+            now = time.monotonic()
+            if self.session is None:
+                self.session = self._new_session()
+            elif self.pool_idle_timeout is not None and now - self._last_used > self.pool_idle_timeout:
+                self.session.clear()
+            self._last_used = now
+            return self.session
+
+    def close(self):
+        """
+        Closes the shared session and every pooled connection. The client opens a new pool on
+        the next request, so calling it more than once is safe.
+        """
+
+        with self._session_lock:
+            if self.session is not None:
+                self.session.close()
+                self.session = None
+
+    def _call_request(self, method, url, headers: dict = None, params=None, data=None, json_data=None, files=None,
+                      stream=False):
         """
         The function `_call_request` sends an HTTP request using the specified method, URL, headers,
         parameters, data, and JSON data, and returns the response as a JSON object.
@@ -51,26 +133,214 @@ class _APIClient:
         typically used when making a POST or PUT request to send data to the server in JSON format. The
         `json_data` parameter should be a dictionary that will be converted to JSON before sending the
         request
-        :return: the JSON response from the HTTP request.
+        :param stream: Whether the response body is left on the socket to be read incrementally.
+        Streamed requests bypass the cache and are never coalesced, as their body can only be
+        read once
+        :return: the JSON response from the HTTP request. Requests failing with a retryable status
+        or connection error are retried according to `retry_policy` before the last response is
+        returned or the last error is raised. When a `cache` is configured, cached `GET` responses
+        are returned without a request or revalidated with a conditional request, and writes drop
+        the cached responses they affect.
         """
         
+        headers = self._merge_headers(headers)
+        if stream:
+            return self._send_with_retries(method, url, headers, params, data, json_data, files, stream=True)
+        if self.cache is None:
+            return self._execute(method, url, headers, params, data, json_data, files)
+        path = self._relative_path(url)
+        if method != 'GET':
+            try:
+                return self._execute(method, url, headers, params, data, json_data, files)
+            finally:
+                self.cache.invalidate(path)
+        ttl = self.cache.ttl_for(path)
+        if ttl is None:
+            return self._execute(method, url, headers, params, data, json_data, files)
+        cache_key = self.cache.key(method, path, params, headers)
+        cached, fresh = self.cache.lookup(cache_key)
+        if fresh:
+            return cached
+        if cached is not None:
+            headers = {**headers, **self.cache.conditional_headers(cached)}
+        response = self._execute(method, url, headers, params)
+        if response.status_code == 304 and cached is not None:
+            response.close()
+            return self.cache.revalidated(cache_key, cached, response, ttl)
+        self.cache.store(cache_key, response, ttl)
+        return response
+
+    def _relative_path(self, url):
+        """Returns the path of a request URL relative to the API version, e.g. `content_types/blog`."""
+
+        path = url[len(self.endpoint):] if url.startswith(self.endpoint) else url
+        return path.split('?', 1)[0].strip('/')
+
+    def _execute(self, method, url, headers, params=None, data=None, json_data=None, files=None):
+        """
+        Sends a request with fully merged headers. Identical `GET` requests already in flight
+        are not sent again: the caller waits for the pending one and shares its response.
+
+        :return: the response of the request.
+        """
+
+        if method == 'GET' and self.singleflight is not None:
+            key = self.singleflight.key(url, params, headers)
+            return self.singleflight.do(key, lambda: self._send_with_retries(method, url, headers, params))
+        return self._send_with_retries(method, url, headers, params, data, json_data, files)
+
+    def add_hook(self, before_request=None, after_response=None):
+        """
+        Registers instrumentation hooks. Each hook is called with a `RequestEvent`:
+        `before_request` before a request goes on the wire and `after_response` once its final
+        response or error is received, retries included.
+
+        :param before_request: Callable run before each request
+        :param after_response: Callable run after each request, e.g. a `LatencyAggregator`
+        """
+
+        self.hooks.add(before_request, after_response)
+
+    def remove_hook(self, hook):
+        """Unregisters a hook added with `add_hook`."""
+
+        self.hooks.remove(hook)
+
+    def _send_with_retries(self, method, url, headers, params=None, data=None, json_data=None, files=None,
+                           stream=False):
+        """
+        Sends a request with fully merged headers, retrying it according to `retry_policy` and
+        reporting it to the registered hooks.
+
+        :return: the response of the last attempt.
+        """
+
+        if not self.hooks:
+            return self._send_attempts(method, url, headers, params, data, json_data, files, stream=stream)
+        event = self.hooks.start(method, url, self.endpoint, data, json_data, files)
+        try:
+            response = self._send_attempts(method, url, headers, params, data, json_data, files, event, stream)
+        except Exception as error:
+            self.hooks.finish(event, error=error)
+            raise
+        self.hooks.finish(event, response=response, stream=stream)
+        return response
+
+    def _send_attempts(self, method, url, headers, params=None, data=None, json_data=None, files=None, event=None,
+                       stream=False):
+        rate_limit_key = headers.get('api_key')
         if self.oauth_interceptor and self.oauth_interceptor.is_oauth_configured():
-            return self.oauth_interceptor.execute_request(
+            self._throttle(rate_limit_key)
+            response = self.oauth_interceptor.execute_request(
                 method, url, headers=headers, params=params, data=data, 
-                json=json_data, files=files, timeout=self.timeout
+                json=json_data, files=files, timeout=self.timeout, stream=stream
             )
+            self._record_rate_limit(rate_limit_key, response)
+            return response
         
-        if headers is None:
-            headers = {}
-        headers.update(self.headers)  # Merge client headers (including authtoken) with request headers
         if method == 'DELETE' and '/releases' in url and data is None and json_data is None:
             headers = {k: v for k, v in headers.items() if k.lower() != 'content-type'}
-        response = requests.request(
-            method, url, headers=headers, params=params, data=data, json=json_data, files=files, timeout=self.timeout)
-        # response.raise_for_status()
-        return response
+        replayable = self._is_replayable(data, files)
+        positions = [(f, f.tell()) for f in self._rewindable(data, files)] if replayable else []
+        attempt, started = 0, time.monotonic()
+        while True:
+            self._throttle(rate_limit_key)
+            self.retry_policy.record_request()
+            try:
+                response = self._get_session().request(
+                    method, url, headers=headers, params=params, data=data, json=json_data, files=files,
+                    timeout=self.timeout, stream=stream)
+            except requests.RequestException as error:
+                delay = self.retry_policy.next_delay(
+                    method, attempt, error=error, elapsed=time.monotonic() - started) if replayable else None
+                if delay is None:
+                    raise
+            else:
+                self._record_rate_limit(rate_limit_key, response)
+                delay = self.retry_policy.next_delay(
+                    method, attempt, response=response, elapsed=time.monotonic() - started) if replayable else None
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+            for fileobj, position in positions:
+                fileobj.seek(position)
+            attempt += 1
+            if event is not None:
+                event.retries = attempt
+                event.backoff += delay
 
-    def get(self, path, params=None, headers=None):
+    def _merge_headers(self, headers):
+        """
+        Builds the headers of a single request: the client headers (including the authtoken)
+        overlaid with the request headers. A request header set to None removes that header
+        from the request. Neither dictionary is modified.
+        """
+
+        merged = dict(self.headers)
+        merged.update(headers or {})
+        return {key: value for key, value in merged.items() if value is not None}
+
+    def scoped(self, headers: dict = None):
+        """
+        Returns a view of this client carrying its own headers. Resource handles (stacks,
+        branches, ...) keep their headers on such a view, so handles used from different
+        threads never see each other's headers while still sharing this client's session,
+        authtoken, retry policy and rate limiter.
+
+        :param headers: Initial headers of the view
+        :return: a `_ScopedAPIClient` bound to this client.
+        """
+
+        return _ScopedAPIClient(self, headers)
+
+    def _throttle(self, key):
+        """Waits for the rate limiter, when one is configured, before a request is sent."""
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(key)
+
+    def _record_rate_limit(self, key, response):
+        """Feeds the rate-limit headers of a response back to the rate limiter."""
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(key, response)
+
+    @staticmethod
+    def _file_objects(files):
+        """
+        Yields the file objects of a `files` mapping, whether given directly or as
+        `(filename, fileobj, ...)` tuples.
+        """
+
+        for value in (files or {}).values():
+            fileobj = value[1] if isinstance(value, (tuple, list)) else value
+            if hasattr(fileobj, 'read'):
+                yield fileobj
+
+    def _rewindable(self, data, files):
+        """
+        Returns the file objects read while a request body is sent: the files of `files` and a
+        file-like `data` body (e.g. a streamed multipart body).
+        """
+
+        objects = list(self._file_objects(files))
+        if hasattr(data, 'read'):
+            objects.append(data)
+        return objects
+
+    def _is_replayable(self, data, files):
+        """
+        Checks whether the request body can be sent again on retry. Streams and non-seekable
+        files are consumed by the first attempt, so requests carrying them are never retried.
+        """
+
+        if data is not None and not isinstance(data, (str, bytes, dict, list, tuple)) and not hasattr(data, 'read'):
+            return False
+        return all(hasattr(f, 'seek') and hasattr(f, 'tell') and getattr(f, 'seekable', lambda: True)()
+                   for f in self._rewindable(data, files))
+
+    def get(self, path, params=None, headers=None, stream=False):
         """
         The function sends a GET request to a specified URL with optional parameters and headers.
         
@@ -85,12 +355,14 @@ class _APIClient:
         that you want to include in the HTTP request. These headers can be used to provide additional
         information to the server, such as authentication credentials or content type. If no headers are
         provided, the `headers` parameter will default to `None
+        :param stream: Whether the response body is left on the socket, to be decoded incrementally
+        with `ItemStream`
         :return: The method is returning the result of the `_call_request` method.
         """
 
         url = f"{self.endpoint}{path}"
         # self.headers = headers or {}
-        return self._call_request('GET', url, headers=headers, params=params)
+        return self._call_request('GET', url, headers=headers, params=params, stream=stream)
 
     def put(self, path, data=None, params=None, json_data=None, headers=None, files=None):
         """
@@ -163,3 +435,53 @@ class _APIClient:
         url = f"{self.endpoint}{path}"
         # headers = headers or {}
         return self._call_request('DELETE', url, headers=headers, params=params, data = data)
+
+
+class _ScopedAPIClient:
+    """
+    Per-handle view of an `_APIClient`. `headers` only holds the headers of this view; they are
+    merged over the root client headers for every request made through it, so setting a header
+    on one stack or branch handle never leaks into requests made through another. Every other
+    attribute is read from the root client.
+    """
+
+    def __init__(self, api_client, headers: dict = None, stream: bool = False):
+        self.api_client = api_client
+        self.headers = dict(headers or {})
+        # When set, `GET` requests made through this view return streamed responses
+        self.stream = stream
+
+    def __getattr__(self, name):
+        return getattr(self.api_client, name)
+
+    def scoped(self, headers: dict = None):
+        """
+        Returns a new view inheriting the headers of this one.
+
+        :param headers: Headers added on top of the inherited ones
+        :return: a `_ScopedAPIClient` bound to the same root client.
+        """
+
+        merged = dict(self.headers)
+        merged.update(headers or {})
+        return _ScopedAPIClient(self.api_client, merged)
+
+    def _request_headers(self, headers):
+        merged = dict(self.headers)
+        merged.update(headers or {})
+        return merged
+
+    def get(self, path, params=None, headers=None, stream=False):
+        return self.api_client.get(path, params=params, headers=self._request_headers(headers),
+                                   stream=stream or self.stream)
+
+    def put(self, path, data=None, params=None, json_data=None, headers=None, files=None):
+        return self.api_client.put(path, data=data, params=params, json_data=json_data,
+                                   headers=self._request_headers(headers), files=files)
+
+    def post(self, path, data=None, json_data=None, headers=None, params=None, files=None):
+        return self.api_client.post(path, data=data, json_data=json_data, headers=self._request_headers(headers),
+                                    params=params, files=files)
+
+    def delete(self, path, headers=None, params=None, data=None):
+        return self.api_client.delete(path, headers=self._request_headers(headers), params=params, data=data)
@@ -0,0 +1,200 @@
+import asyncio
+import time
+
+try:
+    import httpx
+except ImportError:  # httpx is only installed with the optional async extra
+    httpx = None
+
+from ._api_client import _APIClient
+from ._messages import ASYNC_CLIENT_HTTPX_REQUIRED
+
+
+class _AsyncAPIClient(_APIClient):
+    """
+    Asynchronous counterpart of `_APIClient` backed by a pooled `httpx.AsyncClient`.
+
+    `get`, `put`, `post` and `delete` keep the synchronous signatures of `_APIClient` but return
+    coroutines, so every resource class (`Stack`, `ContentType`, `Entry`, ...) can be awaited
+    unchanged. Headers and parameters are captured when a method is called, not when the
+    coroutine runs, so resource handles may be reused right after a call. Retries and rate
+    limiting follow the same `RetryPolicy` and `RateLimiter` as the synchronous client.
+    """
+
+    def __init__(self, endpoint, headers, timeout=30, max_retries: int = 5, oauth_interceptor=None,
+                 pool_connections: int = 10, pool_maxsize: int = 10, pool_idle_timeout: float = None,
+                 retry_policy=None, rate_limiter=None, transport=None, cache=None, coalesce_requests: bool = True):
+        if httpx is None:
+            raise ImportError(ASYNC_CLIENT_HTTPX_REQUIRED)
+        super().__init__(endpoint, headers, timeout=timeout, max_retries=max_retries,
+                         oauth_interceptor=oauth_interceptor, pool_connections=pool_connections,
+                         pool_maxsize=pool_maxsize, pool_idle_timeout=pool_idle_timeout,
+                         retry_policy=retry_policy, rate_limiter=rate_limiter, transport=transport,
+                         cache=cache, coalesce_requests=coalesce_requests)
+        self._inflight = {}
+
+    def _new_session(self):
+        """
+        Builds the `httpx.AsyncClient` shared by every resource of this client. `pool_maxsize`
+        bounds the keep-alive connections and `pool_connections * pool_maxsize` the number of
+        concurrent connections. A configured `transport` (an `httpx.AsyncBaseTransport`) is
+        passed on to httpx.
+
+        :return: a configured `httpx.AsyncClient`.
+        """
+
+        limits = httpx.Limits(max_connections=self.pool_connections * self.pool_maxsize,
+                              max_keepalive_connections=self.pool_maxsize,
+                              keepalive_expiry=self.pool_idle_timeout if self.pool_idle_timeout is not None else 5.0)
+        return httpx.AsyncClient(limits=limits, timeout=self.timeout, transport=self.transport)
+
+    def _get_session(self):
+        """
+        Returns the shared async session, opening a new one after `aclose()`. Idle connections
+        are expired by httpx itself through `keepalive_expiry`.
+        """
+
+        if self.session is None:
+            self.session = self._new_session()
+        return self.session
+
+    async def aclose(self):
+        """Closes the shared async session and every pooled connection."""
+
+        session, self.session = self.session, None
+        if session is not None:
+            await session.aclose()
+
+    def close(self):
+        """
+        Returns a coroutine closing the shared async session, so `await client.close()` behaves
+        like the synchronous `close()`.
+        """
+
+        return self.aclose()
+
+    @staticmethod
+    def _encode_params(params):
+        """Formats query parameters the way `requests` does, so both clients send the same URLs."""
+
+        if not params:
+            return params
+        return {key: str(value) if isinstance(value, (bool, dict)) else value for key, value in params.items()}
+
+    def _call_request(self, method, url, headers: dict = None, params=None, data=None, json_data=None, files=None,
+                      stream=False):
+        """
+        Captures the request as it stands now and returns a coroutine that sends it. `stream` is
+        accepted for compatibility with `_APIClient`; async responses are always read in full.
+
+        :return: an awaitable resolving to the `httpx.Response` of the request.
+        """
+
+        merged = self._merge_headers(headers)
+        if method == 'DELETE' and '/releases' in url and data is None and json_data is None:
+            merged = {k: v for k, v in merged.items() if k.lower() != 'content-type'}
+        merged = {k: str(v) for k, v in merged.items()}
+        request = {'headers': merged, 'params': self._encode_params(params), 'json': json_data, 'files': files}
+        if isinstance(data, (str, bytes)) or hasattr(data, '__aiter__'):
+            request['content'] = data
+        else:
+            request['data'] = data
+        replayable = self._is_replayable(data, files)
+        if self.cache is None:
+            return self._dispatch(method, url, request, replayable)
+        path = self._relative_path(url)
+        if method != 'GET':
+            return self._invalidate_after(self._dispatch(method, url, request, replayable), path)
+        ttl = self.cache.ttl_for(path)
+        if ttl is None:
+            return self._dispatch(method, url, request, replayable)
+        cache_key = self.cache.key(method, path, params, merged)
+        cached, fresh = self.cache.lookup(cache_key)
+        if fresh:
+            return self._cached(cached)
+        if cached is not None:
+            request['headers'] = {**merged, **self.cache.conditional_headers(cached)}
+        return self._store(self._dispatch(method, url, request, replayable),
+                           cache_key, cached, ttl)
+
+    def _dispatch(self, method, url, request, replayable):
+        """
+        Returns the awaitable sending a captured request. Identical `GET` requests awaited
+        concurrently share one in-flight request and its response.
+        """
+
+        rate_limit_key = request['headers'].get('api_key')
+        if method != 'GET' or self.singleflight is None:
+            return self._send(method, url, rate_limit_key, request, replayable)
+        key = self.singleflight.key(url, request['params'], request['headers'])
+        return self._coalesce(key, lambda: self._send(method, url, rate_limit_key, request, replayable))
+
+    async def _coalesce(self, key, send):
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(send())
+            task.add_done_callback(lambda done: self._inflight.pop(key, None) if self._inflight.get(key) is done else None)
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _cached(response):
+        return response
+
+    async def _store(self, pending, cache_key, cached, ttl):
+        response = await pending
+        if response.status_code == 304 and cached is not None:
+            await response.aclose()
+            return self.cache.revalidated(cache_key, cached, response, ttl)
+        self.cache.store(cache_key, response, ttl)
+        return response
+
+    async def _invalidate_after(self, pending, path):
+        try:
+            return await pending
+        finally:
+            self.cache.invalidate(path)
+
+    async def _send(self, method, url, rate_limit_key, request, replayable):
+        if not self.hooks:
+            return await self._send_attempts(method, url, rate_limit_key, request, replayable)
+        event = self.hooks.start(method, url, self.endpoint, request.get('content', request.get('data')),
+                                 request['json'], request['files'])
+        try:
+            response = await self._send_attempts(method, url, rate_limit_key, request, replayable, event)
+        except Exception as error:
+            self.hooks.finish(event, error=error)
+            raise
+        self.hooks.finish(event, response=response)
+        return response
+
+    async def _send_attempts(self, method, url, rate_limit_key, request, replayable, event=None):
+        positions = [(f, f.tell()) for f in self._rewindable(request.get('content'), request['files'])] \
+            if replayable else []
+        attempt, started = 0, time.monotonic()
+        while True:
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve(rate_limit_key)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            self.retry_policy.record_request()
+            try:
+                response = await self._get_session().request(method, url, **request)
+            except httpx.HTTPError as error:
+                delay = self.retry_policy.next_delay(
+                    method, attempt, error=error, elapsed=time.monotonic() - started) if replayable else None
+                if delay is None:
+                    raise
+            else:
+                self._record_rate_limit(rate_limit_key, response)
+                delay = self.retry_policy.next_delay(
+                    method, attempt, response=response, elapsed=time.monotonic() - started) if replayable else None
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            for fileobj, position in positions:
+                fileobj.seek(position)
+            attempt += 1
+            if event is not None:
+                event.retries = attempt
+                event.backoff += delay
@@ -0,0 +1,207 @@
+"""
+Opt-in response cache used by `_APIClient`.
+
+Read-mostly resources (content type and global field schemas, environments, locales, stack
+settings) are fetched over and over by long-running services although they rarely change.
+`ResponseCache` keeps their `GET` responses in memory for a limited time, bounded by a
+least-recently-used size limit. Any write (`POST`, `PUT`, `DELETE`) made through the client to a
+cached path, one of its sub-paths or its parent collection drops the affected entries.
+
+Responses carrying an `ETag` or `Last-Modified` validator are kept after they expire. The next
+request for them is sent as a conditional `GET` (`If-None-Match` / `If-Modified-Since`) and a
+`304 Not Modified` reply is answered with the cached body, so large payloads such as exports are
+only transferred again when they changed.
+"""
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """
+    TTL and LRU bounded cache of successful `GET` responses.
+
+    Entries are keyed by method, path, query parameters, stack `api_key`, `branch`,
+    `api_version` and a digest of the credentials sent with the request, so users, stacks and
+    branches never see each other's responses. Expired responses with an `ETag` or
+    `Last-Modified` header are revalidated with a conditional request instead of being dropped.
+
+    :param ttl: Number of seconds a response is served from the cache
+    :param maxsize: Maximum number of responses kept; the least recently used one is evicted first
+    :param paths: Regular expressions matched against the request path (relative to the API
+    version, e.g. `content_types/blog`); only matching `GET` requests are cached. Defaults to
+    `DEFAULT_PATHS`; pass None to cache every `GET`
+    :param revalidate_paths: Regular expressions of paths whose responses are never served without
+    asking the API: they are always revalidated with a conditional request. Defaults to
+    `DEFAULT_REVALIDATE_PATHS` (content type, global field and entry exports)
+    """
+
+    DEFAULT_PATHS = (
+        r'content_types(/[^/]+)?',
+        r'global_fields(/[^/]+)?',
+        r'environments(/[^/]+)?',
+        r'locales(/[^/]+)?',
+        r'stacks(/settings)?',
+    )
+    DEFAULT_REVALIDATE_PATHS = (
+        r'content_types/[^/]+/export',
+        r'global_fields/[^/]+/export',
+        r'content_types/[^/]+/entries/[^/]+/export',
+    )
+    SCOPE_HEADERS = ('api_key', 'branch', 'api_version')
+    AUTH_HEADERS = ('authtoken', 'authorization')
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 256, paths=DEFAULT_PATHS,
+                 revalidate_paths=DEFAULT_REVALIDATE_PATHS):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.paths = None if paths is None else [re.compile(pattern) for pattern in paths]
+        self.revalidate_paths = [re.compile(pattern) for pattern in revalidate_paths or ()]
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, path):
+        """
+        Returns how long responses of the given path are served without asking the API.
+
+        :param path: The request path relative to the API version
+        :return: `ttl`, 0 for paths that are always revalidated, or None when the path is not cached.
+        """
+        path = path.strip('/')
+        if any(pattern.fullmatch(path) for pattern in self.revalidate_paths):
+            return 0
+        if self.paths is None or any(pattern.fullmatch(path) for pattern in self.paths):
+            return self.ttl
+        return None
+
+    def is_cacheable(self, path) -> bool:
+        """
+        Checks whether `GET` requests to the given path are cached.
+
+        :param path: The request path relative to the API version
+        """
+        return self.ttl_for(path) is not None
+
+    def key(self, method, path, params=None, headers=None):
+        """
+        Builds the cache key of a request.
+
+        :param method: The HTTP method of the request
+        :param path: The request path relative to the API version
+        :param params: The query parameters of the request
+        :param headers: The headers sent with the request
+        :return: a hashable key.
+        """
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        scope = tuple(str(headers.get(name)) for name in self.SCOPE_HEADERS)
+        credentials = '\n'.join(str(headers.get(name)) for name in self.AUTH_HEADERS)
+        identity = hashlib.sha256(credentials.encode('utf-8')).hexdigest()
+        query = json.dumps(params or {}, sort_keys=True, default=str)
+        return method.upper(), path.strip('/'), query, scope, identity
+
+    @staticmethod
+    def conditional_headers(response) -> dict:
+        """
+        Builds the `If-None-Match` / `If-Modified-Since` headers revalidating a cached response.
+
+        :return: the conditional headers, empty when the response has no validator.
+        """
+        headers = {}
+        if response.headers.get('ETag'):
+            headers['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = response.headers['Last-Modified']
+        return headers
+
+    def lookup(self, key):
+        """
+        Looks up the cached response of a request.
+
+        :return: a `(response, fresh)` tuple. `fresh` is False for an expired response that must be
+        revalidated before use; `response` is None when nothing usable is cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            if entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1], True
+            if self.conditional_headers(entry[1]):
+                return entry[1], False
+            del self._entries[key]
+            self.misses += 1
+            return None, False
+
+    def get(self, key):
+        """
+        Returns the cached response for the key, or None when it is missing or expired.
+        """
+        response, fresh = self.lookup(key)
+        return response if fresh else None
+
+    def store(self, key, response, ttl: float = None):
+        """
+        Caches a response. Only `200` responses without `Cache-Control: no-store` are kept, and
+        responses that may not be served without revalidation only when they carry a validator.
+
+        :param ttl: Number of seconds the response is served without revalidation, defaults to `ttl`
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if response.status_code != 200 or 'no-store' in response.headers.get('Cache-Control', ''):
+            return
+        if ttl <= 0 and not self.conditional_headers(response):
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def revalidated(self, key, cached, not_modified, ttl: float = None):
+        """
+        Serves a cached response confirmed by a `304 Not Modified` reply, refreshing its
+        validators and expiry.
+
+        :param cached: The cached response that was revalidated
+        :param not_modified: The `304` response of the conditional request
+        :param ttl: Number of seconds the response is served again without revalidation
+        :return: the cached response.
+        """
+        for name in ('ETag', 'Last-Modified', 'Cache-Control', 'Date'):
+            if not_modified.headers.get(name):
+                cached.headers[name] = not_modified.headers[name]
+        with self._lock:
+            self.revalidations += 1
+        self.store(key, cached, ttl)
+        return cached
+
+    def invalidate(self, path):
+        """
+        Drops the cached responses of a path written to, of its sub-paths and of its parent
+        collections, e.g. a `PUT content_types/blog` drops `content_types/blog` and `content_types`.
+
+        :param path: The path that was written to, relative to the API version
+        """
+        path = path.strip('/')
+        with self._lock:
+            for key in list(self._entries):
+                cached = key[1]
+                if cached == path or cached.startswith(path + '/') or path.startswith(cached + '/'):
+                    del self._entries[key]
+
+    def clear(self):
+        """Drops every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
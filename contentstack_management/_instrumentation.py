@@ -0,0 +1,215 @@
+"""
+Request instrumentation for `_APIClient` and `OAuthInterceptor`.
+
+Hooks registered with `add_hook` are called with a `RequestEvent` before a request is sent and
+after its final response (or error) is received. Events carry the method, the templated route
+(e.g. `content_types/{uid}/entries`), status, bytes sent and received, retry count and timings.
+`LatencyAggregator` is a ready-made `after_response` hook keeping latency percentiles per route.
+"""
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+# Literal path segments of the Management API; any other segment is an identifier.
+ROUTE_SEGMENTS = frozenset((
+    'accept_ownership', 'activate', 'ancestors', 'apps', 'assets', 'assignments', 'audit-logs', 'authorize',
+    'branch_aliases', 'branches', 'bulk', 'clone', 'content_type', 'content_types', 'deactivate', 'delete',
+    'delivery_tokens', 'deploy', 'descendants', 'disable', 'enable', 'entries', 'environments', 'executions',
+    'export', 'extensions', 'folders', 'forgot_password', 'global_fields', 'import', 'item', 'items', 'jobs',
+    'labels', 'locales', 'logs', 'management_tokens', 'metadata', 'move', 'name', 'oauth', 'organizations',
+    'publish', 'publish-queue', 'publishing_rules', 'references', 'release', 'releases', 'reset',
+    'reset_password', 'retry', 'roles', 'settings', 'share', 'stacks', 'taxonomies', 'terms', 'token',
+    'transfer-ownership', 'transfer_ownership', 'unlocalize', 'unpublish', 'unschedule', 'unshare',
+    'update_items', 'user', 'user-session', 'users', 'variant_groups', 'variants', 'versions', 'webhooks',
+    'workflow', 'workflows',
+))
+
+
+def route_template(url, endpoint=None):
+    """
+    Returns the templated route of a request URL, with identifiers replaced by `{uid}`.
+
+    :param url: The request URL
+    :param endpoint: The API base URL stripped from the route, e.g. `https://api.contentstack.io/v3/`
+    :return: the route, e.g. `content_types/{uid}/entries`.
+    """
+    path = url[len(endpoint):] if endpoint and url.startswith(endpoint) else urlsplit(url).path
+    segments = [segment for segment in path.split('?', 1)[0].split('/') if segment]
+    return '/'.join(segment if segment in ROUTE_SEGMENTS else '{uid}' for segment in segments)
+
+
+def body_size(data=None, json_data=None, files=None):
+    """
+    Returns the number of bytes of a request body, counting the remaining size of uploaded files.
+    Bodies whose size cannot be known (e.g. generators) count as 0.
+    """
+    size = 0
+    if isinstance(data, str):
+        size += len(data.encode('utf-8'))
+    elif isinstance(data, (bytes, bytearray, memoryview)):
+        size += len(data)
+    elif hasattr(data, 'read') and hasattr(data, '__len__'):
+        size += len(data)
+    if json_data is not None:
+        size += len(json.dumps(json_data).encode('utf-8'))
+    for value in (files or {}).values():
+        fileobj = value[1] if isinstance(value, (tuple, list)) else value
+        if isinstance(fileobj, (bytes, bytearray)):
+            size += len(fileobj)
+        elif hasattr(fileobj, 'fileno') and hasattr(fileobj, 'tell'):
+            try:
+                size += os.fstat(fileobj.fileno()).st_size - fileobj.tell()
+            except (OSError, ValueError):
+                pass
+    return size
+
+
+class RequestEvent:
+    """
+    Describes one API call made by the SDK.
+
+    :ivar method: The HTTP method
+    :ivar url: The request URL
+    :ivar route: The templated route, e.g. `content_types/{uid}/entries`
+    :ivar status_code: The status of the final response, None before it is received or on error
+    :ivar bytes_out: The size of the request body
+    :ivar bytes_in: The size of the final response body
+    :ivar retries: The number of retries made
+    :ivar started: The wall-clock time the call started at
+    :ivar duration: The seconds spent on the call, retries and backoff included
+    :ivar backoff: The seconds spent waiting between retries
+    :ivar error: The exception the call failed with, if any
+    """
+
+    __slots__ = ('method', 'url', 'route', 'status_code', 'bytes_out', 'bytes_in', 'retries', 'started',
+                 'duration', 'backoff', 'error', '_clock')
+
+    def __init__(self, method, url, route, bytes_out=0):
+        self.method = method
+        self.url = url
+        self.route = route
+        self.status_code = None
+        self.bytes_out = bytes_out
+        self.bytes_in = 0
+        self.retries = 0
+        self.started = time.time()
+        self.duration = None
+        self.backoff = 0.0
+        self.error = None
+        self._clock = time.monotonic()
+
+    def __repr__(self):
+        return (f"RequestEvent({self.method} {self.route} status={self.status_code} "
+                f"duration={self.duration} retries={self.retries})")
+
+
+class Hooks:
+    """Holds the `before_request` and `after_response` hooks of a client."""
+
+    def __init__(self):
+        self.before_request = []
+        self.after_response = []
+
+    def add(self, before_request=None, after_response=None):
+        if before_request is not None:
+            self.before_request.append(before_request)
+        if after_response is not None:
+            self.after_response.append(after_response)
+
+    def remove(self, hook):
+        for hooks in (self.before_request, self.after_response):
+            if hook in hooks:
+                hooks.remove(hook)
+
+    def __bool__(self):
+        return bool(self.before_request or self.after_response)
+
+    def start(self, method, url, endpoint=None, data=None, json_data=None, files=None):
+        """Creates the event of a call and runs the `before_request` hooks."""
+        event = RequestEvent(method, url, route_template(url, endpoint), body_size(data, json_data, files))
+        for hook in self.before_request:
+            hook(event)
+        return event
+
+    def finish(self, event, response=None, error=None, stream=False):
+        """
+        Completes the event of a call and runs the `after_response` hooks. The body of a streamed
+        response is not read: its size is taken from `Content-Length`.
+        """
+        event.duration = time.monotonic() - event._clock
+        event.error = error
+        if response is not None:
+            event.status_code = response.status_code
+            if stream:
+                event.bytes_in = int(response.headers.get('Content-Length') or 0)
+            else:
+                event.bytes_in = len(response.content or b'')
+        for hook in self.after_response:
+            hook(event)
+
+
+class LatencyAggregator:
+    """
+    In-memory `after_response` hook keeping call counts, wall time and latency percentiles per
+    route. Percentiles are computed over the most recent `window` calls of each route.
+
+    [Example:]
+        >>> aggregator = contentstack_management.LatencyAggregator()
+        >>> client.add_hook(after_response=aggregator)
+        >>> client.stack('api_key').content_types('blog').fetch()
+        >>> aggregator.summary()['GET content_types/{uid}']['p95']
+
+    :param window: The number of latest samples kept per route
+    """
+
+    def __init__(self, window: int = 10000):
+        self.window = window
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        key = f"{event.method} {event.route}"
+        with self._lock:
+            stats = self._routes.get(key)
+            if stats is None:
+                stats = self._routes[key] = {'samples': deque(maxlen=self.window), 'count': 0, 'errors': 0,
+                                             'total': 0.0, 'retries': 0, 'bytes_in': 0, 'bytes_out': 0}
+            stats['samples'].append(event.duration)
+            stats['count'] += 1
+            stats['total'] += event.duration
+            stats['retries'] += event.retries
+            stats['bytes_in'] += event.bytes_in
+            stats['bytes_out'] += event.bytes_out
+            if event.error is not None or (event.status_code or 0) >= 400:
+                stats['errors'] += 1
+
+    @staticmethod
+    def _percentile(ordered, percent):
+        index = max(0, math.ceil(percent / 100.0 * len(ordered)) - 1)
+        return ordered[min(index, len(ordered) - 1)]
+
+    def summary(self) -> dict:
+        """
+        Returns the statistics of every route, keyed by `"<METHOD> <route>"` and sorted by total
+        wall time, most expensive first.
+
+        :return: a dict of `count`, `errors`, `retries`, `total`, `bytes_in`, `bytes_out`, `p50`,
+        `p95` and `p99` (in seconds) per route.
+        """
+        with self._lock:
+            routes = {key: dict(stats, samples=sorted(stats['samples'])) for key, stats in self._routes.items()}
+        summary = {}
+        for key, stats in sorted(routes.items(), key=lambda item: item[1]['total'], reverse=True):
+            samples = stats.pop('samples')
+            summary[key] = dict(stats, p50=self._percentile(samples, 50), p95=self._percentile(samples, 95),
+                                p99=self._percentile(samples, 99))
+        return summary
+
+    def reset(self):
+        """Drops every recorded sample."""
+        with self._lock:
+            self._routes.clear()
@@ -0,0 +1,175 @@
+"""
+Checkpoint journals for long-running jobs.
+
+Exports, imports, bulk operations and mass updates can take hours; when one of them dies halfway
+on a network blip it should not start again from zero. A journal records every completed
+operation under a key (e.g. `entries/blt123`) with a digest of the content it was run with and
+an optional result (e.g. the uid created). A job run again with the same journal skips the
+operations already done with the same content.
+
+`Journal` appends JSON lines to a file and keeps the records in memory; `SqliteJournal` keeps
+them in a SQLite database, for jobs with too many operations to hold in memory.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+
+class Journal:
+    """
+    Append-only journal kept in an NDJSON file. Records are flushed as they are written and a
+    truncated last line, left by a process killed mid-write, is ignored when the file is loaded.
+
+    [Example:]
+        >>> journal = contentstack_management.Journal('updates.journal')
+        >>> for entry in entries:
+        >>>     journal.run(f"entries/{entry['uid']}", lambda: handle(entry).update(entry), entry)
+
+    :param path: The file the journal is kept in; existing records are loaded
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._records = {}
+        self._lock = threading.Lock()
+        line = '\n'
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    self._records[record['key']] = (record.get('digest'), record.get('result'))
+        self._file = open(path, 'a', encoding='utf-8')
+        if not line.endswith('\n'):
+            # Start new records on their own line after a truncated one
+            self._file.write('\n')
+
+    @staticmethod
+    def digest(data) -> str:
+        """
+        Returns the content hash of an operation's data: a SHA-256 of its canonical JSON.
+        """
+        canonical = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def _lookup(self, key):
+        return self._records.get(key)
+
+    def __contains__(self, key):
+        return self._lookup(key) is not None
+
+    def get(self, key, default=None):
+        """Returns the result recorded for an operation, `default` when it was not recorded."""
+        record = self._lookup(key)
+        return default if record is None else record[1]
+
+    def done(self, key, data=None) -> bool:
+        """
+        Checks whether an operation was completed. When `data` is given, the operation only
+        counts as done if it was recorded with the same content.
+        """
+        record = self._lookup(key)
+        return record is not None and (data is None or record[0] == self.digest(data))
+
+    def record(self, key, result=None, data=None):
+        """
+        Records a completed operation.
+
+        :param key: The key of the operation, e.g. `entries/blt123`
+        :param result: A JSON-serializable result returned by `get`
+        :param data: The content the operation was run with; its digest is recorded
+        """
+        digest = None if data is None else self.digest(data)
+        with self._lock:
+            self._records[key] = (digest, result)
+            self._file.write(json.dumps({'key': key, 'digest': digest, 'result': result}))
+            self._file.write('\n')
+            self._file.flush()
+
+    def run(self, key, operation, data=None):
+        """
+        Runs an operation unless it was already completed with the same content, then records it.
+        A `requests.Response` returned by the operation is checked with `raise_for_status` and
+        its JSON body is recorded.
+
+        :param key: The key of the operation
+        :param operation: A callable running the operation
+        :param data: The content the operation is run with
+        :return: the result of the operation, or the recorded result when it is skipped.
+        """
+        if self.done(key, data):
+            return self.get(key)
+        result = operation()
+        if hasattr(result, 'raise_for_status'):
+            result.raise_for_status()
+            result = result.json() if result.content else None
+        self.record(key, result, data)
+        return result
+
+    def __len__(self):
+        return len(self._records)
+
+    def close(self):
+        """Closes the journal file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SqliteJournal(Journal):
+    """
+    Journal kept in a SQLite database instead of memory. Safe to share between threads.
+
+    :param path: The database file; existing records are kept
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS journal (key TEXT PRIMARY KEY, digest TEXT, result TEXT)')
+        self._db.commit()
+
+    def _lookup(self, key):
+        with self._lock:
+            row = self._db.execute('SELECT digest, result FROM journal WHERE key = ?', (key,)).fetchone()
+        return None if row is None else (row[0], json.loads(row[1]))
+
+    def record(self, key, result=None, data=None):
+        digest = None if data is None else self.digest(data)
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO journal (key, digest, result) VALUES (?, ?, ?)',
+                             (key, digest, json.dumps(result)))
+            self._db.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM journal').fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def open_journal(journal):
+    """
+    Returns a journal for a `journal` option: a `Journal` is used as is, a path ending in
+    `.db`, `.sqlite` or `.sqlite3` opens a `SqliteJournal` and any other path a `Journal`.
+
+    :return: a `(journal, owned)` tuple; `owned` is True when the journal was opened here and
+    must be closed by the caller.
+    """
+    if isinstance(journal, Journal):
+        return journal, False
+    if str(journal).endswith(('.db', '.sqlite', '.sqlite3')):
+        return SqliteJournal(journal), True
+    return Journal(journal), True
@@ -15,6 +15,13 @@ ALIAS_UID_REQUIRED = "Alias UID is required. Provide a valid Alias UID and try a
 ASSET_UID_REQUIRED = "Asset UID is required. Provide a valid Asset UID and try again."
 ASSET_TYPE_REQUIRED = "Asset Type is required. Provide a valid Asset Type and try again."
 ASSET_VERSION_NUMBER_REQUIRED = "Version Number is required. Provide a valid Version Number and try again."
+ASSET_FILENAME_REQUIRED = "Filename is required when uploading from memory or a stream. Provide a filename and try again."
+ASSET_DOWNLOAD_SIZE_MISMATCH = "Downloaded asset {} has {} bytes instead of the expected {}. Download it again to resume it."
+EXPORT_ASSET_FILES_FAILED = "{} of {} asset files could not be downloaded, e.g. asset {}: {}. Run the export again to retry them."
+
+# Async client messages
+ASYNC_CLIENT_HTTPX_REQUIRED = "AsyncClient requires the httpx package. Install it with 'pip install contentstack-management[async]' and try again."
+ASYNC_CLIENT_CONTEXT_REQUIRED = "AsyncClient must be used with 'async with'. Use 'async with AsyncClient(...)' or await close() and try again."
 
 # Audit log messages
 LOG_ITEM_UID_REQUIRED = "Log Item UID is required. Provide a valid Log Item UID and try again."
@@ -24,6 +31,7 @@ BRANCH_UID_REQUIRED = "Branch UID is required. Provide a valid Branch UID and tr
 
 # Bulk operation messages
 JOB_UID_REQUIRED = "Job UID is required. Provide a valid Job UID and try again."
+BULK_CHUNK_SIZE_INVALID = "Chunk size must be a positive number. Provide a valid chunk size and try again."
 
 # Content type messages
 CONTENT_TYPE_UID_REQUIRED = "Content Type UID is required. Provide a valid Content Type UID and try again."
@@ -0,0 +1,205 @@
+"""
+Streaming multipart uploads.
+
+Passing open files through `files=` makes `requests` encode the whole multipart body in memory
+before sending it, so uploading a multi-GB video costs that much RAM per worker. `MultipartBody`
+builds the body with requests-toolbelt's `MultipartEncoder` instead, which reads the files in
+chunks as the body is written to the socket. The body can be rewound, so uploads are still
+retried, and the files opened for it are closed once the request is done.
+
+Besides paths, a file can be given as `bytes`, `bytearray`, a `memoryview` or a readable binary
+file-like object, so content produced in memory is uploaded without a temporary file. Buffers
+are read through a `memoryview` without copying them whole.
+"""
+import inspect
+import io
+import os
+
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+
+
+def is_path(source) -> bool:
+    """Checks whether an upload source is a filesystem path rather than content."""
+    return isinstance(source, (str, os.PathLike))
+
+
+def source_name(source):
+    """Returns the file name of an upload source: the base name of a path or of a file's `name`."""
+    name = source if is_path(source) else getattr(source, 'name', None)
+    return os.path.basename(os.fspath(name)) if isinstance(name, (str, os.PathLike)) else None
+
+
+class _Source:
+    """
+    Reads the content of a part from a buffer or a file object, with the `len` and `read` the
+    encoder expects and a `rewind` to replay it on retry.
+    """
+
+    def __init__(self, data):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            self._view = memoryview(data).cast('B')
+            self._file = None
+            self._size = len(self._view)
+        else:
+            self._view = None
+            self._file = data
+            self._start = data.tell() if self._seekable(data) else None
+            if self._start is not None:
+                self._size = data.seek(0, io.SEEK_END) - self._start
+                data.seek(self._start)
+            else:
+                # Streams of unknown length are read once so their size can be announced
+                self._view = memoryview(data.read()).cast('B')
+                self._size = len(self._view)
+        self._read = 0
+
+    @staticmethod
+    def _seekable(file):
+        try:
+            return file.seekable() if hasattr(file, 'seekable') else hasattr(file, 'seek') and hasattr(file, 'tell')
+        except ValueError:
+            return False
+
+    @property
+    def len(self):
+        return self._size - self._read
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.len
+        if self._view is not None:
+            chunk = bytes(self._view[self._read:self._read + size])
+        else:
+            chunk = self._file.read(min(size, self.len))
+        self._read += len(chunk)
+        return chunk
+
+    def rewind(self):
+        if self._view is None:
+            self._file.seek(self._start)
+        self._read = 0
+
+
+class MultipartBody:
+    """
+    A `multipart/form-data` request body streamed from files.
+
+    :param fields: The form fields, mapping each name to a string value or to a
+    `(filename, source, content_type)` tuple. `source` is a path, opened here and closed by
+    `close()`, or the content itself: bytes, a `memoryview` or a readable binary file object, read
+    from its current position and left open
+    :param progress: Optional callable called with the number of bytes read so far and the
+    size of the body each time a chunk is read
+    """
+
+    def __init__(self, fields: dict, progress=None):
+        self.progress = progress
+        self._files = []
+        self._sources = []
+        self._parts = {}
+        try:
+            for name, value in fields.items():
+                if isinstance(value, str):
+                    self._parts[name] = value
+                    continue
+                filename, source, content_type = value
+                if is_path(source):
+                    source = open(source, 'rb')
+                    self._files.append(source)
+                    if filename is None:
+                        filename = source_name(source)
+                source = _Source(source)
+                self._sources.append(source)
+                self._parts[name] = (filename, source, content_type) if content_type else (filename, source)
+        except BaseException:
+            self.close()
+            raise
+        self._encoder = MultipartEncoder(self._parts)
+        self._position = 0
+
+    @property
+    def content_type(self) -> str:
+        """The `Content-Type` header of the body, including its boundary."""
+        return self._encoder.content_type
+
+    def __len__(self):
+        return self._encoder.len
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._encoder.read(size)
+        self._position += len(chunk)
+        if self.progress is not None and chunk:
+            self.progress(self._position, len(self))
+        return chunk
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(64 * 1024)
+            if not chunk:
+                return
+            yield chunk
+
+    async def __aiter__(self):
+        for chunk in self:
+            yield chunk
+
+    def tell(self) -> int:
+        return self._position
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Rewinds the body to its start; the only supported position is 0."""
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation('A multipart body can only be rewound to its start')
+        for source in self._sources:
+            source.rewind()
+        # Keep the boundary already announced in the Content-Type header
+        self._encoder = MultipartEncoder(self._parts, boundary=self._encoder.boundary_value)
+        self._position = 0
+        return 0
+
+    def close(self):
+        """Closes the files opened for the body."""
+        for file in self._files:
+            file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+async def _close_after(pending, body):
+    try:
+        return await pending
+    finally:
+        body.close()
+
+
+def send_multipart(send, url, fields: dict, headers: dict = None, params=None, progress=None):
+    """
+    Sends a request whose body is streamed from the given files, closing them once the response
+    is received, or once it is awaited with the async client.
+
+    :param send: The client method sending the request, e.g. `client.post`
+    :param url: The path of the request
+    :param fields: The form fields, see `MultipartBody`
+    :param headers: The request headers; the multipart `Content-Type` is set here
+    :param params: The query parameters
+    :param progress: Optional callable reporting the bytes sent, see `MultipartBody`
+    :return: the response, or an awaitable resolving to it.
+    """
+    body = MultipartBody(fields, progress)
+    headers = {**(headers or {}), 'Content-Type': body.content_type, 'Content-Length': str(len(body))}
+    try:
+        response = send(url, headers=headers, params=params, data=body)
+    except BaseException:
+        body.close()
+        raise
+    if inspect.isawaitable(response):
+        return _close_after(response, body)
+    body.close()
+    return response
@@ -0,0 +1,103 @@
+"""
+Client-side rate limiter used by `_APIClient`.
+
+Contentstack applies its Management API rate limits per stack, so the limiter keeps one token
+bucket per `api_key` header (calls made outside a stack share a single bucket). The buckets adapt
+to the `X-RateLimit-Limit` / `X-RateLimit-Remaining` headers returned by the API and back off
+multiplicatively when a `429` slips through, keeping throughput close to the ceiling without
+tripping it.
+"""
+import threading
+import time
+
+
+class _Bucket:
+
+    def __init__(self, rate, capacity, now):
+        self.rate = rate
+        self.ceiling = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter keyed by stack `api_key`.
+
+    :param rate: Requests per second allowed for each stack until the API reports its own limit
+    :param burst: Number of requests that may be sent back to back, defaults to `rate`
+    :param min_rate: Lowest rate the limiter backs off to after `429` responses
+    """
+
+    LIMIT_HEADER = 'X-RateLimit-Limit'
+    REMAINING_HEADER = 'X-RateLimit-Remaining'
+
+    def __init__(self, rate: float = 10.0, burst: float = None, min_rate: float = 1.0):
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+        self.min_rate = min_rate
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key, now):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.rate, self.burst, now)
+        bucket.refill(now)
+        return bucket
+
+    def reserve(self, key=None) -> float:
+        """
+        Reserves one request slot for the given stack.
+
+        :param key: The stack `api_key` the request is made against, or None
+        :return: the number of seconds the caller must wait before sending the request.
+        """
+        with self._lock:
+            bucket = self._bucket(key, time.monotonic())
+            bucket.tokens -= 1
+            return 0.0 if bucket.tokens >= 0 else -bucket.tokens / bucket.rate
+
+    def acquire(self, key=None):
+        """
+        Blocks until a request may be sent for the given stack.
+
+        :param key: The stack `api_key` the request is made against, or None
+        """
+        delay = self.reserve(key)
+        if delay > 0:
+            time.sleep(delay)
+
+    @staticmethod
+    def _header(response, name):
+        try:
+            return float(response.headers.get(name))
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+    def update(self, key, response):
+        """
+        Adapts the stack's bucket to the rate-limit headers and status of a response.
+
+        :param key: The stack `api_key` the request was made against, or None
+        :param response: The response returned by the API
+        """
+        limit = self._header(response, self.LIMIT_HEADER)
+        remaining = self._header(response, self.REMAINING_HEADER)
+        with self._lock:
+            bucket = self._bucket(key, time.monotonic())
+            if limit is not None and limit > 0:
+                bucket.ceiling = limit
+                bucket.capacity = min(self.burst, limit)
+            if response.status_code == 429:
+                bucket.rate = max(self.min_rate, bucket.rate / 2)
+                bucket.tokens = min(bucket.tokens, 0)
+                return
+            bucket.rate = min(bucket.ceiling, bucket.rate + 1)
+            if remaining is not None:
+                bucket.tokens = min(bucket.tokens, remaining)
@@ -0,0 +1,175 @@
+"""
+Retry policy used by `_APIClient` for every resource call.
+
+Failed requests are retried with capped exponential backoff and full jitter. A `Retry-After`
+header sent by the server always takes precedence over the computed delay. Only requests that
+are safe to repeat are retried, a shared retry budget stops a struggling API from being
+flooded with retries, and a deadline bounds the total time one call spends retrying.
+"""
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+
+import requests
+from urllib3.exceptions import NameResolutionError
+
+try:
+    import httpx
+except ImportError:  # httpx is only installed with the optional async extra
+    httpx = None
+
+TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout)
+if httpx is not None:
+    TRANSIENT_ERRORS += (httpx.NetworkError, httpx.TimeoutException, httpx.RemoteProtocolError)
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of the recent request volume, shared by every thread using the
+    client. Within the sliding `window` (seconds) at most `min_retries + ratio * requests`
+    retries are allowed, so a client keeps retrying occasional failures but stops amplifying
+    load when most calls fail.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests = deque()
+        self._retries = deque()
+        self._lock = threading.Lock()
+
+    def _prune(self, now):
+        for events in (self._requests, self._retries):
+            while events and now - events[0] > self.window:
+                events.popleft()
+
+    def record_request(self):
+        """Records a request attempt against the budget."""
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            self._requests.append(now)
+
+    def try_spend(self) -> bool:
+        """
+        Spends one retry from the budget.
+
+        :return: True when the retry is allowed, False when the budget is exhausted.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+                return False
+            self._retries.append(now)
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides whether, and after how long, a failed request should be retried.
+
+    - `429 Too Many Requests` is retried for every method, since the server did not process it.
+    - `5xx` responses, timeouts and connection errors are retried for idempotent methods only.
+      DNS failures usually mean a wrong host or region and are not retried.
+    - `Retry-After` (seconds or HTTP date) is honored; if it asks for a longer wait than
+      `max_backoff`, the response is returned to the caller instead.
+    - No retry is started that would end more than `deadline` seconds after the first attempt.
+
+    Without the deadline a call could wait up to `max_retries * max_backoff` seconds (9 minutes
+    with the `Client` default of 18 retries). With it, the worst case is `deadline` seconds plus
+    the timeout of the last attempt: 62 seconds with the `Client` defaults (2 second timeout).
+    """
+
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+    def __init__(self, max_retries: int = 5, backoff_factor: float = 0.5, max_backoff: float = 30.0,
+                 budget: RetryBudget = None, deadline: float = 60.0):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def record_request(self):
+        """Records an outgoing attempt so the retry budget tracks request volume."""
+        if self.budget is not None:
+            self.budget.record_request()
+
+    def is_retryable(self, method: str, response=None, error: Exception = None) -> bool:
+        """
+        Checks whether the outcome of an attempt may be retried for the given HTTP method.
+
+        :param method: The HTTP method of the request
+        :param response: The response received, if any
+        :param error: The exception raised by the transport, if any
+        :return: True when the request is safe to retry.
+        """
+        idempotent = method.upper() in self.IDEMPOTENT_METHODS
+        if error is not None:
+            reason = getattr(error.args[0], 'reason', None) if error.args else None
+            if isinstance(reason, NameResolutionError):
+                return False
+            return idempotent and isinstance(error, TRANSIENT_ERRORS)
+        if response is None or response.status_code not in self.RETRY_STATUS_CODES:
+            return False
+        return response.status_code == 429 or idempotent
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Exponential backoff with full jitter for the given zero-based attempt number.
+
+        :param attempt: The number of retries already made
+        :return: the delay in seconds.
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+    @staticmethod
+    def retry_after(response):
+        """
+        Parses the `Retry-After` header of a response.
+
+        :param response: The response to inspect
+        :return: the delay in seconds, or None when the header is missing or invalid.
+        """
+        value = getattr(response, 'headers', {}).get('Retry-After') if response is not None else None
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    def next_delay(self, method: str, attempt: int, response=None, error: Exception = None,
+                   elapsed: float = 0.0):
+        """
+        Returns how long to wait before retrying, or None when the request must not be retried.
+
+        :param method: The HTTP method of the request
+        :param attempt: The number of retries already made
+        :param response: The response received, if any
+        :param error: The exception raised by the transport, if any
+        :param elapsed: The seconds spent on the call since its first attempt
+        :return: the delay in seconds, or None.
+        """
+        if attempt >= self.max_retries or not self.is_retryable(method, response, error):
+            return None
+        delay = self.retry_after(response)
+        if delay is None:
+            delay = self.backoff(attempt)
+        elif delay > self.max_backoff:
+            return None
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        if self.budget is not None and not self.budget.try_spend():
+            return None
+        return delay
@@ -0,0 +1,72 @@
+"""
+Request coalescing used by `_APIClient`.
+
+When many threads need the same resource at once (e.g. every worker loading the same content
+type schema on start-up), sending one `GET` per thread only adds load on the API. `SingleFlight`
+lets the first caller send the request while identical concurrent callers wait for it and share
+its response.
+"""
+import json
+import threading
+
+
+class _Call:
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time; concurrent callers with the same key share its result.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url, params=None, headers=None):
+        """
+        Builds the key of a `GET` request: its URL, query parameters and every header sent, so
+        only requests made with the same credentials and scope are coalesced.
+
+        :return: a hashable key.
+        """
+        return (url, json.dumps(params or {}, sort_keys=True, default=str),
+                tuple(sorted((str(name).lower(), str(value)) for name, value in (headers or {}).items())))
+
+    def do(self, key, fn):
+        """
+        Calls `fn` unless a call with the same key is already in flight, in which case its
+        result is awaited and returned instead.
+
+        :param key: The key identifying identical calls
+        :param fn: The function to call
+        :return: the result of `fn`, shared by every concurrent caller; its error is raised to all of them.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.response
+        try:
+            call.response = fn()
+            return call.response
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def __len__(self):
+        return len(self._calls)
@@ -0,0 +1,126 @@
+"""
+Streaming decoding of large list responses.
+
+List pages (`entries`, `assets`, `logs`, ...) are normally buffered by `requests` and parsed into
+one dict, so a page costs its raw body plus every decoded item at once. `ItemStream` reads a
+response fetched with `stream=True` chunk by chunk and decodes the items of one array member
+as they arrive, so peak memory scales with a single item instead of the whole response.
+"""
+import codecs
+import json
+import re
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+
+class ItemStream:
+    """
+    Iterates over the items of one array member of a streamed JSON object response, e.g. the
+    `entries` of `{"entries": [...], "count": 120}`. The other top-level members are decoded
+    into `members`, which is complete once the iteration has finished. The response is closed
+    when the iteration ends or the stream is closed.
+
+    [Example:]
+        >>> response = client.client.get('content_types/blog/entries', headers={'api_key': 'api_key'}, stream=True)
+        >>> for entry in contentstack_management.ItemStream(response, 'entries'):
+        >>>     print(entry['uid'])
+
+    :param response: A `requests.Response` fetched with `stream=True`
+    :param key: The top-level member holding the array to iterate over
+    :param chunk_size: The number of bytes read from the socket at a time
+    """
+
+    def __init__(self, response, key, chunk_size: int = 64 * 1024):
+        self.response = response
+        self.key = key
+        self.chunk_size = chunk_size
+        self.members = {}
+        self._chunks = None
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _read(self, size=0):
+        # Drop the decoded prefix, then read until at least `size` more characters are buffered
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        if self._chunks is None:
+            self._chunks = self.response.iter_content(self.chunk_size)
+        wanted = len(self._buffer) + max(size, 1)
+        while not self._eof and len(self._buffer) < wanted:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._eof = True
+                self._buffer += self._text.decode(b'', final=True)
+            else:
+                self._buffer += self._text.decode(chunk)
+
+    def _peek(self):
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                return ''
+            self._read()
+
+    def _expect(self, *chars):
+        char = self._peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {', '.join(repr(c) for c in chars)}", self._buffer,
+                                       self._pos)
+        self._pos += 1
+        return char
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                # Grow the buffer geometrically so large items are not re-parsed once per chunk
+                self._read(len(self._buffer) - self._pos)
+                continue
+            # A number ending the buffer, or cut before its fraction or exponent (`1.` | `5`,
+            # `1.5e` | `3`), may continue in the next chunk
+            number = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if self._eof or not number or end < len(self._buffer) and self._buffer[end] not in _NUMBER_CHARS:
+                self._pos = end
+                return value
+            self._read()
+
+    def _items(self):
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        while True:
+            name = self._value()
+            self._expect(':')
+            if name == self.key and self._peek() == '[':
+                self._pos += 1
+                if self._peek() == ']':
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._expect(',', ']') == ']':
+                            break
+            else:
+                self.members[name] = self._value()
+            if self._expect(',', '}') == '}':
+                return
+
+    def __iter__(self):
+        try:
+            yield from self._items()
+        finally:
+            self.close()
+
+    def close(self):
+        """Closes the response, releasing its connection."""
+        self.response.close()
@@ -0,0 +1,296 @@
+"""
+HTTP transports used by `_APIClient` to send requests.
+
+A transport exposes the part of the `requests.Session` interface the SDK relies on, so
+`_APIClient` and `OAuthInterceptor` send requests the same way whichever backend is plugged in:
+
+- `RequestsTransport`, the default, is a pooled `requests.Session`.
+- `Urllib3Transport` talks to a `urllib3.PoolManager` directly, skipping the per-call request
+  preparation, hooks and adapter lookup of `requests` on hot paths.
+- `StubTransport` serves canned responses in-process without opening sockets, so tests and
+  benchmarks can measure the SDK separately from the network.
+
+Every transport returns `requests.Response` objects and raises `requests` exceptions, so
+resources, retries and callers behave identically on all of them.
+"""
+import json as jsonlib
+import os
+import threading
+from collections import namedtuple
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlencode, urlsplit
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.filepost import encode_multipart_formdata
+
+
+class Transport:
+    """
+    Base class of the HTTP transports. Subclasses implement `request`; `clear` and `close`
+    release pooled connections and may be no-ops. A closed transport must accept new requests.
+    """
+
+    def request(self, method, url, headers=None, params=None, data=None, json=None, files=None, timeout=None,
+                stream=False):
+        """
+        Sends one HTTP request.
+
+        :param stream: Whether the response body is left on the socket to be read incrementally,
+        e.g. with `iter_content`, instead of being downloaded before returning
+        :return: the `requests.Response` of the request.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """Drops pooled connections, so the next requests open fresh ones."""
+
+    def close(self):
+        """Releases every pooled connection."""
+        self.clear()
+
+
+class RequestsTransport(requests.Session, Transport):
+    """
+    The default transport: a `requests.Session` with one pooled, keep-alive `HTTPAdapter` for
+    every host. Cookies are never stored because one transport is shared by every stack and
+    thread of a client.
+
+    :param pool_connections: The number of per-host connection pools to keep
+    :param pool_maxsize: The maximum number of keep-alive connections kept open per host
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10):
+        super().__init__()
+        self.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def clear(self):
+        # The same adapter is mounted for both schemes
+        for adapter in set(self.adapters.values()):
+            adapter.poolmanager.clear()
+
+    def close(self):
+        requests.Session.close(self)
+
+
+def _format_param(value):
+    # Match how requests renders query values, so every transport sends the same URLs
+    if isinstance(value, (str, bytes)):
+        return value
+    if hasattr(value, '__iter__'):
+        return [_format_param(item) for item in value]
+    return str(value)
+
+
+def _build_response(method, url, request_headers, status_code, reason, headers, content, raw=None):
+    """
+    Wraps a raw response in a `requests.Response`, the type every caller of the SDK expects.
+    A response whose body is still to be read is given as `raw` instead of `content`.
+    """
+
+    request = requests.PreparedRequest()
+    request.method = method
+    request.url = url
+    request.headers = CaseInsensitiveDict(request_headers)
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = reason
+    response.headers = CaseInsensitiveDict(headers)
+    if raw is None:
+        response._content = content
+        response._content_consumed = True
+    else:
+        response.raw = raw
+    response.url = url
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.request = request
+    return response
+
+
+class Urllib3Transport(Transport):
+    """
+    Lean transport sending requests straight through a `urllib3.PoolManager`.
+
+    Query strings, JSON, form and multipart bodies are encoded the way `requests` encodes them
+    and responses are returned as `requests.Response` objects, so it can replace the default
+    transport without changes elsewhere. Retries are left to the client's `RetryPolicy`.
+
+    :param pool_connections: The number of per-host connection pools to keep
+    :param pool_maxsize: The maximum number of keep-alive connections kept open per host
+    :param max_redirects: The maximum number of redirects followed for one request
+    """
+
+    DEFAULT_HEADERS = {'Accept': '*/*', 'Accept-Encoding': 'gzip, deflate'}
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, max_redirects: int = 30):
+        self.pool_manager = urllib3.PoolManager(num_pools=pool_connections, maxsize=pool_maxsize)
+        self.retries = urllib3.Retry(total=None, connect=0, read=0, status=0, other=0,
+                                     redirect=max_redirects, raise_on_redirect=False)
+
+    @staticmethod
+    def _encode_files(data, files):
+        fields = [(key, _format_param(value)) for key, value in (data or {}).items()]
+        for key, value in files.items():
+            filename, fileobj, content_type = None, value, None
+            if isinstance(value, (tuple, list)):
+                filename, fileobj = value[0], value[1]
+                content_type = value[2] if len(value) > 2 else None
+            if filename is None:
+                filename = os.path.basename(getattr(fileobj, 'name', None) or key)
+            content = fileobj.read() if hasattr(fileobj, 'read') else fileobj
+            fields.append((key, (filename, content, content_type) if content_type else (filename, content)))
+        return encode_multipart_formdata(fields)
+
+    def _encode_body(self, headers, data, json, files):
+        if files:
+            body, content_type = self._encode_files(data, files)
+            headers['Content-Type'] = content_type
+            return body
+        if json is not None:
+            headers.setdefault('Content-Type', 'application/json')
+            return jsonlib.dumps(json).encode('utf-8')
+        if isinstance(data, (dict, list)):
+            headers.setdefault('Content-Type', 'application/x-www-form-urlencoded')
+            items = data.items() if isinstance(data, dict) else data
+            return urlencode([(key, _format_param(value)) for key, value in items], doseq=True)
+        if isinstance(data, str):
+            return data.encode('utf-8')
+        return data
+
+    @staticmethod
+    def _timeout(timeout):
+        if isinstance(timeout, tuple):
+            return urllib3.Timeout(connect=timeout[0], read=timeout[1])
+        return urllib3.Timeout(connect=timeout, read=timeout)
+
+    def request(self, method, url, headers=None, params=None, data=None, json=None, files=None, timeout=None,
+                stream=False):
+        request_headers = CaseInsensitiveDict(self.DEFAULT_HEADERS)
+        request_headers.update(headers or {})
+        if params:
+            query = urlencode([(key, _format_param(value)) for key, value in params.items() if value is not None],
+                              doseq=True)
+            if query:
+                url = f"{url}{'&' if '?' in url else '?'}{query}"
+        body = self._encode_body(request_headers, data, json, files)
+        try:
+            raw = self.pool_manager.request(method, url, body=body, headers=dict(request_headers),
+                                            timeout=self._timeout(timeout), retries=self.retries,
+                                            preload_content=not stream)
+        except urllib3.exceptions.MaxRetryError as error:
+            # NewConnectionError (refused connections, DNS failures) subclasses ConnectTimeoutError,
+            # so it is told apart first, as `requests.adapters.HTTPAdapter.send` does
+            if isinstance(error.reason, urllib3.exceptions.ConnectTimeoutError) \
+                    and not isinstance(error.reason, urllib3.exceptions.NewConnectionError):
+                raise requests.ConnectTimeout(error) from error
+            if isinstance(error.reason, urllib3.exceptions.ReadTimeoutError):
+                raise requests.ReadTimeout(error) from error
+            if isinstance(error.reason, urllib3.exceptions.SSLError):
+                raise requests.exceptions.SSLError(error) from error
+            raise requests.ConnectionError(error) from error
+        except urllib3.exceptions.NewConnectionError as error:
+            raise requests.ConnectionError(error) from error
+        except urllib3.exceptions.ConnectTimeoutError as error:
+            raise requests.ConnectTimeout(error) from error
+        except urllib3.exceptions.ReadTimeoutError as error:
+            raise requests.ReadTimeout(error) from error
+        except urllib3.exceptions.TimeoutError as error:
+            raise requests.Timeout(error) from error
+        except urllib3.exceptions.SSLError as error:
+            raise requests.exceptions.SSLError(error) from error
+        except urllib3.exceptions.ProtocolError as error:
+            raise requests.ConnectionError(error) from error
+        except urllib3.exceptions.HTTPError as error:
+            raise requests.RequestException(error) from error
+        if stream:
+            return _build_response(method, url, request_headers, raw.status, raw.reason, raw.headers, None, raw)
+        return _build_response(method, url, request_headers, raw.status, raw.reason, raw.headers, raw.data)
+
+    def clear(self):
+        self.pool_manager.clear()
+
+
+StubRequest = namedtuple('StubRequest', ['method', 'url', 'headers', 'params', 'data', 'json', 'files'])
+
+
+class StubTransport(Transport):
+    """
+    In-process transport serving canned responses without touching the network.
+
+    Responses are registered per method and path with `add`; a request matches a route when its
+    URL path ends with the route path, and the longest matching route wins. Requests without a
+    matching route get a `404`. Every request is recorded in `calls`.
+
+    [Example:]
+        >>> transport = StubTransport()
+        >>> transport.add('GET', 'content_types', json={'content_types': []})
+        >>> client = contentstack_management.Client(authtoken='authtoken', transport=transport)
+        >>> client.stack('api_key').content_types().find().json()
+        {'content_types': []}
+    """
+
+    def __init__(self):
+        self.routes = []
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def add(self, method, path, status_code: int = 200, json=None, content: bytes = b'', headers: dict = None,
+            error: Exception = None):
+        """
+        Registers a canned response. Responses added for the same method and path are served in
+        the order they were added, the last one being repeated.
+
+        :param method: The HTTP method to match, or `*` for any method
+        :param path: The path the request URL must end with, e.g. `content_types/blog`
+        :param status_code: The status code of the response
+        :param json: A JSON-serializable body, sent with an `application/json` Content-Type
+        :param content: A raw body, used when `json` is not given
+        :param headers: The response headers
+        :param error: An exception raised instead of returning a response, e.g. `requests.ConnectionError()`
+        :return: the transport, so calls can be chained.
+        """
+
+        headers = dict(headers or {})
+        if json is not None:
+            content = jsonlib.dumps(json).encode('utf-8')
+            headers.setdefault('Content-Type', 'application/json')
+        reply = error if error is not None else (status_code, headers, content)
+        path = path.strip('/')
+        with self._lock:
+            for route in self.routes:
+                if route[0] == method.upper() and route[1] == path:
+                    route[2].append(reply)
+                    return self
+            self.routes.append((method.upper(), path, [reply]))
+        return self
+
+    def _match(self, method, url):
+        path = urlsplit(url).path.rstrip('/')
+        matches = [route for route in self.routes
+                   if route[0] in (method.upper(), '*') and (path == route[1] or path.endswith('/' + route[1]))]
+        return max(matches, key=lambda route: len(route[1]), default=None)
+
+    def request(self, method, url, headers=None, params=None, data=None, json=None, files=None, timeout=None,
+                stream=False):
+        if hasattr(data, 'read'):
+            # Consume streamed bodies as a real transport would, recording their content
+            data = data.read()
+        with self._lock:
+            self.calls.append(StubRequest(method, url, dict(headers or {}), params, data, json, files))
+            route = self._match(method, url)
+            if route is None:
+                reply = (404, {'Content-Type': 'application/json'},
+                         jsonlib.dumps({'error_message': f"No stub response for {method} {url}"}).encode('utf-8'))
+            else:
+                replies = route[2]
+                reply = replies.pop(0) if len(replies) > 1 else replies[0]
+        if isinstance(reply, Exception):
+            raise reply
+        status_code, response_headers, content = reply
+        return _build_response(method, url, headers or {}, status_code, None, response_headers, content)
@@ -2,15 +2,17 @@
 frontend code to pull content from the target branch associated with an alias."""
 
 import json
-from ..common import Parameter
+from ..common import Paginated, Parameter
 from .._messages import ALIAS_UID_REQUIRED
 _path = 'stacks/branch_aliases'
 
 
-class Alias(Parameter):
+class Alias(Parameter, Paginated):
     """An alias acts as a pointer to a particular branch. You can specify the alias ID in your
     frontend code to pull content from the target branch associated with an alias."""
 
+    _items_key = 'branch_aliases'
+
     def __init__(self, client, alias_uid=None):
         self.client = client
         self.alias_uid = alias_uid
@@ -0,0 +1,106 @@
+"""
+Streaming asset downloads used by `Assets.download_to` and `Assets.download_many`.
+
+The asset is read from the socket in chunks and written to `<path>.part`, so memory stays
+constant whatever its size. When the connection drops, the download resumes where it stopped
+with an HTTP `Range` request (guarded by `If-Range`, so a file changed in the meantime is
+downloaded again from the start). The `ETag` (or `Last-Modified`) of the download is kept in
+`<path>.part.etag`, so a `.part` file left by an earlier run is resumed the same way; a `.part`
+file without one is downloaded again from the start. Once the size is verified the file is
+renamed to its final path; a download that still has the wrong size once its resumes are used
+up raises and keeps its `.part` file for the next call to resume.
+"""
+import os
+import re
+
+import requests
+
+from .._messages import ASSET_DOWNLOAD_SIZE_MISMATCH
+
+_CONTENT_RANGE = re.compile(r'bytes\s+(?:(\d+)-\d+|\*)/(\d+)')
+
+
+def _total_size(response):
+    """Returns the full size of the asset announced by a response, None when unknown."""
+    match = _CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+    if match:
+        return int(match.group(2))
+    length = response.headers.get('Content-Length')
+    return int(length) if length and response.status_code == 200 else None
+
+
+def _discard(*paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def download_file(assets, path, chunk_size: int = 1024 * 1024, size: int = None, max_resumes: int = 5) -> int:
+    """
+    Downloads the asset of an `Assets` handle to `path`.
+
+    :return: the number of bytes received by this call.
+    """
+    url = f"assets/{assets.api_key}/{assets.asset_uid}"
+    part = f"{path}.part"
+    etag = f"{part}.etag"
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    received, resumes, validator, total = 0, 0, None, size
+    if os.path.exists(etag):
+        with open(etag, encoding='utf-8') as file:
+            validator = file.read().strip() or None
+    if validator is None:
+        # Without a validator the part cannot be told from a newer version of the asset
+        _discard(part, etag)
+    while True:
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+        # Ask for the raw bytes: sizes and ranges refer to the stored file, not an encoding of it
+        headers = {**assets.client.headers, 'Accept-Encoding': 'identity'}
+        if offset:
+            headers['Range'] = f"bytes={offset}-"
+            if validator:
+                headers['If-Range'] = validator
+        try:
+            response = assets.client.get(url, headers=headers, params=assets.params, stream=True)
+            try:
+                if response.status_code == 416 and offset:
+                    # The range starts at the end of the file: the part is already complete
+                    total = _total_size(response) or total
+                    if total is None or total != offset:
+                        _discard(part, etag)
+                        validator = None
+                        continue
+                else:
+                    response.raise_for_status()
+                    validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+                    if validator:
+                        with open(etag, 'w', encoding='utf-8') as file:
+                            file.write(validator)
+                    else:
+                        _discard(etag)
+                    total = size or _total_size(response) or total
+                    mode = 'ab' if response.status_code == 206 else 'wb'
+                    with open(part, mode) as file:
+                        for chunk in response.iter_content(chunk_size):
+                            file.write(chunk)
+                            received += len(chunk)
+            finally:
+                response.close()
+        except requests.HTTPError:
+            raise
+        except requests.RequestException:
+            resumes += 1
+            if resumes > max_resumes:
+                raise
+            continue
+        written = os.path.getsize(part)
+        if total is not None and written < total and resumes < max_resumes:
+            # The connection was closed before the end of the file
+            resumes += 1
+            continue
+        if total is not None and written != total:
+            raise Exception(ASSET_DOWNLOAD_SIZE_MISMATCH.format(assets.asset_uid, written, total))
+        os.replace(part, path)
+        _discard(etag)
+        return received
@@ -0,0 +1,48 @@
+"""
+Concurrent breadth-first walk of the asset folder tree, used by `Assets.folder_tree`.
+
+The API returns the subfolders of one folder at a time, so a deep tree is a long chain of
+requests when crawled level by level. Here every folder is expanded as soon as its parent has
+been read, from a bounded pool of workers, so all the folders known at a given time are
+requested concurrently and the walk proceeds breadth-first.
+"""
+import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .folder_tree import FolderTree
+
+
+def _subfolders(assets, folder_uid, limit):
+    """Returns every subfolder of a folder (or of the root when None), following the pages."""
+    handle = type(assets)(assets.client, None, None)
+    handle.add_param('include_folders', True)
+    # The query is sent as JSON, so the server filters the folders instead of listing every asset
+    handle.add_param('query', json.dumps({'is_dir': True}))
+    if folder_uid is not None:
+        handle.add_param('folder', folder_uid)
+    return [item for item in handle.iter_all(limit=limit) if item.get('is_dir')]
+
+
+def walk_folders(assets, folder_uid: str = None, workers: int = 4, limit: int = 100, max_depth: int = None):
+    """
+    Walks the folders below `folder_uid` and returns their `FolderTree`.
+    """
+    tree = FolderTree(root=folder_uid)
+    expanded = {folder_uid}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_subfolders, assets, folder_uid, limit): 1}
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    depth = pending.pop(future)
+                    for folder in future.result():
+                        # Folders are filed under their actual parent, whichever listing returned them
+                        tree._add(folder)
+                        if folder['uid'] not in expanded and (max_depth is None or depth < max_depth):
+                            expanded.add(folder['uid'])
+                            pending[pool.submit(_subfolders, assets, folder['uid'], limit)] = depth + 1
+        finally:
+            for future in pending:
+                future.cancel()
+    return tree
@@ -0,0 +1,179 @@
+"""
+Incremental local mirror of a stack's asset library, used by `Assets.mirror`.
+
+The mirror is a directory tree matching the asset folders of the stack, with a manifest
+(`.mirror.json`) recording the uid, version, `updated_at`, size, checksum and local path of every
+asset downloaded. Each run lists the assets and folders, then only downloads the assets whose
+version or `updated_at` changed since the last run. Assets moved to another folder or renamed
+are moved locally without being downloaded again, and assets deleted from the stack are removed.
+"""
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from ._download import download_file
+from ._sync import file_digest
+from .upload_result import error_details
+
+MANIFEST = '.mirror.json'
+
+
+def _safe_name(name):
+    # Folder names and filenames become single path segments
+    name = str(name or '').replace('/', '_').replace('\\', '_').strip()
+    return name if name not in ('', '.', '..') else '_'
+
+
+class AssetMirror:
+    """
+    Mirrors the assets of a stack to a local directory. See `Assets.mirror`.
+
+    :param assets: The `Assets` handle of the stack
+    :param directory: The directory of the mirror; it is created when missing
+    :param workers: The number of assets downloaded at the same time
+    :param limit: The number of assets requested per page
+    :param delete: Whether files of assets deleted from the stack are removed
+    :param verify: Whether the checksum of unchanged files is verified, downloading again those
+    modified locally
+    """
+
+    def __init__(self, assets, directory, workers: int = 4, limit: int = 100, delete: bool = True,
+                 verify: bool = False):
+        self.assets = assets
+        self.directory = directory
+        self.workers = workers
+        self.limit = limit
+        self.delete = delete
+        self.verify = verify
+
+    def _load(self):
+        path = os.path.join(self.directory, MANIFEST)
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding='utf-8') as file:
+            return json.load(file).get('assets', {})
+
+    def _save(self, manifest):
+        path = os.path.join(self.directory, MANIFEST)
+        with open(path + '.tmp', 'w', encoding='utf-8') as file:
+            json.dump({'assets': dict(sorted(manifest.items()))}, file, indent=2)
+        os.replace(path + '.tmp', path)
+
+    def _listing(self):
+        """Returns the folders (uid -> (name, parent_uid)) and the assets of the stack."""
+        handle = type(self.assets)(self.assets.client, None, None)
+        handle.add_param('include_folders', True)
+        folders, assets = {}, []
+        for item in handle.iter_all(limit=self.limit):
+            if item.get('is_dir'):
+                folders[item['uid']] = (item.get('name'), item.get('parent_uid'))
+            else:
+                assets.append(item)
+        return folders, assets
+
+    @staticmethod
+    def _folder_paths(folders):
+        paths = {}
+
+        def path(uid, seen=()):
+            if uid is None or uid not in folders or uid in seen:
+                return ()
+            if uid not in paths:
+                name, parent = folders[uid]
+                paths[uid] = path(parent, seen + (uid,)) + (_safe_name(name),)
+            return paths[uid]
+
+        for uid in folders:
+            path(uid)
+        return paths
+
+    def _local_paths(self, folders, assets):
+        folder_paths = self._folder_paths(folders)
+        paths, taken = {}, set()
+        for asset in sorted(assets, key=lambda item: item['uid']):
+            segments = folder_paths.get(asset.get('parent_uid'), ())
+            filename = _safe_name(asset.get('filename') or asset['uid'])
+            relative = '/'.join(segments + (filename,))
+            if relative.lower() in taken:
+                # Two assets of a folder may share a filename
+                relative = '/'.join(segments + (f"{asset['uid']}-{filename}",))
+            taken.add(relative.lower())
+            paths[asset['uid']] = relative
+        return paths
+
+    def _absolute(self, relative):
+        return os.path.join(self.directory, *relative.split('/'))
+
+    def _unchanged(self, entry, asset):
+        if entry is None or entry.get('version') != asset.get('_version') \
+                or entry.get('updated_at') != asset.get('updated_at'):
+            return False
+        path = self._absolute(entry['path'])
+        if not os.path.exists(path) or os.path.getsize(path) != entry.get('size'):
+            return False
+        return not self.verify or file_digest(path)[1] == entry.get('checksum')
+
+    def run(self) -> dict:
+        """
+        Runs the sync and writes the manifest.
+
+        :return: a summary with the number of assets `downloaded`, `moved`, `unchanged` and
+        `deleted`, and the `failures`: one dict per asset with its `uid`, `path`, `status_code`
+        and `error`.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = self._load()
+        folders, assets = self._listing()
+        paths = self._local_paths(folders, assets)
+        summary = {'downloaded': 0, 'moved': 0, 'unchanged': 0, 'deleted': 0, 'failures': []}
+        pending = []
+        for asset in assets:
+            uid, relative = asset['uid'], paths[asset['uid']]
+            entry = manifest.get(uid)
+            if not self._unchanged(entry, asset):
+                pending.append((asset, relative))
+                continue
+            if entry['path'] != relative:
+                target = self._absolute(relative)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.replace(self._absolute(entry['path']), target)
+                manifest[uid] = {**entry, 'path': relative}
+                summary['moved'] += 1
+            else:
+                summary['unchanged'] += 1
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for uid, entry, error in pool.map(lambda item: self._download(*item), pending):
+                    if error is None:
+                        previous = manifest.get(uid)
+                        if previous and previous['path'] != entry['path'] \
+                                and os.path.exists(self._absolute(previous['path'])):
+                            os.remove(self._absolute(previous['path']))
+                        manifest[uid] = entry
+                        summary['downloaded'] += 1
+                    else:
+                        status_code, message = error_details(error)
+                        summary['failures'].append({'uid': uid, 'path': paths[uid], 'status_code': status_code,
+                                                    'error': message})
+            if self.delete:
+                for uid in set(manifest) - set(paths):
+                    path = self._absolute(manifest.pop(uid)['path'])
+                    if os.path.exists(path):
+                        os.remove(path)
+                    summary['deleted'] += 1
+        finally:
+            # Keep the assets downloaded so far even when the run is interrupted
+            self._save(manifest)
+        return summary
+
+    def _download(self, asset, relative):
+        uid = asset['uid']
+        try:
+            path = self._absolute(relative)
+            handle = type(self.assets)(self.assets.client, uid, None)
+            download_file(handle, path, size=asset.get('file_size') and int(asset['file_size']))
+            size, checksum = file_digest(path)
+        except Exception as error:
+            return uid, None, error
+        return uid, {'path': relative, 'version': asset.get('_version'), 'updated_at': asset.get('updated_at'),
+                     'size': size, 'checksum': checksum}, None
@@ -0,0 +1,125 @@
+"""
+Content-hash deduplicated asset sync used by `Assets.sync`.
+
+A persistent index (a checkpoint `Journal`) maps each local file to the asset it was uploaded to,
+with the size and SHA-256 of the content uploaded. Each run hashes the files locally, in parallel,
+and compares them with the index: unchanged files are skipped without a request, changed files
+replace the content of their asset and new files are uploaded. Repeated full-folder syncs thus
+only send what changed.
+"""
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+from .upload_result import UploadResult
+from .._journal import open_journal
+from .._multipart import send_multipart
+
+
+def file_digest(path, chunk_size: int = 1024 * 1024):
+    """
+    Returns the size and SHA-256 hex digest of a file, read in chunks.
+    """
+    sha256 = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            sha256.update(chunk)
+            size += len(chunk)
+    return size, sha256.hexdigest()
+
+
+class AssetSync:
+    """
+    Syncs local files to the assets of a stack. See `Assets.sync`.
+
+    :param assets: The `Assets` handle of the stack
+    :param files: The paths of the files to sync, or a directory synced recursively
+    :param index: The `Journal` keeping the index, or the path of its file
+    :param folder_uid: The uid of the folder new assets are uploaded to
+    :param root: The directory index keys are relative to; defaults to `files` when it is a
+    directory, and keys are absolute paths otherwise
+    :param workers: The number of files hashed and uploaded at the same time
+    :param progress: Optional callable called with the index of a file, its filename, the bytes
+    sent so far and the size of its request body
+    """
+
+    def __init__(self, assets, files, index, folder_uid: str = None, root: str = None, workers: int = 4,
+                 progress=None):
+        if isinstance(files, (str, os.PathLike)) and os.path.isdir(files):
+            root = files if root is None else root
+            files = sorted(os.path.join(directory, name) for directory, _, names in os.walk(files) for name in names)
+        self.assets = assets
+        self.files = list(files)
+        self.index = index
+        self.folder_uid = folder_uid
+        self.root = root
+        self.workers = workers
+        self.progress = progress
+
+    def key(self, path) -> str:
+        """Returns the index key of a file: its path relative to `root`, with forward slashes."""
+        path = os.path.relpath(path, self.root) if self.root is not None else os.path.abspath(path)
+        return 'assets/' + path.replace(os.sep, '/')
+
+    def run(self) -> UploadResult:
+        """
+        Runs the sync.
+
+        :return: an `UploadResult` telling, for each file, whether it was `uploaded`, `replaced`
+        or `skipped`.
+        """
+        result = UploadResult(len(self.files))
+        journal, owned = open_journal(self.index)
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                list(pool.map(lambda indexed: self._sync(journal, result, *indexed), enumerate(self.files)))
+        finally:
+            if owned:
+                journal.close()
+        result._finish()
+        return result
+
+    def _send(self, send, url, index, filename, fields):
+        sizes = [0]
+
+        def report(sent, total):
+            sizes[0] = total
+            if self.progress is not None:
+                self.progress(index, filename, sent, total)
+
+        response = send_multipart(send, url, fields, headers=self.assets.client.headers, params=self.assets.params,
+                                  progress=report)
+        return response, sizes[0]
+
+    def _sync(self, journal, result, index, path):
+        filename = os.path.basename(path)
+        try:
+            size, sha256 = file_digest(path)
+            key = self.key(path)
+            content = {'filename': filename, 'size': size, 'sha256': sha256}
+            if journal.done(key, content):
+                result._succeed(index, journal.get(key), 0, 'skipped')
+                return
+            previous = journal.get(key)
+            response = None
+            if previous is not None:
+                # Replacing keeps the uid, folder and metadata of the asset
+                fields = {'asset': self.assets._file_field(path, filename, None)}
+                response, sent = self._send(self.assets.client.put, f"assets/{previous['uid']}", index, filename,
+                                            fields)
+                action = 'replaced'
+                if response.status_code == 404:
+                    # The asset was deleted from the stack since the last sync
+                    response = None
+            if response is None:
+                fields = self.assets._upload_fields(path, filename, None, self.folder_uid)
+                response, sent = self._send(self.assets.client.post, "assets", index, filename, fields)
+                action = 'uploaded'
+            response.raise_for_status()
+            asset = response.json().get('asset') or {}
+            journal.record(key, {'uid': asset.get('uid') or previous['uid']}, content)
+            result._succeed(index, asset, sent, action)
+        except Exception as error:
+            result._fail(index, filename, error)
@@ -5,12 +5,19 @@ The create(), read(), update(), and delete() methods each correspond to
 the CRUD operations that can be performed on the API
 """
 import json
-from ..common import Parameter
+from concurrent.futures import ThreadPoolExecutor
+from ..common import Paginated, Parameter
 import mimetypes
-import os
-from .._messages import ASSET_UID_REQUIRED, ASSET_TYPE_REQUIRED, ASSET_VERSION_NUMBER_REQUIRED
-
-class Assets(Parameter):
+from .upload_result import UploadResult
+from ._sync import AssetSync
+from ._download import download_file
+from ._mirror import AssetMirror
+from ._folders import walk_folders
+from .download_result import DownloadResult
+from .._multipart import send_multipart, source_name
+from .._messages import ASSET_UID_REQUIRED, ASSET_TYPE_REQUIRED, ASSET_VERSION_NUMBER_REQUIRED, ASSET_FILENAME_REQUIRED
+
+class Assets(Parameter, Paginated):
     """
     This class takes a base URL as an argument when it's initialized, 
     which is the endpoint for the RESTFUL API that
@@ -18,14 +25,16 @@ class Assets(Parameter):
     methods each correspond to the CRUD 
     operations that can be performed on the API """
 
+    _items_key = 'assets'
+
     def __init__(self, client, asset_uid, branch):
         self.client = client
         self.asset_uid = asset_uid
         self.branch = branch
+        super().__init__(self.client)
         if self.branch:
             self.add_header('branch', branch)
-        self.api_key = self.client.headers['api_key']
-        super().__init__(self.client)
+        self.api_key = self.client.headers.get('api_key')
 
     def find(self):
         """
@@ -128,12 +137,32 @@ class Assets(Parameter):
         Parameter.add_param(self, "folder", folder_uid)
         return self.client.get(url, headers = self.client.headers, params = self.params)
 
-    def upload(self, file_path):
+    @staticmethod
+    def _file_field(file_path, filename, content_type):
+        filename = filename or source_name(file_path)
+        if filename is None:
+            raise Exception(ASSET_FILENAME_REQUIRED)
+        if content_type is None:
+            content_type, _ = mimetypes.guess_type(filename)
+        return filename, file_path, content_type
+
+    def _upload_fields(self, file_path, filename, content_type, folder_uid):
+        fields = {'asset[upload]': self._file_field(file_path, filename, content_type)}
+        if folder_uid is not None:
+            fields['asset[parent_uid]'] = folder_uid
+        return fields
+
+    def upload(self, file_path, filename: str = None, content_type: str = None, folder_uid: str = None):
         """
         The Upload asset request uploads an asset file to your stack.
 
         :param file_path: The `file_path` parameter is the path to the file that you want to upload. It
-        should be a string representing the file's location on your local machine
+        should be a string representing the file's location on your local machine, or the content itself:
+        `bytes`, a `memoryview` or a readable binary file-like object, uploaded from its current position
+        without a temporary file
+        :param filename: The file name of the asset, required for content without a file name
+        :param content_type: The MIME type of the asset, guessed from the file name by default
+        :param folder_uid: The uid of the folder the asset is uploaded to
         :return: the result of a POST request to the "assets" endpoint with the specified parameters and
         file.
         --------------------------------
@@ -143,24 +172,105 @@ class Assets(Parameter):
             >>> file_path = ""
             >>> asset = client().stack(api_key='api_key').assets()
             >>> response = asset.upload(file_path)
+            >>> response = asset.upload(png_bytes, filename='thumbnail.png', content_type='image/png')
         --------------------------------
         """
 
         url = "assets"
-        filename = os.path.basename(file_path)
-        content_type, _ = mimetypes.guess_type(file_path)
-        files = {
-            'asset[upload]': (filename, open(file_path, 'rb'), content_type)
-        }
-        self.client.headers.pop('Content-Type', None)
-        return self.client.post(url, headers = self.client.headers, params = self.params, files = files)
+        # The file is streamed in chunks and, when opened from a path, closed once the request is done
+        fields = self._upload_fields(file_path, filename, content_type, folder_uid)
+        return send_multipart(self.client.post, url, fields, headers = self.client.headers, params = self.params)
+
+    def upload_many(self, files, folder_uid: str = None, workers: int = 4, progress=None):
+        """
+        Uploads many files at the same time from a bounded pool of workers sharing the client's
+        connection pool (keep `workers` at or below its `pool_maxsize`). Files are streamed as with
+        `upload`; a file that fails is reported in the result and does not stop the others.
+
+        :param files: The files to upload: paths, or `(content, filename)` / `(content, filename,
+        content_type)` tuples where content is anything `upload` accepts
+        :param folder_uid: The uid of the folder the assets are uploaded to
+        :param workers: The number of files uploaded at the same time
+        :param progress: Optional callable called from the workers with the index of a file in
+        `files`, its filename, the bytes sent so far and the size of its request body
+        :return: an `UploadResult` with the uploaded assets, the failures and the throughput.
+        --------------------------------
+        [Example:]
+            >>> import contentstack_management
+            >>> client = contentstack_management.Client(authtoken='your_authtoken', pool_maxsize=16)
+            >>> assets = client.stack(api_key='api_key').assets()
+            >>> result = assets.upload_many(glob.glob('images/*.jpg'), folder_uid='folder_uid', workers=16)
+            >>> print(result.uploaded, result.bytes_per_second, result.failures)
+        --------------------------------
+        """
+
+        files = list(files)
+        result = UploadResult(len(files))
+
+        def upload(indexed):
+            index, item = indexed
+            source, filename, content_type = (item + (None, None))[:3] if isinstance(item, tuple) else (item, None, None)
+            sizes = [0]
+
+            def report(sent, total):
+                sizes[0] = total
+                if progress is not None:
+                    progress(index, filename, sent, total)
+
+            try:
+                fields = self._upload_fields(source, filename, content_type, folder_uid)
+                filename = fields['asset[upload]'][0]
+                response = send_multipart(self.client.post, "assets", fields, headers = self.client.headers,
+                                          params = self.params, progress = report)
+                response.raise_for_status()
+                result._succeed(index, response.json().get('asset'), sizes[0])
+            except Exception as error:
+                result._fail(index, filename, error)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(upload, enumerate(files)))
+        result._finish()
+        return result
+
+    def sync(self, files, index, folder_uid: str = None, root: str = None, workers: int = 4, progress=None):
+        """
+        Syncs local files to the stack incrementally. Files are hashed locally (SHA-256) and
+        compared with a persistent index of the assets uploaded by previous syncs: unchanged files
+        are skipped without a request, changed files replace the content of their asset and new
+        files are uploaded.
+
+        :param files: The paths of the files to sync, or a directory synced recursively
+        :param index: The index: a `Journal` / `SqliteJournal`, or the path of its file
+        :param folder_uid: The uid of the folder new assets are uploaded to
+        :param root: The directory the files are identified relative to in the index; defaults to
+        `files` when it is a directory, otherwise files are identified by their absolute path
+        :param workers: The number of files hashed and uploaded at the same time
+        :param progress: Optional callable called with the index of a file in `files`, its
+        filename, the bytes sent so far and the size of its request body
+        :return: an `UploadResult`; its `actions` tell which files were `uploaded`, `replaced`
+        or `skipped`.
+        --------------------------------
+        [Example:]
+            >>> import contentstack_management
+            >>> client = contentstack_management.Client(authtoken='your_authtoken')
+            >>> assets = client.stack(api_key='api_key').assets()
+            >>> result = assets.sync('dam/export', index='dam.index', folder_uid='folder_uid', workers=8)
+            >>> print(result.uploaded, result.replaced, result.skipped)
+        --------------------------------
+        """
+
+        return AssetSync(self, files, index, folder_uid=folder_uid, root=root, workers=workers,
+                         progress=progress).run()
     
-    def replace(self, file_path):
+    def replace(self, file_path, filename: str = None, content_type: str = None):
         """
         The Replace asset call will replace an existing asset with another file on the stack.
         
         :param file_path: The `file_path` parameter is the path to the file that you want to replace the
-        existing asset with. It should be a string representing the file path on your local machine
+        existing asset with. It should be a string representing the file path on your local machine, or
+        the content itself: `bytes`, a `memoryview` or a readable binary file-like object
+        :param filename: The file name of the asset, required for content without a file name
+        :param content_type: The MIME type of the asset, guessed from the file name by default
         :return: The code is returning the result of a PUT request made to the specified URL with the
         provided headers, parameters, and files.
         --------------------------------
@@ -170,13 +280,14 @@ class Assets(Parameter):
             >>> file_path = ""
             >>> asset = client().stack(api_key='api_key').assets(asset_uid='asset_uid')
             >>> response = asset.replace(file_path)
+            >>> with open('banner.webp', 'rb') as file:
+            >>>     response = asset.replace(file)
         --------------------------------
         """
 
         url = f"assets/{self.asset_uid}"
-        Parameter.add_header(self, "Content-Type", "multipart/form-data")
-        files = {"asset": open(f"{file_path}",'rb')}
-        return self.client.put(url, headers = self.client.headers, params = self.params, files = files)
+        fields = {"asset": self._file_field(file_path, filename, content_type)}
+        return send_multipart(self.client.put, url, fields, headers = self.client.headers, params = self.params)
     
     def generate(self, data):
         """
@@ -224,6 +335,98 @@ class Assets(Parameter):
         url = f"assets/{self.api_key}/{self.asset_uid}"
         return self.client.get(url, headers = self.client.headers, params = self.params)
 
+    def download_to(self, path, chunk_size: int = 1024 * 1024, size: int = None, max_resumes: int = 5):
+        """
+        Downloads the asset to a file, streaming it in chunks so memory stays constant. The file is
+        written to `<path>.part` and renamed once complete; an interrupted download resumes where
+        it stopped with an HTTP Range request, within this call or when called again, unless the
+        asset changed in the meantime (its ETag is kept in `<path>.part.etag`). The size of
+        the file is checked against the size announced by the server, or `size` when given; a
+        file with the wrong size raises and its `.part` is kept for the next call to resume.
+
+        :param path: The path of the file to write
+        :param chunk_size: The number of bytes read from the socket at a time
+        :param size: The expected size of the asset in bytes, e.g. the `file_size` of its details
+        :param max_resumes: The number of times an interrupted download is resumed before failing
+        :return: the path of the file.
+        --------------------------------
+        [Example:]
+            >>> import contentstack_management
+            >>> client = contentstack_management.Client(authtoken='your_authtoken')
+            >>> asset = client().stack(api_key='api_key').assets(asset_uid='asset_uid')
+            >>> asset.download_to('backup/video.mp4')
+        --------------------------------
+        """
+
+        if self.asset_uid is None or '':
+            raise Exception(ASSET_UID_REQUIRED)
+        download_file(self, path, chunk_size=chunk_size, size=size, max_resumes=max_resumes)
+        return path
+
+    def download_many(self, targets, workers: int = 4, chunk_size: int = 1024 * 1024, max_resumes: int = 5):
+        """
+        Downloads many assets to files at the same time, each one as with `download_to`. An asset
+        that fails is reported in the result and does not stop the others.
+
+        :param targets: The files to write, as a dict of paths keyed by asset uid or an iterable of
+        `(asset_uid, path)` or `(asset_uid, path, size)` tuples
+        :param workers: The number of assets downloaded at the same time
+        :param chunk_size: The number of bytes read from the socket at a time
+        :param max_resumes: The number of times an interrupted download is resumed before failing
+        :return: a `DownloadResult` with the paths written, the failures and the throughput.
+        --------------------------------
+        [Example:]
+            >>> import contentstack_management
+            >>> client = contentstack_management.Client(authtoken='your_authtoken')
+            >>> assets = client().stack(api_key='api_key').assets()
+            >>> targets = {asset['uid']: f"backup/{asset['uid']}/{asset['filename']}" for asset in assets.iter_all()}
+            >>> result = assets.download_many(targets, workers=8)
+        --------------------------------
+        """
+
+        targets = list(targets.items() if isinstance(targets, dict) else targets)
+        result = DownloadResult()
+
+        def download(target):
+            uid, path, size = (tuple(target) + (None,))[:3]
+            try:
+                received = download_file(Assets(self.client, uid, self.branch), path, chunk_size=chunk_size,
+                                         size=size, max_resumes=max_resumes)
+                result._succeed(uid, path, received)
+            except Exception as error:
+                result._fail(uid, path, error)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(download, targets))
+        result._finish()
+        return result
+
+    def mirror(self, directory, workers: int = 4, limit: int = 100, delete: bool = True, verify: bool = False):
+        """
+        Keeps a local copy of the stack's assets in a directory tree matching the asset folders.
+        A manifest (`.mirror.json`) records the uid, version, `updated_at`, size and checksum of
+        each file, so every run only downloads the assets that changed since the last one;
+        assets moved between folders are moved locally and deleted assets are removed.
+
+        :param directory: The directory of the mirror
+        :param workers: The number of assets downloaded at the same time
+        :param limit: The number of assets requested per page
+        :param delete: Whether files of assets deleted from the stack are removed
+        :param verify: Whether the checksum of unchanged files is verified, downloading again the
+        files modified locally
+        :return: a summary with the number of assets `downloaded`, `moved`, `unchanged` and
+        `deleted`, and the `failures`.
+        --------------------------------
+        [Example:]
+            >>> import contentstack_management
+            >>> client = contentstack_management.Client(authtoken='your_authtoken')
+            >>> summary = client.stack(api_key='api_key').assets().mirror('media-mirror', workers=8)
+            >>> print(summary['downloaded'], summary['unchanged'])
+        --------------------------------
+        """
+
+        return AssetMirror(self, directory, workers=workers, limit=limit, delete=delete, verify=verify).run()
+
     def rte(self):
         """
         The Get information on RTE assets call returns comprehensive information on all assets uploaded through the Rich Text Editor field.
@@ -407,8 +610,7 @@ class Assets(Parameter):
         if self.asset_uid is None or '':
             raise Exception(ASSET_UID_REQUIRED)
         url = f"assets/{self.asset_uid}"
-        Parameter.add_header(self, "Content-Type", "multipart/form-data")
-        return self.client.put(url, headers = self.client.headers, params = self.params, data = data)
+        return self.client.put(url, headers = {**self.client.headers, "Content-Type": "multipart/form-data"}, params = self.params, data = data)
 
     def publish(self, data):
         """
@@ -548,6 +750,29 @@ class Assets(Parameter):
         Parameter.add_param(self, "folder", folder_uid)
         return self.client.get(url, params = self.params, headers = self.client.headers)
 
+    def folder_tree(self, folder_uid: str = None, workers: int = 4, limit: int = 100, max_depth: int = None):
+        """
+        Walks the asset folder tree breadth-first and returns an in-memory index of it. Every
+        folder is expanded as soon as its parent has been read, with at most `workers` requests
+        in flight, instead of one `get_subfolders` call after another.
+
+        :param folder_uid: The folder to walk from, the root of the stack by default
+        :param workers: The number of folders expanded at the same time
+        :param limit: The number of folders requested per page
+        :param max_depth: The number of levels walked, all by default
+        :return: a `FolderTree` mapping each folder uid to its path and children.
+        --------------------------------
+        [Example:]
+            >>> import contentstack_management
+            >>> client = contentstack_management.Client(authtoken='your_authtoken')
+            >>> tree = client().stack(api_key='api_key').assets().folder_tree(workers=8)
+            >>> photos = tree.find('media/photos')
+            >>> subfolders = [tree.path(uid) for uid in tree.children(photos)]
+        --------------------------------
+        """
+
+        return walk_folders(self, folder_uid, workers=workers, limit=limit, max_depth=max_depth)
+
     def create_folder(self, data):
         """
         The Create a folder call is used to create an asset folder and/or add a parent folder to it (if required).
@@ -0,0 +1,52 @@
+"""Outcome and throughput of `Assets.download_many`."""
+import threading
+import time
+
+from .upload_result import error_details
+
+
+class DownloadResult:
+    """
+    Collects the outcome of an `Assets.download_many` call.
+
+    :ivar paths: The path each downloaded asset was written to, keyed by asset uid
+    :ivar failures: One dict per asset that failed, with its `uid`, its `path`, the `status_code`
+    of the failed request (None when no response was received) and the `error`
+    :ivar bytes_received: The number of bytes written, resumed parts excluded
+    :ivar elapsed: The duration of the download in seconds
+    """
+
+    def __init__(self):
+        self.paths = {}
+        self.failures = []
+        self.bytes_received = 0
+        self.elapsed = 0.0
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def ok(self) -> bool:
+        """Whether every asset was downloaded."""
+        return not self.failures
+
+    @property
+    def bytes_per_second(self) -> float:
+        """The download throughput."""
+        return self.bytes_received / self.elapsed if self.elapsed else 0.0
+
+    def _succeed(self, uid, path, received):
+        with self._lock:
+            self.paths[uid] = path
+            self.bytes_received += received
+
+    def _fail(self, uid, path, error):
+        status_code, message = error_details(error)
+        with self._lock:
+            self.failures.append({'uid': uid, 'path': path, 'status_code': status_code, 'error': message})
+
+    def _finish(self):
+        self.elapsed = time.monotonic() - self._started
+
+    def __repr__(self):
+        return (f"DownloadResult(downloaded={len(self.paths)}, failed={len(self.failures)}, "
+                f"bytes_per_second={self.bytes_per_second:.0f})")
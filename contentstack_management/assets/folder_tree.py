@@ -0,0 +1,96 @@
+"""In-memory index of the asset folder tree of a stack, built by `Assets.folder_tree`."""
+
+
+class FolderTree:
+    """
+    Index of asset folders: every folder by uid, its parent, its children and its path. It is
+    queried without further API calls and can be cached with `to_dict` / `from_dict`.
+
+    [Example:]
+        >>> tree = client.stack('api_key').assets().folder_tree(workers=8)
+        >>> tree.path('folder_uid')
+        'media/photos/2026'
+        >>> [tree.path(uid) for uid in tree.children(tree.find('media'))]
+        ['media/photos', 'media/videos']
+
+    :param folders: The folder objects returned by the API, with their `uid`, `name` and
+    `parent_uid`
+    :param root: The uid of the folder the tree was walked from, None for the root of the stack
+    """
+
+    def __init__(self, folders=(), root: str = None):
+        self.root = root
+        self.folders = {}
+        self._children = {}
+        self._paths = {}
+        for folder in folders:
+            self._add(folder)
+
+    def _add(self, folder):
+        uid = folder['uid']
+        if uid in self.folders:
+            return
+        self.folders[uid] = folder
+        self._children.setdefault(folder.get('parent_uid'), []).append(uid)
+        self._paths.clear()
+
+    def __len__(self):
+        return len(self.folders)
+
+    def __contains__(self, uid):
+        return uid in self.folders
+
+    def __iter__(self):
+        return iter(self.folders)
+
+    def get(self, uid):
+        """Returns the folder object of a uid, None when it is not in the tree."""
+        return self.folders.get(uid)
+
+    def parent(self, uid):
+        """Returns the uid of the parent of a folder, None for top-level folders."""
+        return self.folders[uid].get('parent_uid')
+
+    def children(self, uid: str = None) -> list:
+        """Returns the uids of the subfolders of a folder, or of the top-level folders when None."""
+        return sorted(self._children.get(uid if uid is not None else self.root, []),
+                      key=lambda child: (self.folders[child].get('name') or '', child))
+
+    def descendants(self, uid: str = None):
+        """Yields the uids of every folder below a folder (or the root), breadth-first."""
+        level = self.children(uid)
+        while level:
+            yield from level
+            level = [child for parent in level for child in self.children(parent)]
+
+    def path(self, uid) -> str:
+        """Returns the path of a folder: the names of its ancestors and its own, joined by `/`."""
+        if uid not in self._paths:
+            names, current, seen = [], uid, set()
+            while current in self.folders and current != self.root and current not in seen:
+                seen.add(current)
+                names.append(self.folders[current].get('name') or current)
+                current = self.parent(current)
+            self._paths[uid] = '/'.join(reversed(names))
+        return self._paths[uid]
+
+    def find(self, path: str):
+        """Returns the uid of the folder at a path, e.g. `media/photos`, None when there is none."""
+        uid = None
+        for name in (segment for segment in path.split('/') if segment):
+            uid = next((child for child in self.children(uid) if self.folders[child].get('name') == name), None)
+            if uid is None:
+                return None
+        return uid
+
+    def to_dict(self) -> dict:
+        """Returns a JSON-serializable copy of the tree, restored with `from_dict`."""
+        return {'root': self.root, 'folders': list(self.folders.values())}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Rebuilds a tree saved with `to_dict`."""
+        return cls(data.get('folders', ()), root=data.get('root'))
+
+    def __repr__(self):
+        return f"FolderTree(folders={len(self.folders)})"
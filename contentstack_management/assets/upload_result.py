@@ -0,0 +1,89 @@
+"""Outcome and throughput of `Assets.upload_many` and `Assets.sync`."""
+import threading
+import time
+
+import requests
+
+
+def error_details(error):
+    """
+    Returns the status code and message of an error: those of the response of an `HTTPError`
+    (its `error_message`), and None and the error text otherwise.
+    """
+    status_code, message = None, str(error)
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status_code = error.response.status_code
+        try:
+            message = error.response.json().get('error_message') or message
+        except (ValueError, AttributeError):
+            pass
+    return status_code, message
+
+
+class UploadResult:
+    """
+    Collects the outcome of an `Assets.upload_many` or `Assets.sync` call.
+
+    :ivar assets: The uploaded asset of each file, in input order; None for files that failed.
+    Files skipped by `sync` only carry the `uid` of their asset
+    :ivar actions: What was done with each file, in input order: `uploaded`, `replaced`,
+    `skipped`, or None when it failed
+    :ivar failures: One dict per file that failed, with its `index` in the input, its `filename`,
+    the `status_code` of the failed request (None when no response was received) and the `error`
+    :ivar bytes_sent: The number of bytes uploaded for the files that succeeded
+    :ivar elapsed: The duration of the upload in seconds
+    """
+
+    def __init__(self, count: int):
+        self.assets = [None] * count
+        self.actions = [None] * count
+        self.failures = []
+        self.bytes_sent = 0
+        self.elapsed = 0.0
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def ok(self) -> bool:
+        """Whether no file failed."""
+        return not self.failures
+
+    @property
+    def uploaded(self) -> int:
+        """The number of files uploaded as new assets."""
+        return self.actions.count('uploaded')
+
+    @property
+    def replaced(self) -> int:
+        """The number of files that replaced the content of their asset."""
+        return self.actions.count('replaced')
+
+    @property
+    def skipped(self) -> int:
+        """The number of files skipped because their asset already has their content."""
+        return self.actions.count('skipped')
+
+    @property
+    def bytes_per_second(self) -> float:
+        """The upload throughput of the files that succeeded."""
+        return self.bytes_sent / self.elapsed if self.elapsed else 0.0
+
+    def _succeed(self, index, asset, size, action='uploaded'):
+        with self._lock:
+            self.assets[index] = asset
+            self.actions[index] = action
+            self.bytes_sent += size
+
+    def _fail(self, index, filename, error):
+        status_code, message = error_details(error)
+        with self._lock:
+            self.failures.append({'index': index, 'filename': filename, 'status_code': status_code, 'error': message})
+
+    def _finish(self):
+        self.elapsed = time.monotonic() - self._started
+        self.failures.sort(key=lambda failure: failure['index'])
+
+    def __repr__(self):
+        return (f"UploadResult(uploaded={self.uploaded}, replaced={self.replaced}, skipped={self.skipped}, "
+                f"failed={len(self.failures)}, "
+                f"bytes_per_second={self.bytes_per_second:.0f})")
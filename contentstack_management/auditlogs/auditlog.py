@@ -3,11 +3,11 @@ which is the endpoint for the RESTFUL API that we'll be interacting with.
 The create(), read(), update(), and delete() methods each correspond to 
 the CRUD operations that can be performed on the API """
 
-from ..common import Parameter
+from ..common import Paginated, Parameter
 from .._errors import ArgumentException
 from .._messages import LOG_ITEM_UID_REQUIRED
 
-class Auditlog(Parameter):
+class Auditlog(Parameter, Paginated):
     """
     This class takes a base URL as an argument when it's initialized, 
     which is the endpoint for the RESTFUL API that
@@ -15,6 +15,8 @@ class Auditlog(Parameter):
     methods each correspond to the CRUD 
     operations that can be performed on the API """
 
+    _items_key = 'logs'
+
     def __init__(self, client, log_item_uid: str):
         self.client = client
         self.log_item_uid = log_item_uid
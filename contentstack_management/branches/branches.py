@@ -5,13 +5,15 @@ organized, and structured manner without impacting each other."""
 
 import json
 
-from contentstack_management.common import Parameter
+from contentstack_management.common import Paginated, Parameter
 from contentstack_management._messages import BRANCH_UID_REQUIRED
 
 _path = 'stacks/branches'
 
 
-class Branch(Parameter):
+class Branch(Parameter, Paginated):
+
+    _items_key = 'branches'
 
     def __init__(self, client, branch_uid=None):
         self.branch_uid = branch_uid
@@ -0,0 +1,176 @@
+"""
+Futures for queued bulk operation jobs.
+
+Bulk publish, unpublish and delete requests are queued by the API, which answers with a job id
+whose progress is read with `BulkOperation.job_status`. A `BulkJob` is a
+`concurrent.futures.Future` resolved with the final job status. Every job of the process is
+polled by a single scheduler thread, which hands due polls to a small worker pool, so thousands
+of outstanding jobs cost a heap entry each rather than a thread. A job is polled often while it
+makes progress and less and less often while its status stays the same.
+"""
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+
+COMPLETED = frozenset(('completed', 'complete', 'success', 'successful', 'done', 'finished'))
+FAILED = frozenset(('failed', 'failure', 'error', 'cancelled', 'canceled', 'aborted'))
+
+
+def job_state(body):
+    """
+    Returns the status of a job status response body, lowercased, e.g. `in_progress`.
+    """
+    if not isinstance(body, dict):
+        return None
+    job = body.get('job') if isinstance(body.get('job'), dict) else body
+    status = job.get('status')
+    return None if status is None else str(status).lower()
+
+
+class _JobPoller:
+    """
+    Schedules the polls of every outstanding `BulkJob` from one thread. The thread is started
+    with the first job and exits after `idle_timeout` seconds without jobs.
+    """
+
+    def __init__(self, workers: int = 4, idle_timeout: float = 30.0):
+        self.workers = workers
+        self.idle_timeout = idle_timeout
+        self._heap = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._pool = None
+
+    def schedule(self, job, delay):
+        with self._condition:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._sequence), job))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='bulk-job-poller', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def __len__(self):
+        with self._condition:
+            return len(self._heap)
+
+    def _next(self):
+        with self._condition:
+            while True:
+                if not self._heap:
+                    self._condition.wait(self.idle_timeout)
+                    if not self._heap:
+                        self._thread = None
+                        return None
+                    continue
+                due = self._heap[0][0] - time.monotonic()
+                if due <= 0:
+                    return heapq.heappop(self._heap)[2]
+                self._condition.wait(due)
+
+    def _run(self):
+        while True:
+            job = self._next()
+            if job is None:
+                return
+            if job.done():
+                continue
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='bulk-job-poll')
+            try:
+                self._pool.submit(self._poll, job)
+            except RuntimeError:
+                # The interpreter is shutting down
+                return
+
+    def _poll(self, job):
+        delay = job._poll()
+        if delay is not None:
+            self.schedule(job, delay)
+
+
+_poller = _JobPoller()
+
+
+class BulkJob(Future):
+    """
+    Future of a queued bulk job, resolved with its final status body once the job has completed
+    or failed; `failed` tells them apart. It supports everything a `concurrent.futures.Future`
+    does, including `add_done_callback`, `concurrent.futures.wait` and `as_completed`. An error
+    response to a status request resolves the future with that exception. `cancel()` only
+    stops the polling, not the job.
+
+    [Example:]
+        >>> job = client.stack('api_key').bulk_operation().job(response.json()['job_id'])
+        >>> job.add_done_callback(lambda done: print(done.status))
+        >>> body = job.result(timeout=600)
+
+    :param bulk: The `BulkOperation` the job was queued with
+    :param job_uid: The job id returned by the bulk request
+    :param headers: Headers sent with every status request, e.g. `{'bulk_version': '2.0'}`
+    :param interval: Seconds before the first poll, and between polls while the job progresses
+    :param max_interval: The longest wait between two polls
+    :param backoff: The factor the wait grows by after each poll without progress
+    """
+
+    def __init__(self, bulk, job_uid: str, headers: dict = None, interval: float = 1.0, max_interval: float = 30.0,
+                 backoff: float = 1.5, poller: _JobPoller = None):
+        super().__init__()
+        self.bulk = bulk
+        self.job_uid = job_uid
+        self.headers = headers
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.status = None
+        self.body = None
+        self.polls = 0
+        self._delay = interval
+        self._progress = None
+        (poller or _poller).schedule(self, interval)
+
+    @property
+    def failed(self) -> bool:
+        """Whether the job ended with a failure status."""
+        return self.status in FAILED
+
+    @staticmethod
+    def _resolve(setter, value):
+        try:
+            setter(value)
+        except InvalidStateError:
+            # Cancelled while the status request was in flight
+            pass
+
+    def _poll(self):
+        """
+        Reads the status of the job once and resolves the future when the job has ended.
+
+        :return: the number of seconds before the next poll, None when the job has ended.
+        """
+        if self.done():
+            return None
+        try:
+            response = self.bulk.job_status(self.job_uid, headers=self.headers)
+            response.raise_for_status()
+            body = response.json()
+        except Exception as error:
+            self._resolve(self.set_exception, error)
+            return None
+        self.polls += 1
+        self.body = body
+        self.status = job_state(body)
+        if self.status in COMPLETED or self.status in FAILED:
+            self._resolve(self.set_result, body)
+            return None
+        if body == self._progress:
+            self._delay = min(self._delay * self.backoff, self.max_interval)
+        else:
+            self._delay = self.interval
+            self._progress = body
+        return self._delay
+
+    def __repr__(self):
+        return f"BulkJob(job_uid={self.job_uid!r}, status={self.status!r})"
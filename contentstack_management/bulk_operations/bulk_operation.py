@@ -4,10 +4,28 @@ The create(), read(), update(), and delete() methods each correspond to
 the CRUD operations that can be performed on the API """
 
 import json
-from ..common import Parameter
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
+
+import requests
+
+from ..common import Parameter
+from .bulk_job import BulkJob
+from .bulk_result import BulkResult
 from .._errors import ArgumentException
-from .._messages import JOB_UID_REQUIRED
+from .._messages import JOB_UID_REQUIRED, BULK_CHUNK_SIZE_INVALID
+
+
+def _split(values, size):
+    return [values[index:index + size] for index in range(0, len(values), size)]
+
+
+def _error_body(response):
+    try:
+        body = response.json()
+    except ValueError:
+        return {}
+    return body if isinstance(body, dict) else {}
 
 class BulkOperation(Parameter):
     """
@@ -17,6 +35,9 @@ class BulkOperation(Parameter):
     methods each correspond to the CRUD 
     operations that can be performed on the API """
 
+    # Maximum number of publications (entry or asset x locale x environment) sent per request
+    MAX_ITEMS = 10
+
     def __init__(self, client):
         self.client = client
         super().__init__(self.client)
@@ -254,11 +275,9 @@ class BulkOperation(Parameter):
 
         -------------------------------
         """
-        if headers is not None:
-            self.client.headers.update(headers)
         url = f"{self.path}/release/items"
         data = json.dumps(data)
-        return self.client.post(url, headers = self.client.headers, data = data, params=self.params)
+        return self.client.post(url, headers = {**self.client.headers, **(headers or {})}, data = data, params=self.params)
     
     def update_items(self, data: dict, headers: dict = None):
         """
@@ -290,11 +309,9 @@ class BulkOperation(Parameter):
 
         -------------------------------
         """
-        if headers is not None:
-            self.client.headers.update(headers)
         url = f"{self.path}/release/update_items"
         data = json.dumps(data)
-        return self.client.put(url, headers = self.client.headers, data = data, params=self.params)
+        return self.client.put(url, headers = {**self.client.headers, **(headers or {})}, data = data, params=self.params)
     
     def job_status(self, job_uid: str, headers: dict = None):
         """
@@ -315,9 +332,165 @@ class BulkOperation(Parameter):
         """
         if job_uid is None:
             raise ArgumentException(JOB_UID_REQUIRED)
-        if headers is not None:
-            self.client.headers.update(headers)
         url = f"{self.path}/jobs/{quote(job_uid)}"
-        return self.client.get(url, headers = self.client.headers, params=self.params)
-    
-    
\ No newline at end of file
+        return self.client.get(url, headers = {**self.client.headers, **(headers or {})}, params=self.params)
+
+    def job(self, job_uid: str, headers: dict = None, interval: float = 1.0, max_interval: float = 30.0):
+        """
+        Returns a `BulkJob` future for a queued job, resolved with its final status once the job
+        has ended. The status is polled in the background with adaptive backoff: every
+        `interval` seconds while the job progresses, up to every `max_interval` seconds while it
+        does not.
+
+        :param job_uid: The job id returned by `publish`, `unpublish`, `delete` or a release deploy
+        :param headers: Headers sent with every status request, e.g. `{'bulk_version': '2.0'}`
+        :param interval: The shortest wait between two status requests, in seconds
+        :param max_interval: The longest wait between two status requests, in seconds
+        :return: a `BulkJob`.
+        -------------------------------
+            [Example:]
+                >>> import contentstack_management
+                >>> client = contentstack_management.Client(authtoken='your_authtoken')
+                >>> bulk = client.stack('api_key').bulk_operation()
+                >>> job = bulk.job(bulk.publish(data).json()['job_id'])
+                >>> job.add_done_callback(lambda done: print(done.job_uid, done.status))
+                >>> status = job.result(timeout=600)
+
+        -------------------------------
+        """
+        if job_uid is None:
+            raise ArgumentException(JOB_UID_REQUIRED)
+        return BulkJob(self, job_uid, headers=headers, interval=interval, max_interval=max_interval)
+
+    @staticmethod
+    def chunks(data: dict, chunk_size: int = MAX_ITEMS):
+        """
+        Splits a bulk payload into payloads of at most `chunk_size` publications each, counting
+        one per entry or asset, locale and environment. Locales and environments are spread over
+        several payloads when a single item would exceed the limit; every other key of `data`
+        (e.g. `publish_with_reference`, `scheduled_at`) is copied to each payload.
+
+        :param data: A `publish`, `unpublish` or `delete` payload of any size
+        :param chunk_size: The maximum number of publications per payload
+        :return: a generator of payloads.
+        """
+        if chunk_size is None or chunk_size < 1:
+            raise ArgumentException(BULK_CHUNK_SIZE_INVALID)
+        locales = data.get('locales') or [None]
+        environments = data.get('environments') or [None]
+        if len(locales) * len(environments) <= chunk_size:
+            groups = [(locales, environments)]
+        elif len(locales) <= chunk_size:
+            groups = [(locales, group) for group in _split(environments, chunk_size // len(locales))]
+        else:
+            groups = [(group, [environment]) for environment in environments for group in _split(locales, chunk_size)]
+        items = [('entries', item) for item in data.get('entries') or []] + \
+                [('assets', item) for item in data.get('assets') or []]
+        base = {key: value for key, value in data.items() if key not in ('entries', 'assets', 'locales', 'environments')}
+        for group_locales, group_environments in groups:
+            per_chunk = max(1, chunk_size // (len(group_locales) * len(group_environments)))
+            for part in _split(items, per_chunk):
+                chunk = dict(base)
+                for kind in ('entries', 'assets'):
+                    selected = [item for item_kind, item in part if item_kind == kind]
+                    if selected:
+                        chunk[kind] = selected
+                if 'locales' in data:
+                    chunk['locales'] = [locale for locale in group_locales if locale is not None]
+                if 'environments' in data:
+                    chunk['environments'] = [environment for environment in group_environments
+                                             if environment is not None]
+                yield chunk
+
+    def _many(self, send, action, data, chunk_size, workers, journal):
+        result = BulkResult(self)
+
+        def submit(indexed):
+            index, chunk = indexed
+            try:
+                if journal is not None:
+                    body = journal.run(f"bulk/{action}/{journal.digest(chunk)}", lambda: send(chunk), chunk)
+                else:
+                    response = send(chunk)
+                    response.raise_for_status()
+                    body = response.json()
+            except requests.HTTPError as error:
+                body = _error_body(error.response)
+                result._fail(chunk, error.response.status_code, body.get('error_message') or str(error),
+                             body.get('errors'))
+                return
+            except requests.RequestException as error:
+                result._fail(chunk, None, str(error))
+                return
+            result._add(index, body)
+            result._succeed(len(chunk.get('entries') or []) + len(chunk.get('assets') or []))
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(submit, enumerate(self.chunks(data, chunk_size))))
+        result._sorted()
+        return result
+
+    def publish_many(self, data: dict, chunk_size: int = MAX_ITEMS, workers: int = 4, journal=None):
+        """
+        Publishes any number of entries and assets to any number of locales and environments.
+        The payload is split with `chunks()` into requests within the API limit, which are
+        submitted concurrently (throttled by the client's rate limiter, when configured).
+
+        :param data: A `publish` payload of any size
+        :param chunk_size: The maximum number of publications (item x locale x environment) per request
+        :param workers: The number of requests sent at the same time
+        :param journal: Optional checkpoint `Journal`; chunks already submitted are skipped, so an
+        interrupted call can be run again
+        :return: a `BulkResult` with the job ids of the accepted chunks and the failed items.
+        -------------------------------
+        [Example:]
+            >>> data = {
+            >>>     "entries": [{"uid": uid, "content_type": "blog", "locale": "en-us"} for uid in uids],
+            >>>     "locales": ["en-us", "fr-fr"],
+            >>>     "environments": ["production", "staging"]
+            >>> }
+            >>> import contentstack_management
+            >>> client = contentstack_management.Client(authtoken='your_authtoken')
+            >>> result = client.stack('api_key').bulk_operation().publish_many(data, workers=8)
+            >>> failed = [failure['item']['uid'] for failure in result.failures]
+        -------------------------------
+        """
+        return self._many(self.publish, 'publish', data, chunk_size, workers, journal)
+
+    def unpublish_many(self, data: dict, chunk_size: int = MAX_ITEMS, workers: int = 4, journal=None):
+        """
+        Unpublishes any number of entries and assets from any number of locales and environments,
+        split into concurrent requests within the API limit. See `publish_many`.
+
+        :param data: An `unpublish` payload of any size
+        :param chunk_size: The maximum number of publications (item x locale x environment) per request
+        :param workers: The number of requests sent at the same time
+        :param journal: Optional checkpoint `Journal`; chunks already submitted are skipped
+        :return: a `BulkResult`.
+        -------------------------------
+        [Example:]
+            >>> import contentstack_management
+            >>> client = contentstack_management.Client(authtoken='your_authtoken')
+            >>> result = client.stack('api_key').bulk_operation().unpublish_many(data)
+        -------------------------------
+        """
+        return self._many(self.unpublish, 'unpublish', data, chunk_size, workers, journal)
+
+    def delete_many(self, data: dict, chunk_size: int = MAX_ITEMS, workers: int = 4, journal=None):
+        """
+        Deletes any number of entries and assets, split into concurrent requests within the API
+        limit. See `publish_many`.
+
+        :param data: A `delete` payload of any size
+        :param chunk_size: The maximum number of entries and assets per request
+        :param workers: The number of requests sent at the same time
+        :param journal: Optional checkpoint `Journal`; chunks already submitted are skipped
+        :return: a `BulkResult`.
+        -------------------------------
+        [Example:]
+            >>> import contentstack_management
+            >>> client = contentstack_management.Client(authtoken='your_authtoken')
+            >>> result = client.stack('api_key').bulk_operation().delete_many({"entries": entries})
+        -------------------------------
+        """
+        return self._many(self.delete, 'delete', data, chunk_size, workers, journal)
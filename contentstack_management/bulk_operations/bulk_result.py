@@ -0,0 +1,69 @@
+"""Aggregated outcome of a bulk operation split into several requests."""
+import threading
+
+
+class BulkResult:
+    """
+    Collects the responses of the chunks of a `BulkOperation.publish_many`, `unpublish_many` or
+    `delete_many` call.
+
+    :ivar responses: The JSON bodies of the successful chunk requests, in submission order
+    :ivar job_ids: The bulk job ids returned by the API
+    :ivar succeeded: The number of entries and assets accepted by the API
+    :ivar failures: One dict per entry or asset that failed, with the `item`, its `kind`
+    (`entries` or `assets`), the `locales` and `environments` of its chunk, the `status_code` of
+    the failed request (None on a connection error) and the `error` message and details
+    """
+
+    def __init__(self, bulk=None):
+        self.bulk = bulk
+        self.responses = []
+        self.job_ids = []
+        self.succeeded = 0
+        self.failures = []
+        self._lock = threading.Lock()
+
+    @property
+    def ok(self) -> bool:
+        """Whether every entry and asset was accepted."""
+        return not self.failures
+
+    def jobs(self, headers: dict = None, interval: float = 1.0, max_interval: float = 30.0):
+        """
+        Returns a `BulkJob` future per job id, polled in the background until the job has ended.
+
+        [Example:]
+            >>> result = stack.bulk_operation().publish_many(data)
+            >>> done, pending = concurrent.futures.wait(result.jobs(), timeout=600)
+
+        :param headers: Headers sent with every status request, e.g. `{'bulk_version': '2.0'}`
+        :param interval: The shortest wait between two status requests, in seconds
+        :param max_interval: The longest wait between two status requests, in seconds
+        """
+        return [self.bulk.job(job_id, headers=headers, interval=interval, max_interval=max_interval)
+                for job_id in self.job_ids]
+
+    def _add(self, index, body):
+        with self._lock:
+            self.responses.append((index, body))
+            if isinstance(body, dict) and body.get('job_id'):
+                self.job_ids.append((index, body['job_id']))
+
+    def _sorted(self):
+        self.responses = [body for _, body in sorted(self.responses, key=lambda response: response[0])]
+        self.job_ids = [job_id for _, job_id in sorted(self.job_ids)]
+
+    def _succeed(self, count):
+        with self._lock:
+            self.succeeded += count
+
+    def _fail(self, chunk, status_code, error, errors=None):
+        with self._lock:
+            for kind in ('entries', 'assets'):
+                for item in chunk.get(kind) or []:
+                    self.failures.append({'item': item, 'kind': kind, 'locales': chunk.get('locales'),
+                                          'environments': chunk.get('environments'), 'status_code': status_code,
+                                          'error': error, 'errors': errors})
+
+    def __repr__(self):
+        return f"BulkResult(succeeded={self.succeeded}, failed={len(self.failures)}, jobs={len(self.job_ids)})"
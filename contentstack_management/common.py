@@ -1,6 +1,16 @@
+import copy
+import itertools
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from ._streaming import ItemStream
+
+
 class Parameter(object):
     def __init__(self, client):
-        self.client = client
+        # Each handle keeps its headers on its own view of the client, so handles used from
+        # different threads never share (or overwrite) each other's headers.
+        self.client = client.scoped() if hasattr(client, 'scoped') else client
         self.params = {}
 
     def add_param(self, key, value):
@@ -14,3 +24,156 @@ class Parameter(object):
 
     def add_param_dict(self, parameters):
         self.params.update(parameters)
+
+
+def _uid(item):
+    return item.get('uid') if isinstance(item, dict) else None
+
+
+class Paginated(object):
+    """
+    Adds `iter_all()` and `find_all()` to list resources whose `find()` returns one page of
+    items under the `_items_key` key of the response body. Only resources whose API honours the
+    `skip` and `limit` params use it.
+    """
+
+    _items_key = None
+
+    def _page(self, skip, limit, include_count=False, stream=False):
+        # Pages are requested on a copy of the handle, so the caller's params are left untouched.
+        # Returns the items of the page and the other members of the response body, which are
+        # only complete once the items of a streamed page have been read.
+        page = copy.copy(self)
+        page.params = dict(self.params, skip=skip, limit=limit)
+        if include_count:
+            page.params['include_count'] = True
+        if stream:
+            page.client = page.client.scoped()
+            page.client.stream = True
+        response = page.find()
+        if not response.ok:
+            response.close()
+            response.raise_for_status()
+        if stream:
+            items = ItemStream(response, self._items_key)
+            return items, items.members
+        body = response.json()
+        return body.get(self._items_key) or [], body
+
+    def _page_items(self, skip, limit, stream=False):
+        return list(self._page(skip, limit, stream=stream)[0])
+
+    def _parallel_pages(self, skip, limit, total, workers, ordered, stream):
+        # At most `2 * workers` pages are requested ahead of the caller, which bounds memory
+        # while keeping every worker busy as pages are consumed.
+        skips = iter(range(skip, total, limit))
+        pending = deque()
+        pool = ThreadPoolExecutor(max_workers=workers)
+
+        def fill():
+            while len(pending) < 2 * workers:
+                page_skip = next(skips, None)
+                if page_skip is None:
+                    return
+                pending.append(pool.submit(self._page_items, page_skip, limit, stream))
+
+        try:
+            fill()
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = next(future for future in pending if future in done)
+                    pending.remove(future)
+                items = future.result()
+                fill()
+                yield from items
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+
+    def iter_all(self, limit: int = 100, workers: int = 1, ordered: bool = True, stream: bool = False):
+        """
+        Iterates over every item of the list, requesting it page by page with `limit`, `skip` and
+        `include_count`. The params added to the handle (queries, locale, ...) are sent with every
+        page.
+
+        With `workers` above 1, the remaining pages are fetched in parallel once the first page
+        reports the total `count`, holding at most `2 * workers` pages in memory. Items added or
+        removed while iterating may then be missed or seen twice, as with any offset pagination.
+
+        With `stream`, pages are decoded item by item as they are read from the socket instead of
+        being downloaded and parsed whole, so memory scales with one item rather than one page.
+
+        :param limit: The number of items requested per page. The API may return shorter pages
+        (it caps them at 100 items); the pages are then followed until `count` items were seen
+        :param workers: The number of pages fetched at the same time
+        :param ordered: Whether parallel pages are yielded in list order; when False, pages are
+        yielded as soon as they arrive
+        :param stream: Whether pages are decoded incrementally with `ItemStream`
+        :return: a generator yielding the items one at a time.
+        -------------------------------
+        [Example:]
+
+            >>> import contentstack_management
+            >>> client = contentstack_management.Client(authtoken='your_authtoken')
+            >>> for entry in client.stack('api_key').content_types('content_type_uid').entry().iter_all():
+            >>>     print(entry['uid'])
+            >>> assets = client.stack('api_key').assets().iter_all(workers=8, ordered=False)
+            >>> logs = client.stack('api_key').auditlog().iter_all(limit=500, stream=True)
+
+        -------------------------------
+        """
+        skip = int(self.params.get('skip', 0))
+        items, body = self._page(skip, limit, include_count=True, stream=stream)
+        total, previous = None, None
+        while True:
+            items = iter(items)
+            first = next(items, None)
+            if previous is not None and _uid(first) == previous:
+                # The endpoint ignored `skip` and sent the previous page again
+                if hasattr(items, 'close'):
+                    items.close()
+                return
+            previous = _uid(first)
+            count = 0
+            for item in itertools.chain(() if first is None else (first,), items):
+                count += 1
+                yield item
+            if total is None:
+                total = body.get('count')
+            skip += count
+            if total is not None:
+                # The API caps the page size, so a page shorter than `limit` is not the last one
+                # while fewer than `count` items were seen
+                if count == 0 or skip >= total:
+                    return
+            elif count != limit:
+                # Without a count, only a full page can be followed by another one: a longer page
+                # means the endpoint ignored `limit` and sent everything
+                return
+            if workers > 1 and total is not None:
+                # Parallel pages are as long as the pages the server actually returns
+                yield from self._parallel_pages(skip, min(count, limit), total, workers, ordered, stream)
+                return
+            items, body = self._page(skip, limit, stream=stream)
+
+    def find_all(self, limit: int = 100, workers: int = 1) -> list:
+        """
+        Fetches every item of the list, following the pages with `iter_all()`.
+
+        :param limit: The number of items requested per page
+        :param workers: The number of pages fetched at the same time
+        :return: the list of items, in list order.
+        -------------------------------
+        [Example:]
+
+            >>> import contentstack_management
+            >>> client = contentstack_management.Client(authtoken='your_authtoken')
+            >>> assets = client.stack('api_key').assets().find_all(workers=4)
+
+        -------------------------------
+        """
+        return list(self.iter_all(limit=limit, workers=workers))
@@ -4,26 +4,29 @@ to first create a content type, and then create entries using the content type.
 
 import json
 
-from contentstack_management.common import Parameter
+from contentstack_management.common import Paginated, Parameter
 from ..entries import entry
+from .._multipart import send_multipart
 from .._messages import CONTENT_TYPE_UID_REQUIRED
 
 _path = 'content_types'
 
 
-class ContentType(Parameter):
+class ContentType(Parameter, Paginated):
     """This class takes a base URL as an argument when it's initialized, 
         which is the endpoint for the RESTFUL API that we'll be interacting with.
         The create(), read(), update(), and delete() methods each correspond to 
         the CRUD operations that can be performed on the API"""
 
+    _items_key = 'content_types'
+
     def __init__(self, client, content_type_uid=None, branch = None):
         self.client = client
         self.content_type_uid = content_type_uid
         self.branch = branch
+        super().__init__(self.client)
         if self.branch:
             self.add_header('branch', branch)
-        super().__init__(self.client)
 
     def find(self):
         r"""
@@ -342,9 +345,8 @@ class ContentType(Parameter):
         --------------------------------
         """
         url = "content_types/import"
-        self.client.headers['Content-Type'] = "multipart/form-data"
-        files = {'content_type': open(f"{file_path}", 'rb')}
-        return self.client.post(url, headers=self.client.headers, params=self.params, files=files)
+        fields = {'content_type': (None, file_path, None)}
+        return send_multipart(self.client.post, url, fields, headers=self.client.headers, params=self.params)
 
     def entry(self, entry_uid: str =None):
         if self.content_type_uid is None:
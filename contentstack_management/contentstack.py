@@ -2,6 +2,12 @@ from enum import Enum
 import os
 import pyotp
 from ._api_client import _APIClient
+from ._cache import ResponseCache
+from ._async_api_client import _AsyncAPIClient
+from ._messages import ASYNC_CLIENT_CONTEXT_REQUIRED
+from ._rate_limiter import RateLimiter
+from ._retry import RetryPolicy
+from ._transport import Transport
 from .endpoint import Endpoint
 from contentstack_management.organizations import organization
 from contentstack_management.stack import stack
@@ -32,12 +38,16 @@ def user_agents(headers=None):
 
 
 class Client:
+    _api_client_class = _APIClient
 
     # TODO: DefaultCSCredential(), needs to be implemented
     def __init__(self, host: str = 'api.contentstack.io', scheme: str = 'https://',
                  authtoken: str = None , management_token=None, headers: dict = None,
                  region: Region = Region.US.value, version='v3', timeout=2, max_retries: int = 18, early_access: list = None,
-                 oauth_config: dict = None, **kwargs):
+                 oauth_config: dict = None, pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_idle_timeout: float = None, retry_policy: RetryPolicy = None,
+                 rate_limiter: RateLimiter = None, transport: Transport = None,
+                 cache: ResponseCache = None, coalesce_requests: bool = True, **kwargs):
         _DEFAULT_HOST = 'api.contentstack.io'
         self.endpoint = f'{scheme}{_DEFAULT_HOST}/{version}/'
 
@@ -69,7 +79,11 @@ class Client:
         if management_token is not None:
             headers['authorization'] = management_token
         headers = user_agents(headers)
-        self.client = _APIClient(endpoint=self.endpoint, headers=headers, timeout=timeout, max_retries=max_retries)
+        self.client = self._api_client_class(endpoint=self.endpoint, headers=headers, timeout=timeout, max_retries=max_retries,
+                                             pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                             pool_idle_timeout=pool_idle_timeout, retry_policy=retry_policy,
+                                             rate_limiter=rate_limiter, transport=transport,
+                                             cache=cache, coalesce_requests=coalesce_requests)
         
         # Initialize OAuth if configuration is provided
         self.oauth_handler = None
@@ -96,6 +110,20 @@ class Client:
         :param timeout: Optional timeout value for API requests
         :param max_requests:Optional maximum number of requests to be made
         :param retry_on_error: Optional boolean value indicating whether to retry API requests on error.
+        :param pool_connections: Optional number of per-host connection pools kept alive
+        :param pool_maxsize: Optional maximum number of keep-alive connections per host
+        :param pool_idle_timeout: Optional seconds after which idle pooled connections are discarded
+        :param retry_policy: Optional `RetryPolicy` controlling backoff, Retry-After handling and the
+        retry budget; by default failed calls are retried up to `max_retries` times and for at
+        most 60 seconds per call
+        :param rate_limiter: Optional `RateLimiter` throttling calls per stack to stay under the API rate limits
+        :param transport: Optional `Transport` sending the requests: `RequestsTransport` (default),
+        `Urllib3Transport` for lower per-call overhead, or `StubTransport` to serve canned responses
+        in-process. `AsyncClient` accepts an `httpx.AsyncBaseTransport` instead
+        :param cache: Optional `ResponseCache` serving repeated reads of rarely changing resources
+        (content types, global fields, environments, locales, stack settings) from memory
+        :param coalesce_requests: Whether identical `GET` calls made at the same time share one API
+        request and its response, defaults to True
         :return: A client object for performing API operations.
         -------------------------------
         [Example:]
@@ -105,6 +133,42 @@ class Client:
         -------------------------------
         """
 
+    def close(self):
+        """
+        Releases the pooled keep-alive connections shared by every resource of this client.
+        """
+        self.client.close()
+
+    def add_hook(self, before_request=None, after_response=None):
+        """
+        Registers instrumentation hooks called with a `RequestEvent` (method, templated route,
+        status, bytes in and out, retries and timings) around every API request.
+
+        :param before_request: Callable run before each request is sent
+        :param after_response: Callable run once the final response or error is received
+        -------------------------------
+        [Example:]
+
+        >>> aggregator = contentstack_management.LatencyAggregator()
+        >>> client.add_hook(after_response=aggregator)
+        >>> client.stack('api_key').content_types().find()
+        >>> aggregator.summary()
+        -------------------------------
+        """
+        self.client.add_hook(before_request, after_response)
+
+    def remove_hook(self, hook):
+        """
+        Unregisters a hook added with `add_hook`.
+        """
+        self.client.remove_hook(hook)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def login(self, email: str, password: str, tfa_token: str = None, mfa_secret: str = None):
         """
         Login to Contentstack with optional TOTP support.
@@ -116,6 +180,14 @@ class Client:
                           If not provided, will check MFA_SECRET environment variable
         :return: Response object from the login request
         """
+        final_tfa_token = self._resolve_tfa_token(tfa_token, mfa_secret)
+        return user_session.UserSession(self.client).login(email, password, final_tfa_token)
+
+    def _resolve_tfa_token(self, tfa_token: str = None, mfa_secret: str = None):
+        """
+        Returns the two-factor token to log in with, generating a TOTP from the MFA secret
+        (or the MFA_SECRET environment variable) when no token is given.
+        """
         final_tfa_token = tfa_token
         
         if not mfa_secret:
@@ -124,7 +196,7 @@ class Client:
         if mfa_secret and not tfa_token:
             final_tfa_token = self._generate_totp(mfa_secret)
         
-        return user_session.UserSession(self.client).login(email, password, final_tfa_token)
+        return final_tfa_token
 
     def _generate_totp(self, secret: str) -> str:
         """
@@ -190,3 +262,61 @@ class Client:
             scope=scope,
             api_client=self.client
         )
+
+
+class AsyncClient(Client):
+    """
+    Asynchronous client with the same navigation API as `Client`. Every resource call returns
+    an awaitable, and all calls share one pooled `httpx.AsyncClient`, so many requests can run
+    concurrently on a single event loop. Requires the optional `httpx` dependency
+    (`pip install contentstack-management[async]`). The `transport` option takes an
+    `httpx.AsyncBaseTransport`, e.g. `httpx.MockTransport` to serve canned responses.
+
+    -------------------------------
+    [Example:]
+
+        >>> import asyncio
+        >>> import contentstack_management
+        >>> async def main():
+        >>>     async with contentstack_management.AsyncClient(authtoken='your_authtoken') as client:
+        >>>         entries = [client.stack('api_key').content_types('ct_uid').entry(uid).fetch() for uid in uids]
+        >>>         responses = await asyncio.gather(*entries)
+        >>> asyncio.run(main())
+    -------------------------------
+    """
+    _api_client_class = _AsyncAPIClient
+
+    async def close(self):
+        """
+        Releases the pooled connections shared by every resource of this client.
+        """
+        await self.client.aclose()
+
+    def __enter__(self):
+        raise TypeError(ASYNC_CLIENT_CONTEXT_REQUIRED)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def login(self, email: str, password: str, tfa_token: str = None, mfa_secret: str = None):
+        """
+        Login to Contentstack with optional TOTP support.
+
+        :param email: User's email address
+        :param password: User's password
+        :param tfa_token: Optional two-factor authentication token
+        :param mfa_secret: Optional MFA secret for automatic TOTP generation.
+                          If not provided, will check MFA_SECRET environment variable
+        :return: Response object from the login request
+        """
+        final_tfa_token = self._resolve_tfa_token(tfa_token, mfa_secret)
+        return await user_session.UserSession(self.client).login_async(email, password, final_tfa_token)
+
+    async def logout(self):
+        return await user_session.UserSession(client=self.client).logout_async()
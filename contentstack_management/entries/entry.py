@@ -4,11 +4,12 @@ The create(), read(), update(), and delete() methods each correspond to
 the CRUD operations that can be performed on the API """
 
 import json
-from ..common import Parameter
+from ..common import Paginated, Parameter
 from ..entry_variants.entry_variants import EntryVariants
+from .._multipart import send_multipart
 from .._messages import ENTRY_UID_REQUIRED, ENTRY_VERSION_NUMBER_REQUIRED, ENTRY_BODY_REQUIRED, ENTRY_FILE_PATH_REQUIRED
 
-class Entry(Parameter):
+class Entry(Parameter, Paginated):
     """
     This class takes a base URL as an argument when it's initialized, 
     which is the endpoint for the RESTFUL API that
@@ -16,6 +17,8 @@ class Entry(Parameter):
     methods each correspond to the CRUD 
     operations that can be performed on the API """
 
+    _items_key = 'entries'
+
     def __init__(self, client, content_type_uid, entry_uid):
         self.client = client
         self.content_type_uid = content_type_uid
@@ -328,10 +331,9 @@ class Entry(Parameter):
         if file_path is None:
             raise Exception(ENTRY_FILE_PATH_REQUIRED)
         url = f"content_types/{self.content_type_uid}/entries/import"
-        self.client.headers['Content-Type'] = "multipart/form-data"
-        files = {'entry': open(f"{file_path}",'rb')}
         self.params['locale'] = locale
-        return self.client.post(url, headers = self.client.headers, params = self.params, files = files)
+        fields = {'entry': (None, file_path, None)}
+        return send_multipart(self.client.post, url, fields, headers = self.client.headers, params = self.params)
     
     def export(self):
         """
@@ -4,17 +4,19 @@ The query(), create(), fetch(), delete(), update(), versions(), and includeVaria
 the operations that can be performed on the API """
 
 import json
-from ..common import Parameter
+from ..common import Paginated, Parameter
 from .._errors import ArgumentException
 from .._messages import ENTRY_VARIANT_CONTENT_TYPE_UID_REQUIRED, ENTRY_VARIANT_ENTRY_UID_REQUIRED, ENTRY_VARIANT_UID_REQUIRED
 
-class EntryVariants(Parameter):
+class EntryVariants(Parameter, Paginated):
     """
     This class takes a base URL as an argument when it's initialized, 
     which is the endpoint for the RESTFUL API that
     we'll be interacting with. The query(), create(), fetch(), delete(), update(), versions(), and includeVariants() 
     methods each correspond to the operations that can be performed on the API """
 
+    _items_key = 'entries'
+
     def __init__(self, client, content_type_uid: str, entry_uid: str, variant_uid: str = None):
         self.client = client
         self.content_type_uid = content_type_uid
@@ -89,8 +89,7 @@ class Extension(Parameter):
             'extension[multiple]': f"{data['multiple']}"
         }
         content_type, body = self.encode_multipart_formdata(fields)
-        self.client.headers['Content-Type'] = content_type
-        return self.client.post(self.path, headers = self.client.headers, data = body, params = self.params)
+        return self.client.post(self.path, headers = {**self.client.headers, 'Content-Type': content_type}, data = body, params = self.params)
     
     def create(self, data: dict):
         """
@@ -4,6 +4,7 @@ The create(), read(), update(), and delete() methods each correspond to
 the CRUD operations that can be performed on the API """
 
 import json
+from .._multipart import send_multipart
 from .._messages import GLOBAL_FIELD_UID_REQUIRED
 
 from contentstack_management.common import Parameter
@@ -38,12 +39,7 @@ class GlobalFields(Parameter):
             >>> result = client.stack("api_key").global_fields('global_field_uid').find().json()
         -------------------------------
         """
-        response = self.client.get(_path, headers=self.client.headers, params = self.params)
-        # Remove the api_version header after request
-        if self.options and 'api_version' in self.options:
-            self.client.headers.pop('api_version', None)
-        
-        return response
+        return self.client.get(_path, headers=self.client.headers, params = self.params)
 
     def fetch(self):
         """
@@ -59,12 +55,7 @@ class GlobalFields(Parameter):
         -------------------------------
         """
         url = f"{_path}/{self.global_field_uid}"
-        response =  self.client.get(url, headers=self.client.headers, params = self.params)
-        # Remove the api_version header after request
-        if self.options and 'api_version' in self.options:
-            self.client.headers.pop('api_version', None)
-        
-        return response
+        return self.client.get(url, headers=self.client.headers, params = self.params)
 
     def create(self, data):
         """
@@ -88,12 +79,7 @@ class GlobalFields(Parameter):
         -------------------------------
         """
         data = json.dumps(data)
-        response = self.client.post(_path, headers=self.client.headers, data=data, params = self.params)
-        # Remove the api_version header after request
-        if self.options and 'api_version' in self.options:
-            self.client.headers.pop('api_version', None)
-        
-        return response
+        return self.client.post(_path, headers=self.client.headers, data=data, params = self.params)
 
     def update(self, data):
         """
@@ -118,12 +104,7 @@ class GlobalFields(Parameter):
         """
         url = f"{_path}/{self.global_field_uid}"
         data = json.dumps(data)
-        response = self.client.put(url, headers=self.client.headers, params=self.params, data=data)
-        # Remove the api_version header after request
-        if self.options and 'api_version' in self.options:
-            self.client.headers.pop('api_version', None)
-        
-        return response
+        return self.client.put(url, headers=self.client.headers, params=self.params, data=data)
 
     def delete(self):
         """
@@ -138,12 +119,7 @@ class GlobalFields(Parameter):
         -------------------------------
         """
         url = f"{_path}/{self.global_field_uid}"
-        response = self.client.delete(url, headers=self.client.headers, params=self.params)
-        # Remove the api_version header after request
-        if self.options and 'api_version' in self.options:
-            self.client.headers.pop('api_version', None)
-        
-        return response
+        return self.client.delete(url, headers=self.client.headers, params=self.params)
 
     def imports(self, file_path):
         """
@@ -158,14 +134,8 @@ class GlobalFields(Parameter):
             >>> result = client.stack('api_key').global_fields().imports(path)
         -------------------------------
         """
-        self.client.headers['Content-Type'] = "multipart/form-data"
-        files = {'global_field': open(f"{file_path}", 'rb')}
-        response = self.client.post('global_fields/import', headers=self.client.headers, params=self.params, files=files)
-        # Remove the api_version header after request
-        if self.options and 'api_version' in self.options:
-            self.client.headers.pop('api_version', None)
-        
-        return response
+        fields = {'global_field': (None, file_path, None)}
+        return send_multipart(self.client.post, 'global_fields/import', fields, headers=self.client.headers, params=self.params)
 
     def export(self):
         """
@@ -182,9 +152,4 @@ class GlobalFields(Parameter):
         if self.global_field_uid is None or '':
             raise Exception(GLOBAL_FIELD_UID_REQUIRED)
         url = f"{_path}/{self.global_field_uid}/export"
-        response = self.client.get(url, headers=self.client.headers, params=self.params)
-        # Remove the api_version header after request
-        if self.options and 'api_version' in self.options:
-            self.client.headers.pop('api_version', None)
-        
-        return response
+        return self.client.get(url, headers=self.client.headers, params=self.params)
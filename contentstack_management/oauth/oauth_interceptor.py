@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from .._instrumentation import Hooks
 from .._messages import (
     OAUTH_TOKEN_REFRESH_FAILED,
     OAUTH_TOKENS_NOT_AVAILABLE,
@@ -34,6 +35,18 @@ class OAuthInterceptor:
         self.oauth_handler = oauth_handler
         self.early_access = None
         self.refresh_lock = threading.Lock()
+        self.hooks = Hooks()
+
+    def add_hook(self, before_request=None, after_response=None):
+        """
+        Registers instrumentation hooks called with a `RequestEvent` before and after every
+        request the interceptor sends, token requests and retries included.
+        """
+        self.hooks.add(before_request, after_response)
+
+    def remove_hook(self, hook):
+        """Unregisters a hook added with `add_hook`."""
+        self.hooks.remove(hook)
     
     def set_early_access(self, early_access: list):
         """Set early access headers."""
@@ -125,7 +138,7 @@ class OAuthInterceptor:
             Response object
         """
         if self.TOKEN_ENDPOINT_PATH in url:
-            return self._make_request(method, url, **kwargs)
+            return self._observed_request(method, url, 0, **kwargs)
         if not self._ensure_valid_token():
             raise requests.RequestException(OAUTH_TOKENS_NOT_AVAILABLE)
         return self._execute_with_retry(method, url, 0, **kwargs)
@@ -142,7 +155,7 @@ class OAuthInterceptor:
             headers.update(kwargs['headers'])
         kwargs['headers'] = headers
         
-        response = self._make_request(method, url, **kwargs)
+        response = self._observed_request(method, url, retry_count, **kwargs)
         if not response.ok and retry_count < self.MAX_RETRIES:
             status_code = response.status_code
             
@@ -170,12 +183,35 @@ class OAuthInterceptor:
                 return self._execute_with_retry(method, url, retry_count + 1, **kwargs)
         return response
     
+    def _observed_request(self, method: str, url: str, retry_count: int, **kwargs) -> requests.Response:
+        """
+        Make a request, reporting it to the registered hooks.
+        Returns:
+            Response object
+        """
+        if not self.hooks:
+            return self._make_request(method, url, **kwargs)
+        api_client = getattr(self.oauth_handler, 'api_client', None)
+        event = self.hooks.start(method, url, getattr(api_client, 'endpoint', None), kwargs.get('data'),
+                                 kwargs.get('json'), kwargs.get('files'))
+        event.retries = retry_count
+        try:
+            response = self._make_request(method, url, **kwargs)
+        except Exception as error:
+            self.hooks.finish(event, error=error)
+            raise
+        self.hooks.finish(event, response=response, stream=kwargs.get('stream', False))
+        return response
+
     def _make_request(self, method: str, url: str, **kwargs) -> requests.Response:
         """
-        Make the actual HTTP request.
+        Make the actual HTTP request over the API client's transport when one is available.
         Returns:
             Response object
         """
+        api_client = getattr(self.oauth_handler, 'api_client', None)
+        if api_client is not None and hasattr(api_client, '_get_session'):
+            return api_client._get_session().request(method, url, **kwargs)
         return requests.request(method, url, **kwargs)
     
     def get_valid_access_token(self) -> Optional[str]:
@@ -1,9 +1,9 @@
 import json
-from ..common import Parameter
+from ..common import Paginated, Parameter
 from .._messages import ORGANIZATION_UID_REQUIRED
 
 
-class Organization(Parameter):
+class Organization(Parameter, Paginated):
     """
     This class takes a base URL as an argument when it's initialized, 
     which is the endpoint for the RESTFUL API that
@@ -12,6 +12,8 @@ class Organization(Parameter):
     operations that can be performed on the API
     """
 
+    _items_key = 'organizations'
+
     def __init__(self, client, organization_uid):
         self.client = client
         self.organization_uid = organization_uid
@@ -3,11 +3,11 @@ which is the endpoint for the RESTFUL API that we'll be interacting with.
 The create(), read(), update(), and delete() methods each correspond to 
 the CRUD operations that can be performed on the API """
 
-from ..common import Parameter
+from ..common import Paginated, Parameter
 from .._errors import ArgumentException
 from .._messages import PUBLISH_QUEUE_UID_REQUIRED
 
-class PublishQueue(Parameter):
+class PublishQueue(Parameter, Paginated):
     """
     This class takes a base URL as an argument when it's initialized, 
     which is the endpoint for the RESTFUL API that
@@ -15,6 +15,8 @@ class PublishQueue(Parameter):
     methods each correspond to the CRUD 
     operations that can be performed on the API """
 
+    _items_key = 'queue'
+
     def __init__(self, client, publish_queue_uid: str):
         self.client = client
         self.publish_queue_uid = publish_queue_uid
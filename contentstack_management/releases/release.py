@@ -4,16 +4,18 @@ The create(), read(), update(), and delete() methods each correspond to
 the CRUD operations that can be performed on the API """
 
 import json
-from ..common import Parameter
+from ..common import Paginated, Parameter
 from .._errors import ArgumentException
 from ..release_items.release_item import ReleaseItems
 from .._messages import RELEASE_UID_REQUIRED
 
-class Releases(Parameter):
+class Releases(Parameter, Paginated):
     """
     You can define a “Release” as a set of entries and assets that needs to be deployed (published or unpublished) all at once to a particular environment.
     """
 
+    _items_key = 'releases'
+
     def __init__(self, client, release_uid: str, headers: dict = None):
         self.client = client
         self.release_uid = release_uid
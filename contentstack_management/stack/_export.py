@@ -0,0 +1,210 @@
+"""
+Full-stack export used by `Stack.export_to`.
+
+Every module of a stack (locales, environments, global fields, content types, assets, taxonomies,
+workflows, webhooks and releases) is written to its own NDJSON file, one JSON document per line.
+Modules whose API pages with `skip`/`limit` are read with `iter_all()`; the others (locales,
+environments, global fields, workflows and webhooks) are listed whole by a single `find()`.
+Entries are exported once per locale of the stack, so localized versions are kept. The file of
+every asset is downloaded next to its metadata, where `Stack.import_from` uploads it from. Modules are exported in parallel, and as soon as the content types
+(or taxonomies) are known, the entries of each content type (or terms of each taxonomy) are
+exported by the same worker pool. Items are written as they are read, so memory does not grow
+with the size of the stack.
+
+With a checkpoint journal, every completed file is recorded and an interrupted export run again
+with the same journal skips the files already written.
+
+Layout of the export directory::
+
+    manifest.json
+    locales.ndjson  environments.ndjson  global_fields.ndjson  content_types.ndjson
+    assets.ndjson  taxonomies.ndjson  workflows.ndjson  webhooks.ndjson  releases.ndjson
+    entries/<content_type_uid>/<locale>.ndjson
+    terms/<taxonomy_uid>.ndjson
+    assets/<asset_uid>/<filename>
+"""
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .._journal import open_journal
+from .._messages import EXPORT_ASSET_FILES_FAILED
+from ..common import Paginated
+
+
+class StackExporter:
+    """
+    Exports a stack to NDJSON files. See `Stack.export_to`.
+
+    :param stack: The `Stack` handle to export
+    :param directory: The directory the files are written to; it is created when missing
+    :param workers: The number of files exported at the same time
+    :param limit: The number of items requested per page
+    :param stream: Whether pages are decoded item by item as they are read
+    :param modules: The modules to export, defaults to `MODULES`
+    :param journal: Optional checkpoint `Journal`, or the path of its file, recording the files
+    completed so far
+    :param asset_files: Whether the file of every asset is downloaded with its metadata
+    """
+
+    MODULES = ('locales', 'environments', 'global_fields', 'content_types', 'assets', 'taxonomies', 'workflows',
+               'webhooks', 'releases')
+
+    def __init__(self, stack, directory, workers: int = 4, limit: int = 100, stream: bool = False, modules=None,
+                 journal=None, asset_files: bool = True):
+        self.stack = stack
+        self.directory = directory
+        self.workers = workers
+        self.limit = limit
+        self.stream = stream
+        self.modules = tuple(modules or self.MODULES)
+        self.journal = journal
+        self.asset_files = asset_files
+        self._journal = None
+        self._locales = []
+
+    def _handle(self, module):
+        return {
+            'locales': self.stack.locale,
+            'environments': self.stack.environments,
+            'global_fields': self.stack.global_fields,
+            'content_types': self.stack.content_types,
+            'assets': self.stack.assets,
+            'taxonomies': self.stack.taxonomy,
+            'workflows': self.stack.workflows,
+            'webhooks': self.stack.webhooks,
+            'releases': self.stack.releases,
+        }[module]()
+
+    def _items(self, name, handle, locale=None):
+        if isinstance(handle, Paginated):
+            items = handle.iter_all(limit=self.limit, stream=self.stream)
+            # Entries not localized in the locale may be listed with their fallback version
+            return (item for item in items if item.get('locale', locale) == locale) if locale else items
+        response = handle.find()
+        response.raise_for_status()
+        # The lists of these modules are keyed by the module name
+        return response.json().get(name) or []
+
+    def _locale_codes(self):
+        response = self.stack.locale().find()
+        response.raise_for_status()
+        return sorted(locale['code'] for locale in response.json().get('locales') or [])
+
+    def _write(self, name, handle, locale=None):
+        """
+        Writes every item of a list handle to `<name>.ndjson`. The file is written under a
+        temporary name and renamed once complete, so an interrupted export never leaves a
+        truncated file behind. With a `locale`, only the items localized in it are written.
+
+        :return: the number of items written, and their uids for modules with children.
+        """
+        path = os.path.join(self.directory, f"{name}.ndjson")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        count, uids = 0, []
+        collect = name in ('content_types', 'taxonomies')
+        key = f"export/{name}"
+        if self._journal is not None and key in self._journal and os.path.exists(path):
+            if collect:
+                with open(path, encoding='utf-8') as file:
+                    uids = [json.loads(line).get('uid') for line in file if line.strip()]
+            return self._journal.get(key)['count'], uids
+        try:
+            with open(path + '.tmp', 'w', encoding='utf-8') as file:
+                for item in self._items(name, handle, locale):
+                    file.write(json.dumps(item, ensure_ascii=False))
+                    file.write('\n')
+                    count += 1
+                    if collect:
+                        uids.append(item.get('uid'))
+        except BaseException:
+            os.remove(path + '.tmp')
+            raise
+        os.replace(path + '.tmp', path)
+        if self._journal is not None:
+            self._journal.record(key, {'count': count})
+        return count, uids
+
+    def _children(self, name, uids):
+        """Returns the `(name, task, args)` of the files exported once a module is written."""
+        # Entries and terms live under their content type and taxonomy
+        if name == 'content_types':
+            return [(f"entries/{uid}/{code}", self._write,
+                     (f"entries/{uid}/{code}", self._entries(uid, code), code))
+                    for uid in uids if uid for code in self._locales]
+        if name == 'taxonomies':
+            return [(f"terms/{uid}", self._write, (f"terms/{uid}", self.stack.taxonomy(uid).terms()))
+                    for uid in uids if uid]
+        if name == 'assets' and self.asset_files:
+            return [('assets/files', self._download_assets, ())]
+        return []
+
+    def _download_assets(self):
+        """
+        Downloads the file of every exported asset to `assets/<uid>/<filename>`. Files already
+        downloaded with their expected size are kept, so an interrupted export only fetches the
+        missing ones.
+
+        :return: the number of asset files, and no uids.
+        """
+        count, targets = 0, []
+        with open(os.path.join(self.directory, 'assets.ndjson'), encoding='utf-8') as file:
+            assets = [json.loads(line) for line in file if line.strip()]
+        for asset in assets:
+            if not asset.get('filename') or asset.get('is_dir'):
+                continue
+            count += 1
+            path = os.path.join(self.directory, 'assets', asset['uid'], asset['filename'])
+            size = int(asset['file_size']) if asset.get('file_size') else None
+            if size is None or not os.path.exists(path) or os.path.getsize(path) != size:
+                targets.append((asset['uid'], path, size))
+        result = self.stack.assets().download_many(targets, workers=self.workers)
+        if result.failures:
+            failure = result.failures[0]
+            raise Exception(EXPORT_ASSET_FILES_FAILED.format(len(result.failures), count, failure['uid'],
+                                                             failure['error']))
+        return count, []
+
+    def _entries(self, content_type_uid, locale):
+        handle = self.stack.content_types(content_type_uid).entry()
+        handle.add_param('locale', locale)
+        return handle
+
+    def run(self) -> dict:
+        """
+        Runs the export and writes `manifest.json`.
+
+        :return: the manifest: the number of items written to each file, keyed by file name
+        without extension (e.g. `content_types`, `entries/blog/en-us`).
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        if 'content_types' in self.modules:
+            self._locales = self._locale_codes()
+        counts = {}
+        owned = False
+        if self.journal is not None:
+            self._journal, owned = open_journal(self.journal)
+        try:
+            self._export(counts)
+        finally:
+            if owned:
+                self._journal.close()
+        manifest = {'files': dict(sorted(counts.items()))}
+        with open(os.path.join(self.directory, 'manifest.json'), 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=2)
+        return manifest
+
+    def _export(self, counts):
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {pool.submit(self._write, name, self._handle(name)): name for name in self.modules}
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = pending.pop(future)
+                        counts[name], uids = future.result()
+                        for child, task, args in self._children(name, uids):
+                            pending[pool.submit(task, *args)] = child
+            finally:
+                for future in pending:
+                    future.cancel()
@@ -0,0 +1,452 @@
+"""
+Dependency-ordered stack import used by `Stack.import_from`.
+
+Reads a directory written by `Stack.export_to` and recreates its content in a stack, module by
+module in dependency order: locales (after their fallback locale), environments, global fields
+and content types (after the global fields and content types they reference), assets, entries
+and releases. Within a module, every item whose dependencies are in place is imported
+concurrently.
+
+Content types referencing each other in a cycle are first imported without their reference
+fields and updated with their full schema once the whole cycle exists. Global fields are imported
+before the content types, so those with reference fields to content types are imported without
+them and updated once the content types exist. Entries are imported in two
+passes: the first creates every entry without its entry references, the second restores the
+references once every entry has its new uid. Entries are created in the master locale, then
+their versions in the other locales are imported as localizations of the same entry.
+
+Every imported item is recorded in a checkpoint journal (`import.journal` in the export directory
+by default), together with the uid the destination stack gave it. Items already in the journal
+are skipped, so an interrupted import can be run again and picks up where it stopped.
+"""
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .._journal import open_journal
+
+# Read-only fields set by the API, dropped before an item is imported
+SYSTEM_FIELDS = frozenset((
+    'created_at', 'updated_at', 'created_by', 'updated_by', 'deleted_at', '_version', 'ACL', '_in_progress',
+    'publish_details', '_workflow', 'stackHeaders', 'urlPath', '_metadata', 'last_activity', 'DEFAULT_ACL',
+    'SYS_ACL', 'abilities',
+))
+
+_DROP = object()
+
+
+def _read(directory, name):
+    """Yields the items of an exported NDJSON file, nothing when the file does not exist."""
+    path = os.path.join(directory, f"{name}.ndjson")
+    if not os.path.exists(path):
+        return
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _clean(item, keep_uid=True):
+    return {key: value for key, value in item.items()
+            if key not in SYSTEM_FIELDS and (keep_uid or key != 'uid')}
+
+
+def _checked(response):
+    response.raise_for_status()
+    return response.json()
+
+
+def schema_references(schema):
+    """
+    Collects the content types and global fields a schema refers to, including those of nested
+    groups, modular blocks and global fields.
+
+    :param schema: The `schema` of a content type or global field
+    :return: a `(content_type_uids, global_field_uids)` tuple of sets.
+    """
+    content_types, global_fields = set(), set()
+    for field in schema or []:
+        targets = field.get('reference_to')
+        targets = [targets] if isinstance(targets, str) else targets or []
+        if field.get('data_type') == 'reference':
+            content_types.update(targets)
+        elif field.get('data_type') == 'global_field':
+            global_fields.update(targets)
+        nested = [field.get('schema')] + [block.get('schema') for block in field.get('blocks') or []]
+        for block in field.get('blocks') or []:
+            if block.get('reference_to'):
+                global_fields.add(block['reference_to'])
+        for child in nested:
+            child_content_types, child_global_fields = schema_references(child)
+            content_types |= child_content_types
+            global_fields |= child_global_fields
+    return content_types, global_fields
+
+
+def _without_references(schema):
+    """Returns a copy of a schema without its reference fields, at any depth."""
+    fields = []
+    for field in schema or []:
+        if field.get('data_type') == 'reference':
+            continue
+        field = dict(field)
+        if 'schema' in field:
+            field['schema'] = _without_references(field['schema'])
+        if 'blocks' in field:
+            field['blocks'] = [dict(block, schema=_without_references(block['schema'])) if 'schema' in block
+                               else block for block in field['blocks']]
+        fields.append(field)
+    return fields
+
+
+class UidMap:
+    """
+    Uid remapping table of an import: the uids given by the destination stack to imported items,
+    kept in a checkpoint `Journal` under `<module>/<uid>` keys so it survives interruptions.
+
+    :param journal: The `Journal` the table is kept in
+    """
+
+    def __init__(self, journal):
+        self.journal = journal
+
+    def _result(self, module, uid):
+        return self.journal.get(f"{module}/{uid}") or {}
+
+    def get(self, module, uid):
+        """Returns the new uid of an imported item, None when it was not imported."""
+        return self._result(module, uid).get('uid')
+
+    def version(self, module, uid):
+        """Returns the version of an imported item in the destination stack."""
+        return self._result(module, uid).get('version')
+
+    def __contains__(self, key):
+        return f"{key[0]}/{key[1]}" in self.journal
+
+    def record(self, module, uid, new_uid, version=None, data=None):
+        """Records an imported item and the digest of the content it was imported with."""
+        self.journal.record(f"{module}/{uid}", {'uid': new_uid, 'version': version}, data)
+
+
+class StackImporter:
+    """
+    Imports a directory written by `Stack.export_to` into a stack. See `Stack.import_from`.
+
+    :param stack: The `Stack` handle to import into
+    :param directory: The export directory
+    :param workers: The number of items imported at the same time
+    :param journal: The checkpoint `Journal`, or the path of its file, defaults to
+    `import.journal` in `directory`
+    """
+
+    def __init__(self, stack, directory, workers: int = 4, journal=None):
+        self.stack = stack
+        self.directory = directory
+        self.workers = workers
+        self.journal = journal or os.path.join(directory, 'import.journal')
+        self.created = {}
+        self.skipped = {}
+        self.uids = None
+        self.master = None
+        self._asset_uids = frozenset()
+        self._lock = threading.Lock()
+
+    def _count(self, counts, module):
+        with self._lock:
+            counts[module] = counts.get(module, 0) + 1
+
+    def _done(self, module, uid):
+        if (module, uid) in self.uids:
+            self._count(self.skipped, module)
+            return True
+        return False
+
+    @staticmethod
+    def _import_file(imports, data):
+        # The import endpoints take the item as an uploaded JSON file
+        fd, path = tempfile.mkstemp(suffix='.json')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(data, file)
+            return _checked(imports(path))
+        finally:
+            os.remove(path)
+
+    def _run_graph(self, pool, dependencies, task):
+        """
+        Runs `task(node)` for every node once the nodes it depends on have completed, independent
+        nodes concurrently. Nodes on (or behind) a dependency cycle are not run.
+
+        :param dependencies: The nodes to run, mapped to the nodes they depend on
+        :return: the set of nodes that could not be run because of a cycle.
+        """
+        remaining = {node: (set(deps) & set(dependencies)) - {node} for node, deps in dependencies.items()}
+        pending = {}
+
+        def submit_ready():
+            for node in [node for node, deps in remaining.items() if not deps]:
+                del remaining[node]
+                pending[pool.submit(task, node)] = node
+
+        try:
+            submit_ready()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = pending.pop(future)
+                    future.result()
+                    for deps in remaining.values():
+                        deps.discard(node)
+                submit_ready()
+        finally:
+            for future in pending:
+                future.cancel()
+        return set(remaining)
+
+    def _run_all(self, pool, items, task):
+        """Runs `task(item)` for every item, with at most `2 * workers` items in flight."""
+        pending = set()
+        try:
+            for item in items:
+                if len(pending) >= 2 * self.workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(pool.submit(task, item))
+            for future in pending:
+                future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _import_locales(self, pool):
+        master = _checked(self.stack.fetch()).get('stack', {}).get('master_locale')
+        self.master = master or 'en-us'
+        locales = {locale['code']: locale for locale in _read(self.directory, 'locales') if locale['code'] != master}
+
+        def create(code):
+            if self._done('locales', code):
+                return
+            locale = locales[code]
+            data = {key: locale[key] for key in ('code', 'name', 'fallback_locale') if locale.get(key)}
+            _checked(self.stack.locale().create({'locale': data}))
+            self.uids.record('locales', code, code)
+            self._count(self.created, 'locales')
+
+        cyclic = self._run_graph(pool, {code: {locale.get('fallback_locale')} for code, locale in locales.items()},
+                                 create)
+        self._run_all(pool, sorted(cyclic), create)
+
+    def _import_environments(self, pool):
+        def create(environment):
+            if self._done('environments', environment['name']):
+                return
+            _checked(self.stack.environments().create({'environment': _clean(environment, keep_uid=False)}))
+            self.uids.record('environments', environment['name'], environment['name'])
+            self._count(self.created, 'environments')
+
+        self._run_all(pool, _read(self.directory, 'environments'), create)
+
+    def _import_schemas(self, pool, module, key, handle, depends_on, defer=None):
+        """
+        Imports global fields or content types after the items of the same module they reference.
+        Items on a reference cycle are imported without their reference fields first and then
+        updated with their full schema.
+
+        :param defer: Optional callable telling from the references of an item whether its
+        reference fields point to items not imported yet; such items are imported without them
+        :return: the uids of the deferred items, to be completed with `_complete_schemas`.
+        """
+        items = {item['uid']: _clean(item) for item in _read(self.directory, module)}
+        references = {uid: schema_references(item.get('schema')) for uid, item in items.items()}
+        deferred = {uid for uid, refs in references.items() if defer is not None and defer(refs)}
+
+        def create(uid, strip=False):
+            if strip and ((module, uid) in self.uids or (f"{module}:partial", uid) in self.uids):
+                return
+            if not strip and self._done(module, uid):
+                return
+            item = dict(items[uid], schema=_without_references(items[uid].get('schema'))) if strip else items[uid]
+            self._import_file(handle().imports, item)
+            if strip:
+                # The item exists without its reference fields until it is completed
+                self.uids.record(f"{module}:partial", uid, uid)
+            else:
+                self.uids.record(module, uid, uid)
+                self._count(self.created, module)
+
+        dependencies = {uid: depends_on(refs) for uid, refs in references.items()}
+        cyclic = sorted(self._run_graph(pool, dependencies, lambda uid: create(uid, uid in deferred)))
+        self._run_all(pool, cyclic, lambda uid: create(uid, strip=True))
+        self._complete_schemas(pool, module, key, handle, items, [uid for uid in cyclic if uid not in deferred])
+        return items, sorted(deferred)
+
+    def _complete_schemas(self, pool, module, key, handle, items, uids):
+        """Updates items imported without their reference fields with their full schema."""
+        def complete(uid):
+            if self._done(module, uid):
+                return
+            _checked(handle(uid).update({key: items[uid]}))
+            self.uids.record(module, uid, uid)
+            self._count(self.created, module)
+
+        self._run_all(pool, uids, complete)
+
+    def _import_assets(self, pool):
+        def upload(asset):
+            if self._done('assets', asset['uid']):
+                return
+            path = os.path.join(self.directory, 'assets', asset['uid'], asset.get('filename') or '')
+            if not os.path.isfile(path):
+                self._count(self.skipped, 'assets')
+                return
+            created = _checked(self.stack.assets().upload(path))['asset']
+            self.uids.record('assets', asset['uid'], created['uid'], created.get('_version'), asset)
+            self._count(self.created, 'assets')
+
+        self._run_all(pool, _read(self.directory, 'assets'), upload)
+
+    def _remap(self, value, resolve_entries):
+        """
+        Rewrites the asset and entry uids of an entry value to their new uids. Entry references
+        are dropped unless `resolve_entries` is set, and references to items that were not
+        imported, including file fields holding the uid of an asset that was skipped, are always
+        dropped.
+        """
+        if isinstance(value, list):
+            remapped = (self._remap(item, resolve_entries) for item in value)
+            return [item for item in remapped if item is not _DROP]
+        if isinstance(value, dict):
+            if '_content_type_uid' in value and 'uid' in value:
+                new_uid = self.uids.get('entries', value['uid']) if resolve_entries else None
+                return dict(value, uid=new_uid) if new_uid else _DROP
+            if 'uid' in value and 'filename' in value:
+                return self.uids.get('assets', value['uid']) or _DROP
+            remapped = ((key, self._remap(item, resolve_entries)) for key, item in value.items())
+            return {key: item for key, item in remapped if item is not _DROP}
+        if isinstance(value, str) and value in self._asset_uids:
+            return self.uids.get('assets', value) or _DROP
+        return value
+
+    @classmethod
+    def _has_entry_references(cls, value):
+        if isinstance(value, list):
+            return any(cls._has_entry_references(item) for item in value)
+        if isinstance(value, dict):
+            return ('_content_type_uid' in value and 'uid' in value) or \
+                any(cls._has_entry_references(item) for item in value.values())
+        return False
+
+    def _entry_locales(self):
+        """Returns the locales entries were exported in, the master locale first."""
+        locales = set()
+        for content_type_uid in self._exported_content_types():
+            directory = os.path.join(self.directory, 'entries', content_type_uid)
+            if os.path.isdir(directory):
+                locales.update(name[:-len('.ndjson')] for name in os.listdir(directory) if name.endswith('.ndjson'))
+        return sorted(locales, key=lambda code: (code != self.master, code))
+
+    def _entries(self, locale):
+        for content_type_uid in self._exported_content_types():
+            for entry in _read(self.directory, f"entries/{content_type_uid}/{locale}"):
+                yield content_type_uid, locale, entry
+
+    def _exported_content_types(self):
+        return [item['uid'] for item in _read(self.directory, 'content_types')]
+
+    def _import_entries(self, pool):
+        def save(item):
+            content_type_uid, locale, entry = item
+            if (f"entries:{locale}", entry['uid']) in self.uids:
+                self._count(self.skipped, 'entries')
+                return
+            data = self._remap(_clean(entry, keep_uid=False), resolve_entries=False)
+            new_uid = self.uids.get('entries', entry['uid'])
+            if new_uid is None:
+                handle = self.stack.content_types(content_type_uid).entry()
+                saved = self._import_file(lambda path: handle.imports(path, locale), {'entry': data})['entry']
+                self.uids.record('entries', entry['uid'], saved['uid'], saved.get('_version'), entry)
+                self._count(self.created, 'entries')
+            else:
+                # Saving an existing entry in another locale creates its localized version
+                saved = _checked(self.stack.content_types(content_type_uid).entry(new_uid).update(
+                    {'entry': data}, locale))['entry']
+                self._count(self.created, 'localized_entries')
+            self.uids.record(f"entries:{locale}", entry['uid'], saved['uid'], saved.get('_version'))
+
+        def link(item):
+            content_type_uid, locale, entry = item
+            if not self._has_entry_references(entry) or (f"entries:references:{locale}", entry['uid']) in self.uids:
+                return
+            new_uid = self.uids.get('entries', entry['uid'])
+            data = self._remap(_clean(entry, keep_uid=False), resolve_entries=True)
+            updated = _checked(self.stack.content_types(content_type_uid).entry(new_uid).update(
+                {'entry': data}, locale))['entry']
+            self.uids.record(f"entries:references:{locale}", entry['uid'], new_uid)
+            self.uids.record(f"entries:{locale}", entry['uid'], new_uid, updated.get('_version'))
+            if locale == self.master:
+                self.uids.record('entries', entry['uid'], new_uid, updated.get('_version'), entry)
+
+        # Locales are imported one after the other, so an entry missing from the master locale is
+        # created once, by the first locale it appears in
+        locales = self._entry_locales()
+        for locale in locales:
+            self._run_all(pool, self._entries(locale), save)
+        for locale in locales:
+            self._run_all(pool, self._entries(locale), link)
+
+    def _import_releases(self, pool):
+        def create(release):
+            if self._done('releases', release['uid']):
+                return
+            data = {key: release[key] for key in ('name', 'description') if release.get(key) is not None}
+            created = _checked(self.stack.releases().create({'release': data}))['release']
+            items = []
+            for item in release.get('items') or []:
+                module = 'entries' if item.get('content_type_uid') not in (None, 'built_io_upload') else 'assets'
+                new_uid = self.uids.get(module, item.get('uid'))
+                if new_uid:
+                    items.append(dict(item, uid=new_uid, version=self.uids.version(module, item['uid'])
+                                      or item.get('version')))
+            if items:
+                _checked(self.stack.releases(created['uid']).item().create_multiple({'items': items}))
+            self.uids.record('releases', release['uid'], created['uid'])
+            self._count(self.created, 'releases')
+
+        self._run_all(pool, _read(self.directory, 'releases'), create)
+
+    def run(self) -> dict:
+        """
+        Runs the import.
+
+        :return: the number of items created and skipped per module, e.g.
+        `{'created': {'entries': 120, ...}, 'skipped': {'assets': 2}}`.
+        """
+        journal, owned = open_journal(self.journal)
+        self.uids = UidMap(journal)
+        global_fields = [item['uid'] for item in _read(self.directory, 'global_fields')]
+        self._asset_uids = frozenset(item['uid'] for item in _read(self.directory, 'assets'))
+        content_types = self._exported_content_types()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                self._import_locales(pool)
+                self._import_environments(pool)
+                # Global fields referencing content types are completed once the content types exist
+                fields, deferred = self._import_schemas(
+                    pool, 'global_fields', 'global_field', self.stack.global_fields,
+                    lambda references: references[1] & set(global_fields),
+                    defer=lambda references: bool(references[0] & set(content_types)))
+                self._import_schemas(pool, 'content_types', 'content_type', self.stack.content_types,
+                                     lambda references: references[0] & set(content_types))
+                self._complete_schemas(pool, 'global_fields', 'global_field', self.stack.global_fields, fields,
+                                       deferred)
+                self._import_assets(pool)
+                self._import_entries(pool)
+                self._import_releases(pool)
+        finally:
+            if owned:
+                journal.close()
+        return {'created': dict(sorted(self.created.items())), 'skipped': dict(sorted(self.skipped.items()))}
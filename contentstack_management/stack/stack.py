@@ -23,6 +23,8 @@ from ..extensions.extension import Extension
 from ..variant_group.variant_group import VariantGroup
 from ..variants.variants import Variants
 from .._messages import API_KEY_REQUIRED, USER_ID_REQUIRED, OWNERSHIP_TOKEN_REQUIRED
+from ._export import StackExporter
+from ._import import StackImporter
 
 
 class Stack(Parameter):
@@ -35,9 +37,9 @@ class Stack(Parameter):
 
     def __init__(self, client, api_key=None):
         self.client = client
-        if api_key is not None and not '':
-            self.client.headers['api_key'] = api_key
         super().__init__(self.client)
+        if api_key is not None and not '':
+            self.add_header('api_key', api_key)
 
     def fetch(self):
         """
@@ -296,6 +298,72 @@ class Stack(Parameter):
         data = json.dumps(data)
         return self.client.post('stacks/unshare', headers=self.client.headers, params=self.params, data=data)
 
+    def export_to(self, directory, workers: int = 4, limit: int = 100, stream: bool = False, modules=None,
+                  journal=None, asset_files: bool = True):
+        """
+        Exports the stack to NDJSON files, one JSON document per line: locales, environments,
+        global fields, content types, assets metadata, taxonomies, workflows, webhooks and releases,
+        plus `entries/<content_type_uid>/<locale>.ndjson` for every content type and locale and
+        `terms/<taxonomy_uid>.ndjson` for every taxonomy. The file of every asset is downloaded to
+        `assets/<asset_uid>/<filename>`, where `import_from` uploads it from. Files are exported in
+        parallel and items are written as they are paged in. A `manifest.json` lists the item count
+        of each file.
+
+        :param directory: The directory the files are written to; it is created when missing
+        :param workers: The number of files exported at the same time, defaults to 4
+        :param limit: The number of items requested per page, defaults to 100
+        :param stream: Whether pages are decoded item by item as they are read, defaults to False
+        :param modules: The modules to export, defaults to all of them
+        :param journal: Optional checkpoint `Journal` or `SqliteJournal`, or the path of its file.
+        Completed files are recorded in it, and a run with the same journal skips them, so an
+        interrupted export can be resumed
+        :param asset_files: Whether the asset files are downloaded, defaults to True. Without them,
+        `import_from` skips the assets and drops the references to them
+        :return: the manifest, e.g. `{'files': {'content_types': 12, 'entries/blog/en-us': 3400, ...}}`.
+        -------------------------------
+        [Example:]
+            >>> import contentstack_management
+            >>> client = contentstack_management.Client(authtoken='your_authtoken')
+            >>> manifest = client.stack('api_key').export_to('backups/2026-10-17', workers=8)
+        -------------------------------
+        """
+        if 'api_key' not in self.client.headers:
+            raise Exception(API_KEY_REQUIRED)
+        return StackExporter(self, directory, workers, limit, stream, modules, journal, asset_files).run()
+
+    def import_from(self, directory, workers: int = 4, journal=None):
+        """
+        Imports a directory written by `export_to` into the stack, in dependency order: locales,
+        environments, global fields and content types (after the ones they reference), assets,
+        entries and releases. Independent items are imported concurrently. Entries are created
+        without their entry references first and linked in a second pass, so circular references
+        are restored. Entries are created in the master locale first; their exported versions in
+        other locales are then saved as localizations of the same entry.
+
+        Assets are uploaded from `assets/<uid>/<filename>` in the directory, as written by
+        `export_to`; assets without a file there are skipped, and entry fields referring to them
+        are removed rather than left pointing at the source stack. Every imported item and the uid it was given is recorded in a
+        checkpoint journal; items already in it are skipped, so an interrupted import can be run
+        again.
+
+        :param directory: The export directory
+        :param workers: The number of items imported at the same time, defaults to 4
+        :param journal: The checkpoint `Journal` or `SqliteJournal`, or the path of its file
+        (`.db` / `.sqlite` paths open a `SqliteJournal`), defaults to `<directory>/import.journal`
+        :return: the number of items created and skipped per module, e.g.
+        `{'created': {'entries': 120, ...}, 'skipped': {'assets': 2}}`.
+        -------------------------------
+        [Example:]
+            >>> import contentstack_management
+            >>> client = contentstack_management.Client(authtoken='your_authtoken')
+            >>> client.stack('source_api_key').export_to('backups/site')
+            >>> result = client.stack('target_api_key').import_from('backups/site', workers=8)
+        -------------------------------
+        """
+        if 'api_key' not in self.client.headers:
+            raise Exception(API_KEY_REQUIRED)
+        return StackImporter(self, directory, workers, journal).run()
+
     def global_fields(self, global_field_uid=None, options=None):
         return GlobalFields(self.client, global_field_uid, options)
 
@@ -4,12 +4,12 @@ The create(), read(), update(), and delete() methods each correspond to
 the CRUD operations that can be performed on the API """
 
 import json
-from ..common import Parameter
+from ..common import Paginated, Parameter
 from .._errors import ArgumentException
 from ..terms.terms import Terms
 from .._messages import TAXONOMY_UID_REQUIRED
 
-class Taxonomy(Parameter):
+class Taxonomy(Parameter, Paginated):
     """
     This class takes a base URL as an argument when it's initialized, 
     which is the endpoint for the RESTFUL API that
@@ -17,6 +17,8 @@ class Taxonomy(Parameter):
     methods each correspond to the CRUD 
     operations that can be performed on the API """
 
+    _items_key = 'taxonomies'
+
     def __init__(self, client, taxonomy_uid: str):
         self.client = client
         self.taxonomy_uid = taxonomy_uid
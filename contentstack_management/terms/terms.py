@@ -4,11 +4,11 @@ The create(), read(), update(), and delete() methods each correspond to
 the CRUD operations that can be performed on the API """
 
 import json
-from ..common import Parameter
+from ..common import Paginated, Parameter
 from .._errors import ArgumentException
 from .._messages import TAXONOMY_UID_REQUIRED, TERMS_UID_REQUIRED, TERM_STRING_REQUIRED
 
-class Terms(Parameter):
+class Terms(Parameter, Paginated):
     """
     This class takes a base URL as an argument when it's initialized, 
     which is the endpoint for the RESTFUL API that
@@ -16,6 +16,8 @@ class Terms(Parameter):
     methods each correspond to the CRUD 
     operations that can be performed on the API """
 
+    _items_key = 'terms'
+
     def __init__(self, client, taxonomy_uid: str, terms_uid: str):
         self.client = client
         self.taxonomy_uid = taxonomy_uid
@@ -48,6 +48,28 @@ class UserSession:
         :return: the response object.
         """
         
+        data = self._login_data(email, password, tfa_token)
+        response = self.client.post(_path, headers=self.client.headers, data=data, json_data=None)
+        self._store_authtoken(response)
+        return response
+
+    async def login_async(self, email=None, password=None, tfa_token=None):
+        """
+        Awaitable variant of `login` for clients built on the asynchronous API client.
+
+        :return: the response object.
+        """
+
+        data = self._login_data(email, password, tfa_token)
+        response = await self.client.post(_path, headers=self.client.headers, data=data, json_data=None)
+        self._store_authtoken(response)
+        return response
+
+    def _login_data(self, email, password, tfa_token):
+        """
+        Validates the credentials and builds the JSON body of the login request.
+        """
+
         if email is None or email == '':
             raise PermissionError(
                 EMAIL_ID_REQUIRED)
@@ -66,12 +88,16 @@ class UserSession:
         if tfa_token is not None:
             data["user"]["tfa_token"] = tfa_token
 
-        data = json.dumps(data)
-        response = self.client.post(_path, headers=self.client.headers, data=data, json_data=None)
+        return json.dumps(data)
+
+    def _store_authtoken(self, response):
+        """
+        Stores the authtoken of a successful login response on the client headers.
+        """
+
         if response.status_code == 200:
             res = response.json()
             self.client.headers['authtoken'] = res['user']['authtoken']
-        return response
 
     def logout(self):
         """
@@ -84,3 +110,14 @@ class UserSession:
         if response.status_code == 200:
             self.client.headers['authtoken'] = None
         return response
+
+    async def logout_async(self):
+        """
+        Awaitable variant of `logout` for clients built on the asynchronous API client.
+        :return: the response object.
+        """
+
+        response = await self.client.delete(_path, headers=self.client.headers, params=None)
+        if response.status_code == 200:
+            self.client.headers['authtoken'] = None
+        return response
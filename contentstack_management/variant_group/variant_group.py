@@ -4,12 +4,12 @@ The create(), read(), update(), and delete() methods each correspond to
 the CRUD operations that can be performed on the API """
 
 import json
-from ..common import Parameter
+from ..common import Paginated, Parameter
 from .._errors import ArgumentException
 from ..variants.variants import Variants
 from .._messages import VARIANT_GROUP_UID_REQUIRED
 
-class VariantGroup(Parameter):
+class VariantGroup(Parameter, Paginated):
     """
     This class takes a base URL as an argument when it's initialized, 
     which is the endpoint for the RESTFUL API that
@@ -17,6 +17,8 @@ class VariantGroup(Parameter):
     methods each correspond to the CRUD 
     operations that can be performed on the API """
 
+    _items_key = 'variant_groups'
+
     def __init__(self, client, variant_group_uid: str = None):
         self.client = client
         self.variant_group_uid = variant_group_uid
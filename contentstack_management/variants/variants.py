@@ -4,11 +4,11 @@ The create(), read(), update(), and delete() methods each correspond to
 the CRUD operations that can be performed on the API """
 
 import json
-from ..common import Parameter
+from ..common import Paginated, Parameter
 from .._errors import ArgumentException
 from .._messages import VARIANT_UIDS_NON_EMPTY_LIST_REQUIRED, VARIANT_GROUP_UID_REQUIRED, VARIANT_UID_REQUIRED
 
-class Variants(Parameter):
+class Variants(Parameter, Paginated):
     """
     This class takes a base URL as an argument when it's initialized, 
     which is the endpoint for the RESTFUL API that
@@ -16,6 +16,8 @@ class Variants(Parameter):
     methods each correspond to the CRUD 
     operations that can be performed on the API """
 
+    _items_key = 'variants'
+
     def __init__(self, client, variant_group_uid: str = None, variant_uid: str = None):
         self.client = client
         self.variant_group_uid = variant_group_uid
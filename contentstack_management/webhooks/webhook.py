@@ -5,6 +5,7 @@ the CRUD operations that can be performed on the API """
 
 import json
 from ..common import Parameter
+from .._multipart import send_multipart
 from .._messages import WEBHOOK_UID_REQUIRED, WEBHOOK_FILE_PATH_REQUIRED, WEBHOOK_EXECUTION_UID_REQUIRED
 
 class Webhook(Parameter):
@@ -190,11 +191,9 @@ class Webhook(Parameter):
         
         if self.webhook_uid is None:
             raise Exception(WEBHOOK_UID_REQUIRED)
-        if self.client.headers['Content-Type'] is not None:
-            self.client.headers.pop('Content-Type')
         url = f"{self.path}/{self.webhook_uid}"
         
-        return self.client.delete(url, headers = self.client.headers, params = self.params)
+        return self.client.delete(url, headers = {**self.client.headers, 'Content-Type': None}, params = self.params)
     
     def imports(self, file_path):
         """
@@ -221,9 +220,8 @@ class Webhook(Parameter):
         if file_path is None:
             raise Exception(WEBHOOK_FILE_PATH_REQUIRED)
         url = f"{self.path}/import"
-        self.client.headers['Content-Type'] = "multipart/form-data"
-        files = {'entry': open(f"{file_path}",'rb')}
-        return self.client.post(url, headers = self.client.headers, files = files, params = self.params)
+        fields = {'entry': (None, file_path, None)}
+        return send_multipart(self.client.post, url, fields, headers = self.client.headers, params = self.params)
     
     def export(self):
         """
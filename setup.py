@@ -73,6 +73,7 @@ setup(
     ],
     extras_require={
         "dev": ["pytest>=7.0", "twine>=4.0.2", "packaging>=24.0", "dotenv>=0.0.5"],
+        "async": ["httpx>=0.27.0,<1.0.0"],
     },
     python_requires=">=3.9",
 )
@@ -0,0 +1,10 @@
+from contentstack_management._transport import _build_response
+
+
+def make_response(status_code=200, headers=None, content=b'{}'):
+    """
+    Builds a real `requests.Response` for unit tests that patch the HTTP layer.
+    """
+
+    return _build_response('GET', 'https://api.contentstack.io/v3/', {}, status_code, None,
+                           headers or {}, content)
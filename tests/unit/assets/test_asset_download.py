@@ -0,0 +1,194 @@
+import os
+import re
+import tempfile
+import threading
+import unittest
+
+import requests
+
+import contentstack_management
+from contentstack_management import DownloadResult
+from contentstack_management._retry import RetryPolicy
+from contentstack_management._transport import StubTransport, _build_response
+
+
+class _Body:
+    """A streamed body that drops the connection after `cut` bytes."""
+
+    def __init__(self, content, cut=None):
+        self.content = content
+        self.cut = cut
+        self.position = 0
+
+    def read(self, size=-1, **kwargs):
+        if self.cut is not None and self.position >= self.cut:
+            raise requests.exceptions.ChunkedEncodingError('Connection broken')
+        end = len(self.content) if size is None or size < 0 else self.position + size
+        if self.cut is not None:
+            end = min(end, self.cut)
+        chunk = self.content[self.position:end]
+        self.position += len(chunk)
+        return chunk
+
+    def close(self):
+        pass
+
+
+class _FileServer(StubTransport):
+    """Serves asset files by uid, honoring Range requests and cutting connections on demand."""
+
+    def __init__(self, files):
+        super().__init__()
+        self.files = files
+        self.cuts = {}
+        self.truncations = {}
+        self.etag = '"v1"'
+        self._cut_lock = threading.Lock()
+
+    def request(self, method, url, headers=None, params=None, data=None, json=None, files=None, timeout=None,
+                stream=False):
+        self.calls.append(_build_response(method, url, headers or {}, 200, None, {}, b'').request)
+        uid = url.rsplit('/', 1)[1]
+        content = self.files.get(uid)
+        if content is None:
+            return _build_response(method, url, headers, 404, 'Not Found', {'Content-Type': 'application/json'},
+                                   b'{"error_message": "Asset not found"}')
+        start, status, response_headers = 0, 200, {'ETag': self.etag}
+        match = re.match(r'bytes=(\d+)-', headers.get('Range', ''))
+        if match and headers.get('If-Range', self.etag) == self.etag:
+            start = int(match.group(1))
+            if start >= len(content):
+                return _build_response(method, url, headers, 416, None, {'Content-Range': f"bytes */{len(content)}"},
+                                       b'')
+            status = 206
+            response_headers['Content-Range'] = f"bytes {start}-{len(content) - 1}/{len(content)}"
+        response_headers['Content-Length'] = str(len(content) - start)
+        with self._cut_lock:
+            cut = self.cuts.get(uid, [None]).pop(0) if self.cuts.get(uid) else None
+            end = self.truncations.get(uid, [None]).pop(0) if self.truncations.get(uid) else None
+        body = content[start:] if end is None else content[start:start + end]
+        return _build_response(method, url, headers, status, None, response_headers, None, _Body(body, cut))
+
+
+class AssetDownloadUnitTests(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.content = os.urandom(300 * 1024)
+        self.transport = _FileServer({'video': self.content, 'image': b'image-bytes'})
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport,
+                                                     retry_policy=RetryPolicy(max_retries=0))
+        self.stack = self.client.stack('api_key')
+
+    def _read(self, path):
+        with open(path, 'rb') as file:
+            return file.read()
+
+    def test_download_streams_to_file(self):
+        """Test that an asset is written to its path in chunks"""
+        path = os.path.join(self.directory, 'media', 'video.mp4')
+        self.assertEqual(self.stack.assets('video').download_to(path, chunk_size=16 * 1024), path)
+        self.assertEqual(self._read(path), self.content)
+        self.assertFalse(os.path.exists(path + '.part'))
+        request = self.transport.calls[0]
+        self.assertTrue(request.url.endswith('assets/api_key/video'))
+        self.assertEqual(request.headers['Accept-Encoding'], 'identity')
+
+    def test_interrupted_download_resumes_with_range(self):
+        """Test that a dropped connection is resumed from the bytes already written"""
+        self.transport.cuts['video'] = [100 * 1024, 50 * 1024]
+        path = os.path.join(self.directory, 'video.mp4')
+        self.stack.assets('video').download_to(path, chunk_size=8 * 1024)
+        self.assertEqual(self._read(path), self.content)
+        ranges = [request.headers.get('Range') for request in self.transport.calls]
+        self.assertEqual(ranges, [None, f"bytes={100 * 1024}-", f"bytes={150 * 1024}-"])
+        self.assertEqual(self.transport.calls[1].headers['If-Range'], '"v1"')
+
+    def _leave_part(self, path, content, etag=None):
+        with open(path + '.part', 'wb') as file:
+            file.write(content)
+        if etag is not None:
+            with open(path + '.part.etag', 'w', encoding='utf-8') as file:
+                file.write(etag)
+
+    def test_partial_file_from_earlier_run_is_resumed(self):
+        """Test that a .part file left behind is resumed with the validator it was downloaded with"""
+        path = os.path.join(self.directory, 'video.mp4')
+        self._leave_part(path, self.content[:1000], '"v1"')
+        self.stack.assets('video').download_to(path)
+        self.assertEqual(self._read(path), self.content)
+        self.assertEqual(self.transport.calls[0].headers['Range'], 'bytes=1000-')
+        self.assertEqual(self.transport.calls[0].headers['If-Range'], '"v1"')
+        self.assertFalse(os.path.exists(path + '.part.etag'))
+        self._leave_part(path, self.content, '"v1"')
+        self.stack.assets('video').download_to(path)
+        self.assertEqual(self._read(path), self.content)
+
+    def test_partial_file_of_replaced_asset_is_restarted(self):
+        """Test that a .part file of an older version of the asset is not joined with the new one"""
+        path = os.path.join(self.directory, 'video.mp4')
+        self._leave_part(path, os.urandom(1000), '"v0"')
+        self.stack.assets('video').download_to(path)
+        self.assertEqual(self._read(path), self.content)
+
+    def test_partial_file_without_validator_is_restarted(self):
+        """Test that a .part file whose version is unknown is downloaded again from the start"""
+        path = os.path.join(self.directory, 'video.mp4')
+        self._leave_part(path, os.urandom(1000))
+        self.stack.assets('video').download_to(path)
+        self.assertEqual(self._read(path), self.content)
+        self.assertNotIn('Range', self.transport.calls[0].headers)
+
+    def test_size_mismatch_is_rejected(self):
+        """Test that a file whose size differs from the expected size is not moved to its path"""
+        path = os.path.join(self.directory, 'image.png')
+        with self.assertRaises(Exception):
+            self.stack.assets('image').download_to(path, size=5, max_resumes=0)
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(self._read(path + '.part'), b'image-bytes')
+
+    def test_short_download_keeps_part_for_next_call(self):
+        """Test that a download still short after its resumes keeps its part and a later call resumes it"""
+        self.transport.truncations['video'] = [1000]
+        path = os.path.join(self.directory, 'video.mp4')
+        with self.assertRaises(Exception):
+            self.stack.assets('video').download_to(path, max_resumes=0)
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(os.path.getsize(path + '.part'), 1000)
+        sent = len(self.transport.calls)
+        self.stack.assets('video').download_to(path)
+        self.assertEqual(self._read(path), self.content)
+        self.assertEqual(self.transport.calls[sent].headers['Range'], 'bytes=1000-')
+        self.assertEqual(self.transport.calls[sent].headers['If-Range'], '"v1"')
+
+    def test_too_many_interruptions_fail(self):
+        """Test that a download failing more than max_resumes times raises and keeps its part"""
+        self.transport.cuts['video'] = [1024] * 3
+        path = os.path.join(self.directory, 'video.mp4')
+        with self.assertRaises(requests.RequestException):
+            self.stack.assets('video').download_to(path, max_resumes=2)
+        self.assertEqual(os.path.getsize(path + '.part'), 3 * 1024)
+        sent = len(self.transport.calls)
+        self.stack.assets('video').download_to(path)
+        self.assertEqual(self._read(path), self.content)
+        self.assertEqual(self.transport.calls[sent].headers['Range'], f"bytes={3 * 1024}-")
+
+    def test_download_many(self):
+        """Test that many assets are downloaded in parallel and failures are reported"""
+        self.transport.cuts['video'] = [64 * 1024]
+        targets = {'video': os.path.join(self.directory, 'video.mp4'),
+                   'image': os.path.join(self.directory, 'image.png'),
+                   'missing': os.path.join(self.directory, 'missing.bin')}
+        result = self.stack.assets().download_many(targets, workers=3)
+        self.assertIsInstance(result, DownloadResult)
+        self.assertEqual(sorted(result.paths), ['image', 'video'])
+        self.assertEqual(self._read(targets['video']), self.content)
+        self.assertEqual(result.bytes_received, len(self.content) + len(b'image-bytes'))
+        self.assertEqual(result.failures, [{'uid': 'missing', 'path': targets['missing'], 'status_code': 404,
+                                            'error': 'Asset not found'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
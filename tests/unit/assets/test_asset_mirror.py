@@ -0,0 +1,104 @@
+import json
+import os
+import tempfile
+import unittest
+
+import contentstack_management
+from contentstack_management._retry import RetryPolicy
+from contentstack_management._transport import StubTransport
+
+
+def _asset(uid, filename, content, parent_uid=None, version=1, updated_at='2026-01-01T00:00:00.000Z'):
+    return {'uid': uid, 'filename': filename, 'parent_uid': parent_uid, '_version': version,
+            'updated_at': updated_at, 'file_size': str(len(content))}
+
+
+class AssetMirrorUnitTests(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.folders = [{'uid': 'f_media', 'name': 'media', 'is_dir': True, 'parent_uid': None},
+                        {'uid': 'f_photos', 'name': 'photos', 'is_dir': True, 'parent_uid': 'f_media'}]
+        self.files = {'a_logo': b'logo', 'a_beach': b'beach', 'a_doc': b'doc'}
+        self.assets = [_asset('a_logo', 'logo.png', b'logo'),
+                       _asset('a_beach', 'beach.jpg', b'beach', parent_uid='f_photos'),
+                       _asset('a_doc', 'beach.jpg', b'doc', parent_uid='f_photos')]
+
+    def _mirror(self, **kwargs):
+        self.transport = StubTransport()
+        items = self.folders + self.assets
+        self.transport.add('GET', 'assets', json={'assets': items, 'count': len(items)})
+        for uid, content in self.files.items():
+            self.transport.add('GET', f"api_key/{uid}", content=content)
+        client = contentstack_management.Client(authtoken='authtoken', transport=self.transport,
+                                                retry_policy=RetryPolicy(max_retries=0))
+        return client.stack('api_key').assets().mirror(self.directory, **kwargs)
+
+    def _downloads(self):
+        return sorted(call.url.rsplit('/', 1)[1] for call in self.transport.calls if '/api_key/' in call.url)
+
+    def _read(self, *path):
+        with open(os.path.join(self.directory, *path), 'rb') as file:
+            return file.read()
+
+    def test_mirror_matches_folder_hierarchy(self):
+        """Test that assets are written under their folder path and recorded in the manifest"""
+        summary = self._mirror(workers=2)
+        self.assertEqual(summary['downloaded'], 3)
+        self.assertEqual(self._read('logo.png'), b'logo')
+        self.assertEqual(self._read('media', 'photos', 'beach.jpg'), b'beach')
+        self.assertEqual(self._read('media', 'photos', 'a_doc-beach.jpg'), b'doc')
+        self.assertEqual(self.transport.calls[0].params['include_folders'], True)
+        with open(os.path.join(self.directory, '.mirror.json'), encoding='utf-8') as file:
+            manifest = json.load(file)['assets']
+        self.assertEqual(manifest['a_beach']['path'], 'media/photos/beach.jpg')
+        self.assertEqual(manifest['a_beach']['version'], 1)
+        self.assertEqual(manifest['a_beach']['size'], 5)
+        self.assertEqual(len(manifest['a_beach']['checksum']), 64)
+
+    def test_only_changed_assets_are_downloaded(self):
+        """Test that a second run only downloads assets whose version changed"""
+        self._mirror()
+        self.assets[1] = _asset('a_beach', 'beach.jpg', b'beach v2', parent_uid='f_photos', version=2)
+        self.files['a_beach'] = b'beach v2'
+        summary = self._mirror()
+        self.assertEqual(self._downloads(), ['a_beach'])
+        self.assertEqual((summary['downloaded'], summary['unchanged']), (1, 2))
+        self.assertEqual(self._read('media', 'photos', 'beach.jpg'), b'beach v2')
+
+    def test_moved_and_deleted_assets(self):
+        """Test that moved assets are moved locally and deleted assets removed, without downloads"""
+        self._mirror()
+        self.folders[1]['name'] = 'pictures'
+        del self.assets[0]
+        summary = self._mirror()
+        self.assertEqual(self._downloads(), [])
+        self.assertEqual((summary['moved'], summary['deleted']), (2, 1))
+        self.assertEqual(self._read('media', 'pictures', 'beach.jpg'), b'beach')
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'logo.png')))
+
+    def test_verify_downloads_locally_modified_files(self):
+        """Test that verify compares checksums and downloads files changed on disk"""
+        self._mirror()
+        with open(os.path.join(self.directory, 'logo.png'), 'wb') as file:
+            file.write(b'LOGO')
+        self._mirror()
+        self.assertEqual(self._downloads(), [])
+        self._mirror(verify=True)
+        self.assertEqual(self._downloads(), ['a_logo'])
+        self.assertEqual(self._read('logo.png'), b'logo')
+
+    def test_failed_downloads_are_retried_next_run(self):
+        """Test that an asset that failed to download is reported and not recorded"""
+        del self.files['a_doc']
+        summary = self._mirror()
+        self.assertEqual([failure['uid'] for failure in summary['failures']], ['a_doc'])
+        self.files['a_doc'] = b'doc'
+        summary = self._mirror()
+        self.assertEqual(self._downloads(), ['a_doc'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+
+import contentstack_management
+from contentstack_management import Journal
+from contentstack_management._retry import RetryPolicy
+from contentstack_management._transport import StubTransport
+
+
+class AssetSyncUnitTests(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        index_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(index_directory.cleanup)
+        self.index = os.path.join(index_directory.name, 'assets.index')
+        self.transport = StubTransport()
+        self.transport.add('POST', 'assets', json={'asset': {'uid': 'new_uid'}})
+        self.transport.add('PUT', 'assets/new_uid', json={'asset': {'uid': 'new_uid'}})
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport,
+                                                     retry_policy=RetryPolicy(max_retries=0))
+        self.assets = self.client.stack('api_key').assets()
+        self._write('logo.png', b'logo')
+        self._write('photos/beach.jpg', b'beach')
+
+    def _write(self, name, content):
+        path = os.path.join(self.directory, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as file:
+            file.write(content)
+
+    def _requests(self, method):
+        return [call for call in self.transport.calls if call.method == method]
+
+    def test_first_sync_uploads_everything(self):
+        """Test that files missing from the index are uploaded and recorded"""
+        result = self.assets.sync(self.directory, self.index, folder_uid='folder_uid', workers=2)
+        self.assertTrue(result.ok)
+        self.assertEqual(result.uploaded, 2)
+        self.assertEqual(len(self._requests('POST')), 2)
+        self.assertTrue(all(b'name="asset[parent_uid]"' in call.data for call in self._requests('POST')))
+        with Journal(self.index) as index:
+            self.assertEqual(index.get('assets/photos/beach.jpg'), {'uid': 'new_uid'})
+
+    def test_unchanged_files_are_skipped(self):
+        """Test that a second sync of unchanged files sends no request"""
+        self.assets.sync(self.directory, self.index)
+        calls = len(self.transport.calls)
+        result = self.assets.sync(self.directory, self.index)
+        self.assertEqual(len(self.transport.calls), calls)
+        self.assertEqual(result.skipped, 2)
+        self.assertEqual(result.assets, [{'uid': 'new_uid'}, {'uid': 'new_uid'}])
+        self.assertEqual(result.bytes_sent, 0)
+
+    def test_changed_files_replace_their_asset(self):
+        """Test that only files whose content changed are sent, with a replace"""
+        self.assets.sync(self.directory, self.index)
+        self._write('photos/beach.jpg', b'beach at sunset')
+        self._write('new.gif', b'gif')
+        result = self.assets.sync(self.directory, self.index)
+        self.assertEqual(result.actions, ['skipped', 'uploaded', 'replaced'])
+        self.assertEqual(len(self._requests('PUT')), 1)
+        self.assertIn(b'beach at sunset', self._requests('PUT')[0].data)
+
+    def test_deleted_asset_is_uploaded_again(self):
+        """Test that a changed file whose asset no longer exists is uploaded as a new asset"""
+        logo = os.path.join(self.directory, 'logo.png')
+        self.assets.sync([logo], self.index, root=self.directory)
+        self._write('logo.png', b'new logo')
+        transport = StubTransport()
+        transport.add('PUT', 'assets/new_uid', status_code=404, json={'error_message': 'Asset not found'})
+        transport.add('POST', 'assets', json={'asset': {'uid': 'other_uid'}})
+        client = contentstack_management.Client(authtoken='authtoken', transport=transport,
+                                                retry_policy=RetryPolicy(max_retries=0))
+        result = client.stack('api_key').assets().sync([logo], self.index, root=self.directory)
+        self.assertEqual(result.actions, ['uploaded'])
+        self.assertEqual([call.method for call in transport.calls], ['PUT', 'POST'])
+        with Journal(self.index) as index:
+            self.assertEqual(index.get('assets/logo.png'), {'uid': 'other_uid'})
+
+    def test_failed_upload_is_not_recorded(self):
+        """Test that a file whose upload failed is sent again by the next sync"""
+        transport = StubTransport()
+        transport.add('POST', 'assets', status_code=422, json={'error_message': 'Invalid file'})
+        client = contentstack_management.Client(authtoken='authtoken', transport=transport,
+                                                retry_policy=RetryPolicy(max_retries=0))
+        result = client.stack('api_key').assets().sync(self.directory, self.index)
+        self.assertEqual([failure['error'] for failure in result.failures], ['Invalid file', 'Invalid file'])
+        result = self.assets.sync(self.directory, self.index)
+        self.assertEqual(result.uploaded, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import json
+import threading
+import time
+import unittest
+
+import requests
+
+import contentstack_management
+from contentstack_management import FolderTree
+from contentstack_management._transport import StubTransport, _build_response
+
+
+def _folder(uid, name, parent_uid=None):
+    return {'uid': uid, 'name': name, 'is_dir': True, 'parent_uid': parent_uid}
+
+
+FOLDERS = [
+    _folder('media', 'media'), _folder('docs', 'docs'),
+    _folder('photos', 'photos', 'media'), _folder('videos', 'videos', 'media'), _folder('legal', 'legal', 'docs'),
+    _folder('y2025', '2025', 'photos'), _folder('y2026', '2026', 'photos'), _folder('raw', 'raw', 'videos'),
+]
+
+
+def _json_body(body):
+    return json.dumps(body).encode('utf-8')
+
+
+class _FolderServer(StubTransport):
+    """Lists the subfolders of the `folder` param, recording how many requests overlap."""
+
+    def __init__(self, folders):
+        super().__init__()
+        self.folders = folders
+        self.active = 0
+        self.peak = 0
+        self._count_lock = threading.Lock()
+
+    def request(self, method, url, headers=None, params=None, data=None, json=None, files=None, timeout=None,
+                stream=False):
+        with self._count_lock:
+            self.calls.append(params)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self._count_lock:
+            self.active -= 1
+        items = [folder for folder in self.folders if folder['parent_uid'] == params.get('folder')]
+        page = items[params['skip']:params['skip'] + params['limit']]
+        body = {'assets': page, 'count': len(items)} if params.get('include_count') else {'assets': page}
+        return _build_response(method, url, headers, 200, 'OK', {'Content-Type': 'application/json'},
+                               _json_body(body))
+
+
+class FolderTreeUnitTests(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = _FolderServer(FOLDERS)
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport)
+        self.assets = self.client.stack('api_key').assets()
+
+    def test_walk_builds_tree_index(self):
+        """Test that every folder is found with its path and children"""
+        tree = self.assets.folder_tree(workers=4)
+        self.assertIsInstance(tree, FolderTree)
+        self.assertEqual(len(tree), 8)
+        self.assertEqual(tree.path('y2026'), 'media/photos/2026')
+        self.assertEqual(tree.children(), ['docs', 'media'])
+        self.assertEqual(tree.children('photos'), ['y2025', 'y2026'])
+        self.assertEqual(tree.find('media/videos/raw'), 'raw')
+        self.assertIsNone(tree.find('media/audio'))
+        self.assertEqual(list(tree.descendants('media')), ['photos', 'videos', 'y2025', 'y2026', 'raw'])
+        self.assertEqual(len(self.transport.calls), 9)
+        self.assertTrue(all(params['include_folders'] and json.loads(params['query']) == {'is_dir': True}
+                            for params in self.transport.calls))
+
+    def test_folder_filter_is_sent_as_json(self):
+        """Test that the is_dir filter reaches the URL as a JSON query, not as its keys"""
+        transport = StubTransport()
+        transport.add('GET', 'assets', json={'assets': [], 'count': 0})
+        client = contentstack_management.Client(authtoken='authtoken', transport=transport)
+        client.stack('api_key').assets().folder_tree()
+        request = requests.Request('GET', 'https://api.contentstack.io/v3/assets',
+                                   params=transport.calls[0].params).prepare()
+        self.assertIn('query=%7B%22is_dir%22%3A+true%7D', request.url)
+
+    def test_levels_are_expanded_concurrently(self):
+        """Test that sibling folders are requested at the same time, within the worker bound"""
+        self.assets.folder_tree(workers=2)
+        self.assertEqual(self.transport.peak, 2)
+
+    def test_walk_from_folder_with_max_depth(self):
+        """Test that a walk can start below the root and stop after a number of levels"""
+        tree = self.assets.folder_tree('media', max_depth=1)
+        self.assertEqual(sorted(tree), ['photos', 'videos'])
+        self.assertEqual(tree.path('photos'), 'photos')
+        self.assertEqual(len(self.transport.calls), 1)
+
+    def test_paged_subfolders(self):
+        """Test that folders with more subfolders than the page limit are followed page by page"""
+        tree = self.assets.folder_tree(limit=1)
+        self.assertEqual(len(tree), 8)
+
+    def test_tree_round_trips_through_dict(self):
+        """Test that a tree can be cached as JSON and queried again without requests"""
+        tree = self.assets.folder_tree()
+        calls = len(self.transport.calls)
+        cached = FolderTree.from_dict(json.loads(json.dumps(tree.to_dict())))
+        self.assertEqual(cached.path('raw'), 'media/videos/raw')
+        self.assertEqual(cached.children('media'), ['photos', 'videos'])
+        self.assertEqual(len(self.transport.calls), calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
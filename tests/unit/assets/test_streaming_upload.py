@@ -0,0 +1,168 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from requests_toolbelt.multipart.decoder import MultipartDecoder
+
+import contentstack_management
+from contentstack_management._multipart import MultipartBody
+from contentstack_management._retry import RetryPolicy
+from contentstack_management._transport import StubTransport
+
+
+class _RecordingTransport(StubTransport):
+    """Reads streamed bodies chunk by chunk, recording the chunk sizes and open files."""
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+        self.open_files = []
+
+    def request(self, method, url, headers=None, params=None, data=None, json=None, files=None, timeout=None,
+                stream=False):
+        if isinstance(data, MultipartBody):
+            self.open_files.append([not file.closed for file in data._files])
+            chunks = list(iter(lambda: data.read(64 * 1024), b''))
+            self.chunks.append([len(chunk) for chunk in chunks])
+            data = b''.join(chunks)
+        return super().request(method, url, headers, params, data, json, files, timeout, stream)
+
+
+def _parts(call):
+    decoder = MultipartDecoder(call.data, call.headers['Content-Type'])
+    return {part.headers[b'Content-Disposition'].decode(): (part.headers.get(b'Content-Type'), part.content)
+            for part in decoder.parts}
+
+
+class StreamingUploadUnitTests(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.transport = _RecordingTransport()
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport,
+                                                     retry_policy=RetryPolicy(backoff_factor=0))
+
+    def _file(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as file:
+            file.write(content)
+        return path
+
+    def test_upload_streams_file_in_chunks(self):
+        """Test that an asset upload is read from disk in chunks and sent as multipart form data"""
+        content = os.urandom(300 * 1024)
+        path = self._file('video.mp4', content)
+        self.transport.add('POST', 'assets', json={'asset': {'uid': 'asset_uid'}})
+        response = self.client.stack('api_key').assets().upload(path)
+        self.assertEqual(response.json()['asset']['uid'], 'asset_uid')
+        call = self.transport.calls[0]
+        self.assertTrue(call.headers['Content-Type'].startswith('multipart/form-data; boundary='))
+        self.assertEqual(int(call.headers['Content-Length']), len(call.data))
+        self.assertTrue(all(size <= 64 * 1024 for size in self.transport.chunks[0]))
+        parts = _parts(call)
+        self.assertEqual(parts['form-data; name="asset[upload]"; filename="video.mp4"'], (b'video/mp4', content))
+        self.assertEqual(self.transport.open_files, [[True]])
+
+    def test_files_are_closed(self):
+        """Test that the uploaded file is closed after the request, including when it fails"""
+        path = self._file('image.png', b'image')
+        self.transport.add('POST', 'assets', error=ConnectionError('reset'))
+        opened = []
+        original = MultipartBody.__init__
+
+        def record(body, fields, progress=None):
+            original(body, fields, progress)
+            opened.extend(body._files)
+
+        MultipartBody.__init__ = record
+        try:
+            with self.assertRaises(ConnectionError):
+                self.client.stack('api_key').assets().upload(path)
+            self.transport.add('PUT', 'assets/asset_uid', json={'notice': 'replaced'})
+            self.client.stack('api_key').assets('asset_uid').replace(path)
+        finally:
+            MultipartBody.__init__ = original
+        self.assertEqual(len(opened), 2)
+        self.assertTrue(all(file.closed for file in opened))
+
+    def test_retried_upload_resends_the_whole_body(self):
+        """Test that a streamed upload is rewound and sent again when it is retried"""
+        path = self._file('image.png', b'image-bytes')
+        self.transport.add('PUT', 'assets/asset_uid', status_code=503)
+        self.transport.add('PUT', 'assets/asset_uid', json={'notice': 'replaced'})
+        response = self.client.stack('api_key').assets('asset_uid').replace(path)
+        self.assertEqual(response.status_code, 200)
+        first, second = self.transport.calls
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(_parts(second)['form-data; name="asset"; filename="image.png"'][1], b'image-bytes')
+
+    def test_imports_are_streamed(self):
+        """Test that entry, content type, global field and webhook imports send the file as multipart"""
+        path = self._file('import.json', json.dumps({'uid': 'blog'}).encode('utf-8'))
+        stack = self.client.stack('api_key')
+        imports = {
+            'content_types/blog/entries/import': ('entry', lambda: stack.content_types('blog').entry().imports(path)),
+            'content_types/import': ('content_type', lambda: stack.content_types().imports(path)),
+            'global_fields/import': ('global_field', lambda: stack.global_fields().imports(path)),
+            'webhooks/import': ('entry', lambda: stack.webhooks().imports(path)),
+        }
+        for route, (field, call) in imports.items():
+            self.transport.add('POST', route, json={'notice': 'imported'})
+            call()
+            parts = _parts(self.transport.calls[-1])
+            self.assertEqual(parts[f'form-data; name="{field}"; filename="import.json"'][1], b'{"uid": "blog"}')
+
+    def test_upload_from_memory(self):
+        """Test that bytes and memoryviews are uploaded with the given filename and MIME type"""
+        self.transport.add('POST', 'assets', json={'asset': {'uid': 'asset_uid'}})
+        assets = self.client.stack('api_key').assets()
+        assets.upload(b'png-bytes', filename='thumbnail.png')
+        pixels = bytearray(b'0123456789')
+        assets.upload(memoryview(pixels)[2:6], filename='slice.bin', content_type='application/x-pixels')
+        first, second = (_parts(call) for call in self.transport.calls)
+        self.assertEqual(first['form-data; name="asset[upload]"; filename="thumbnail.png"'],
+                         (b'image/png', b'png-bytes'))
+        self.assertEqual(second['form-data; name="asset[upload]"; filename="slice.bin"'],
+                         (b'application/x-pixels', b'2345'))
+
+    def test_upload_from_file_object(self):
+        """Test that a file object is uploaded from its current position and left open"""
+        self.transport.add('PUT', 'assets/asset_uid', status_code=503)
+        self.transport.add('PUT', 'assets/asset_uid', json={'notice': 'replaced'})
+        buffer = io.BytesIO(b'header:image-data')
+        buffer.seek(7)
+        self.client.stack('api_key').assets('asset_uid').replace(buffer, filename='image.jpg')
+        self.assertFalse(buffer.closed)
+        first, second = self.transport.calls
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(_parts(second)['form-data; name="asset"; filename="image.jpg"'], (b'image/jpeg', b'image-data'))
+
+    def test_upload_from_stream(self):
+        """Test that non-seekable streams and named files are uploaded"""
+        self.transport.add('POST', 'assets', json={'asset': {'uid': 'asset_uid'}})
+        read, write = os.pipe()
+        os.write(write, b'streamed')
+        os.close(write)
+        assets = self.client.stack('api_key').assets()
+        with os.fdopen(read, 'rb', buffering=0) as stream:
+            assets.upload(stream, filename='stream.txt')
+        path = self._file('report.pdf', b'%PDF')
+        with open(path, 'rb') as file:
+            assets.upload(file)
+        first, second = (_parts(call) for call in self.transport.calls)
+        self.assertEqual(first['form-data; name="asset[upload]"; filename="stream.txt"'], (b'text/plain', b'streamed'))
+        self.assertEqual(second['form-data; name="asset[upload]"; filename="report.pdf"'], (b'application/pdf', b'%PDF'))
+
+    def test_filename_required_for_content(self):
+        """Test that uploading content without a file name is rejected"""
+        with self.assertRaises(Exception):
+            self.client.stack('api_key').assets().upload(b'bytes')
+        self.assertEqual(self.transport.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from requests_toolbelt.multipart.decoder import MultipartDecoder
+
+import contentstack_management
+from contentstack_management import UploadResult
+from contentstack_management._retry import RetryPolicy
+from contentstack_management._transport import StubTransport
+
+
+class _UploadTransport(StubTransport):
+    """Answers uploads with the uploaded filename as uid, failing files named `bad*`."""
+
+    def __init__(self):
+        super().__init__()
+        self.active = 0
+        self.peak = 0
+        self._count_lock = threading.Lock()
+
+    def request(self, method, url, headers=None, params=None, data=None, json=None, files=None, timeout=None,
+                stream=False):
+        with self._count_lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            body = b"".join(iter(lambda: data.read(16 * 1024), b""))
+            time.sleep(0.02)
+            parts = MultipartDecoder(body, headers['Content-Type']).parts
+            fields = {part.headers[b'Content-Disposition'].decode(): part.content for part in parts}
+            upload = next(key for key in fields if 'asset[upload]' in key)
+            filename = upload.split('filename="')[1].rstrip('"')
+            route = f"assets/{filename}"
+            if filename.startswith('bad'):
+                self.add(method, route, status_code=422, json={'error_message': 'File type not allowed'})
+            else:
+                self.add(method, route, json={'asset': {'uid': filename,
+                                                        'parent_uid': (fields.get('form-data; name="asset[parent_uid]"') or b'').decode()}})
+            return super().request(method, f"{url}/{filename}", headers, params, body, json, files, timeout, stream)
+        finally:
+            with self._count_lock:
+                self.active -= 1
+
+
+class UploadManyUnitTests(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.transport = _UploadTransport()
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport,
+                                                     retry_policy=RetryPolicy(max_retries=0))
+        self.assets = self.client.stack('api_key').assets()
+
+    def _file(self, name, size):
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as file:
+            file.write(b'x' * size)
+        return path
+
+    def test_uploads_files_in_parallel(self):
+        """Test that files are uploaded from a bounded pool and their assets returned in input order"""
+        paths = [self._file(f"image_{index}.jpg", 1000) for index in range(12)]
+        result = self.assets.upload_many(paths, folder_uid='folder_uid', workers=4)
+        self.assertIsInstance(result, UploadResult)
+        self.assertTrue(result.ok)
+        self.assertEqual(result.uploaded, 12)
+        self.assertEqual([asset['uid'] for asset in result.assets], [f"image_{index}.jpg" for index in range(12)])
+        self.assertTrue(all(asset['parent_uid'] == 'folder_uid' for asset in result.assets))
+        self.assertGreater(self.transport.peak, 1)
+        self.assertLessEqual(self.transport.peak, 4)
+        self.assertGreater(result.bytes_sent, 12 * 1000)
+        self.assertGreater(result.bytes_per_second, 0)
+
+    def test_failures_are_reported_per_file(self):
+        """Test that failed files are reported without stopping the others"""
+        files = [self._file('good.png', 10), (b'pixels', 'bad.png'), os.path.join(self.directory, 'missing.png'),
+                 (b'no-name',)]
+        result = self.assets.upload_many(files, workers=2)
+        self.assertFalse(result.ok)
+        self.assertEqual(result.uploaded, 1)
+        self.assertEqual(result.assets[0]['uid'], 'good.png')
+        self.assertEqual([failure['index'] for failure in result.failures], [1, 2, 3])
+        self.assertEqual(result.failures[0]['status_code'], 422)
+        self.assertEqual(result.failures[0]['error'], 'File type not allowed')
+        self.assertIsNone(result.failures[1]['status_code'])
+
+    def test_progress_is_reported_per_file(self):
+        """Test that the progress callback receives the bytes sent for each file"""
+        reports = {}
+        lock = threading.Lock()
+
+        def progress(index, filename, sent, total):
+            with lock:
+                reports.setdefault(index, []).append((filename, sent, total))
+
+        files = [self._file('large.bin', 200 * 1024), (memoryview(b'tiny'), 'tiny.bin', 'application/octet-stream')]
+        self.assets.upload_many(files, workers=2, progress=progress)
+        self.assertEqual(sorted(reports), [0, 1])
+        for index, events in reports.items():
+            self.assertEqual(events[-1][1], events[-1][2])
+            self.assertEqual([sent for _, sent, _ in events], sorted(sent for _, sent, _ in events))
+        self.assertGreater(len(reports[0]), 1)
+        self.assertEqual(reports[1][0][0], 'tiny.bin')
+
+
+if __name__ == '__main__':
+    unittest.main()
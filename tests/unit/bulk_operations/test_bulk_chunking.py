@@ -0,0 +1,140 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import contentstack_management
+from contentstack_management import BulkOperation, BulkResult, Journal
+from contentstack_management._errors import ArgumentException
+from contentstack_management._transport import StubTransport
+
+
+def entries(count):
+    return [{'uid': f"entry_{index}", 'content_type': 'blog', 'locale': 'en-us'} for index in range(count)]
+
+
+def publications(chunk):
+    items = len(chunk.get('entries', [])) + len(chunk.get('assets', []))
+    return items * max(1, len(chunk.get('locales', []))) * max(1, len(chunk.get('environments', [])))
+
+
+class _ConcurrentTransport(StubTransport):
+
+    def __init__(self):
+        super().__init__()
+        self.active = 0
+        self.peak = 0
+        self._count_lock = threading.Lock()
+
+    def request(self, *args, **kwargs):
+        with self._count_lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        try:
+            return super().request(*args, **kwargs)
+        finally:
+            with self._count_lock:
+                self.active -= 1
+
+
+class BulkChunkingUnitTests(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = StubTransport()
+        self.transport.add('POST', 'bulk/publish', json={'notice': 'queued', 'job_id': 'job'})
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport)
+        self.bulk = self.client.stack('api_key').bulk_operation()
+
+    def sent(self):
+        return [json.loads(call.data) for call in self.transport.calls]
+
+    def test_chunks_respect_publication_limit(self):
+        """Test that every chunk holds at most chunk_size item x locale x environment publications"""
+        data = {'entries': entries(23), 'assets': [{'uid': 'asset_1'}], 'locales': ['en-us', 'fr-fr'],
+                'environments': ['production', 'staging'], 'publish_with_reference': True}
+        chunks = list(BulkOperation.chunks(data, 10))
+        self.assertTrue(all(publications(chunk) <= 10 for chunk in chunks))
+        self.assertEqual(sum(len(chunk.get('entries', [])) for chunk in chunks), 23)
+        self.assertEqual(sum(len(chunk.get('assets', [])) for chunk in chunks), 1)
+        self.assertTrue(all(chunk['publish_with_reference'] for chunk in chunks))
+        self.assertEqual(len(chunks), 12)
+
+    def test_chunks_split_locales_and_environments(self):
+        """Test that locales and environments are spread over chunks when one item exceeds the limit"""
+        data = {'entries': entries(1), 'locales': ['l1', 'l2', 'l3'], 'environments': ['e1', 'e2', 'e3', 'e4', 'e5']}
+        chunks = list(BulkOperation.chunks(data, 6))
+        self.assertTrue(all(publications(chunk) <= 6 for chunk in chunks))
+        pairs = {(locale, environment) for chunk in chunks for locale in chunk['locales']
+                 for environment in chunk['environments']}
+        self.assertEqual(len(pairs), 15)
+        wide = {'entries': entries(1), 'locales': [f"l{index}" for index in range(5)], 'environments': ['e1', 'e2']}
+        chunks = list(BulkOperation.chunks(wide, 3))
+        self.assertTrue(all(publications(chunk) <= 3 for chunk in chunks))
+        self.assertEqual(sum(publications(chunk) for chunk in chunks), 10)
+
+    def test_chunks_of_delete_payload(self):
+        """Test that payloads without locales or environments are split by item count only"""
+        chunks = list(BulkOperation.chunks({'entries': entries(25)}, 10))
+        self.assertEqual([len(chunk['entries']) for chunk in chunks], [10, 10, 5])
+        self.assertTrue(all('locales' not in chunk and 'environments' not in chunk for chunk in chunks))
+
+    def test_invalid_chunk_size(self):
+        """Test that a chunk size below one is rejected"""
+        with self.assertRaises(ArgumentException):
+            self.bulk.publish_many({'entries': entries(1)}, chunk_size=0)
+
+    def test_publish_many_aggregates_job_ids(self):
+        """Test that every chunk is submitted and the job ids are collected"""
+        data = {'entries': entries(25), 'locales': ['en-us'], 'environments': ['production']}
+        result = self.bulk.publish_many(data, workers=3)
+        self.assertIsInstance(result, BulkResult)
+        self.assertTrue(result.ok)
+        self.assertEqual(result.succeeded, 25)
+        self.assertEqual(result.job_ids, ['job', 'job', 'job'])
+        self.assertEqual(sorted(len(chunk['entries']) for chunk in self.sent()), [5, 10, 10])
+
+    def test_chunks_are_submitted_concurrently(self):
+        """Test that up to `workers` chunk requests are in flight at the same time"""
+        self.transport = _ConcurrentTransport()
+        self.transport.add('POST', 'bulk/unpublish', json={'job_id': 'job'})
+        client = contentstack_management.Client(authtoken='authtoken', transport=self.transport)
+        client.stack('api_key').bulk_operation().unpublish_many({'entries': entries(40)}, chunk_size=5, workers=4)
+        self.assertEqual(len(self.transport.calls), 8)
+        self.assertGreater(self.transport.peak, 1)
+        self.assertLessEqual(self.transport.peak, 4)
+
+    def test_failed_chunk_reports_items(self):
+        """Test that the items of a rejected chunk are reported with the error of their request"""
+        self.transport.add('POST', 'bulk/delete', json={'job_id': 'job_1'})
+        self.transport.add('POST', 'bulk/delete', status_code=422,
+                           json={'error_message': 'Entries not found', 'errors': {'entries': ['missing']}})
+        result = self.bulk.delete_many({'entries': entries(4)}, chunk_size=2, workers=1)
+        self.assertFalse(result.ok)
+        self.assertEqual(result.succeeded, 2)
+        self.assertEqual(result.job_ids, ['job_1'])
+        self.assertEqual([failure['item']['uid'] for failure in result.failures], ['entry_2', 'entry_3'])
+        self.assertEqual(result.failures[0]['status_code'], 422)
+        self.assertEqual(result.failures[0]['error'], 'Entries not found')
+        self.assertEqual(result.failures[0]['errors'], {'entries': ['missing']})
+
+    def test_journal_skips_submitted_chunks(self):
+        """Test that chunks recorded in the journal are not submitted again"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'bulk.journal')
+        data = {'entries': entries(30), 'locales': ['en-us'], 'environments': ['production']}
+        with Journal(path) as journal:
+            first = self.bulk.publish_many(data, journal=journal)
+        self.assertEqual(len(self.transport.calls), 3)
+        with Journal(path) as journal:
+            second = self.bulk.publish_many(data, journal=journal)
+        self.assertEqual(len(self.transport.calls), 3)
+        self.assertEqual(second.job_ids, first.job_ids)
+        self.assertEqual(second.succeeded, 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import threading
+import unittest
+from concurrent.futures import wait
+
+import contentstack_management
+from contentstack_management import BulkJob
+from contentstack_management._transport import StubTransport
+from contentstack_management.bulk_operations.bulk_job import _JobPoller
+
+
+class _ManualPoller:
+
+    def __init__(self):
+        self.delays = []
+
+    def schedule(self, job, delay):
+        self.delays.append(delay)
+
+
+class BulkJobUnitTests(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = StubTransport()
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport)
+        self.bulk = self.client.stack('api_key').bulk_operation()
+
+    def test_job_resolves_with_final_status(self):
+        """Test that a job is polled until it completes and resolves with the final status body"""
+        self.transport.add('GET', 'bulk/jobs/job_1', json={'status': 'in_progress'})
+        self.transport.add('GET', 'bulk/jobs/job_1', json={'status': 'in_progress'})
+        self.transport.add('GET', 'bulk/jobs/job_1', json={'status': 'Completed', 'summary': {'success': 3}})
+        called = threading.Event()
+        job = self.bulk.job('job_1', interval=0.01)
+        job.add_done_callback(lambda done: called.set())
+        self.assertIsInstance(job, BulkJob)
+        self.assertEqual(job.result(timeout=5)['summary'], {'success': 3})
+        self.assertTrue(called.wait(5))
+        self.assertTrue(job.done())
+        self.assertFalse(job.failed)
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(job.polls, 3)
+
+    def test_failed_job(self):
+        """Test that a job ending with a failure status resolves with failed set"""
+        self.transport.add('GET', 'bulk/jobs/job_1', json={'job': {'status': 'failed'}})
+        job = self.bulk.job('job_1', interval=0.01)
+        self.assertEqual(job.result(timeout=5), {'job': {'status': 'failed'}})
+        self.assertTrue(job.failed)
+
+    def test_status_error_resolves_with_exception(self):
+        """Test that an error response to a status request is raised by result"""
+        self.transport.add('GET', 'bulk/jobs/job_1', status_code=404, json={'error_message': 'Job not found'})
+        job = self.bulk.job('job_1', interval=0.01)
+        with self.assertRaises(Exception):
+            job.result(timeout=5)
+
+    def test_backoff_grows_without_progress(self):
+        """Test that the polling interval grows while the status is unchanged and resets on progress"""
+        self.transport.add('GET', 'bulk/jobs/job_1', json={'status': 'in_progress', 'progress': 1})
+        self.transport.add('GET', 'bulk/jobs/job_1', json={'status': 'in_progress', 'progress': 1})
+        self.transport.add('GET', 'bulk/jobs/job_1', json={'status': 'in_progress', 'progress': 1})
+        self.transport.add('GET', 'bulk/jobs/job_1', json={'status': 'in_progress', 'progress': 1})
+        self.transport.add('GET', 'bulk/jobs/job_1', json={'status': 'in_progress', 'progress': 2})
+        job = BulkJob(self.bulk, 'job_1', interval=1.0, max_interval=2.0, backoff=1.5, poller=_ManualPoller())
+        self.assertEqual([job._poll() for _ in range(5)], [1.0, 1.5, 2.0, 2.0, 1.0])
+
+    def test_one_thread_polls_many_jobs(self):
+        """Test that many outstanding jobs are polled by a single scheduler thread and a bounded pool"""
+        self.transport.add('GET', 'jobs/job', json={'status': 'in_progress'})
+        self.transport.add('GET', 'jobs/job', json={'status': 'completed'})
+        poller = _JobPoller(workers=2, idle_timeout=0.1)
+        before = threading.active_count()
+        jobs = [BulkJob(self.bulk, 'job', interval=0.01, poller=poller) for _ in range(200)]
+        self.assertLessEqual(threading.active_count() - before, 3)
+        done, pending = wait(jobs, timeout=10)
+        self.assertFalse(pending)
+        self.assertTrue(all(job.result() == {'status': 'completed'} for job in done))
+        self.assertEqual(len(poller), 0)
+
+    def test_cancel_stops_polling(self):
+        """Test that a cancelled job is not polled"""
+        self.transport.add('GET', 'bulk/jobs/job_1', json={'status': 'in_progress'})
+        job = self.bulk.job('job_1', interval=0.05)
+        self.assertTrue(job.cancel())
+        self.assertIsNone(job._poll())
+        self.assertEqual(len(self.transport.calls), 0)
+
+    def test_result_jobs(self):
+        """Test that a BulkResult returns a future per job id"""
+        self.transport.add('POST', 'bulk/publish', json={'job_id': 'job_1'})
+        self.transport.add('GET', 'bulk/jobs/job_1', json={'status': 'completed'})
+        result = self.bulk.publish_many({'entries': [{'uid': 'a'}], 'locales': ['en-us'], 'environments': ['prod']})
+        jobs = result.jobs(interval=0.01)
+        self.assertEqual([job.job_uid for job in jobs], ['job_1'])
+        self.assertEqual(jobs[0].result(timeout=5), {'status': 'completed'})
+
+
+if __name__ == '__main__':
+    unittest.main()
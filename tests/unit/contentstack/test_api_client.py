@@ -0,0 +1,72 @@
+import time
+import unittest
+from unittest.mock import patch
+
+import requests
+
+import contentstack_management
+from contentstack_management._api_client import _APIClient
+from tests.responses import make_response
+
+
+class APIClientPoolTests(unittest.TestCase):
+
+    def setUp(self):
+        self.client = contentstack_management.Client(authtoken='authtoken', pool_connections=4, pool_maxsize=32)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_adapter_uses_configured_pool_size(self):
+        """Test that the shared session mounts an adapter with the configured pool sizes"""
+        adapter = self.client.client.session.get_adapter('https://api.contentstack.io/v3/')
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_requests_reuse_one_session(self):
+        """Test that every call goes through the same pooled session"""
+        with patch.object(requests.Session, 'request', return_value=make_response()) as mock_request:
+            session = self.client.client.session
+            self.client.stack('api_key').content_types().find()
+            self.client.stack('api_key').assets().find()
+            self.client.stack('api_key').bulk_operation().publish({})
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertIs(self.client.client.session, session)
+
+    def test_resources_share_client_session(self):
+        """Test that resource handles share the pool owned by the Client"""
+        entry = self.client.stack('api_key').content_types('ct').entry('entry_uid')
+        self.assertIs(entry.client.session, self.client.client.session)
+
+    def test_idle_timeout_flushes_pool(self):
+        """Test that pooled connections idle past the timeout are discarded"""
+        api_client = _APIClient('https://api.contentstack.io/v3/', {}, pool_idle_timeout=5)
+        adapter = api_client.session.get_adapter('https://api.contentstack.io/v3/')
+        with patch.object(adapter.poolmanager, 'clear') as mock_clear:
+            api_client._get_session()
+            mock_clear.assert_not_called()
+            api_client._last_used = time.monotonic() - 10
+            api_client._get_session()
+            mock_clear.assert_called_once()
+        api_client.close()
+
+    def test_close_releases_session(self):
+        """Test that close() releases the pool and a new one is opened on demand"""
+        session = self.client.client.session
+        with patch.object(session, 'close') as mock_close:
+            self.client.close()
+            mock_close.assert_called_once()
+        self.assertIsNone(self.client.client.session)
+        self.client.close()
+        self.assertIsNot(self.client.client._get_session(), session)
+
+    def test_context_manager_closes_client(self):
+        """Test that the Client context manager closes the pool on exit"""
+        with contentstack_management.Client(authtoken='authtoken') as client:
+            api_client = client.client
+            self.assertIsNotNone(api_client.session)
+        self.assertIsNone(api_client.session)
+
+
+if __name__ == '__main__':
+    unittest.main()
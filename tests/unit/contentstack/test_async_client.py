@@ -0,0 +1,97 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+import contentstack_management
+from contentstack_management._cache import ResponseCache
+from contentstack_management._retry import RetryPolicy
+
+
+class AsyncClientTests(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.requests = []
+        self.client = contentstack_management.AsyncClient(authtoken='authtoken', pool_maxsize=50)
+        self.client.client.session = httpx.AsyncClient(transport=httpx.MockTransport(self._handler))
+
+    async def asyncTearDown(self):
+        await self.client.close()
+
+    def _handler(self, request):
+        self.requests.append(request)
+        return httpx.Response(200, json={'uid': request.url.path.rsplit('/', 1)[-1]})
+
+    async def test_navigation_api_is_awaitable(self):
+        """Test that the resource tree returns awaitables over the async transport"""
+        response = await self.client.stack('api_key').content_types('ct').entry('entry_uid').fetch()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'uid': 'entry_uid'})
+        request = self.requests[0]
+        self.assertEqual(str(request.url), f"{self.client.endpoint}content_types/ct/entries/entry_uid")
+        self.assertEqual(request.method, 'GET')
+        self.assertEqual(request.headers['api_key'], 'api_key')
+        self.assertEqual(request.headers['authtoken'], 'authtoken')
+
+    async def test_concurrent_requests_share_one_session(self):
+        """Test that many concurrent calls run on the same pooled session"""
+        session = self.client.client.session
+        entry = self.client.stack('api_key').content_types('ct')
+        responses = await asyncio.gather(*[entry.entry(f'uid{i}').fetch() for i in range(20)])
+        self.assertEqual(len(responses), 20)
+        self.assertIs(self.client.client.session, session)
+
+    async def test_request_is_captured_when_called(self):
+        """Test that headers and params are captured when the method is called"""
+        assets = self.client.stack('api_key').assets()
+        assets.add_param('include_count', True)
+        pending = assets.find()
+        assets.params.clear()
+        await pending
+        self.assertEqual(str(self.requests[0].url), f"{self.client.endpoint}assets?include_count=True")
+
+    async def test_post_sends_body(self):
+        """Test that JSON string bodies are sent unchanged"""
+        await self.client.stack('api_key').content_types().create({'content_type': {'title': 'Blog'}})
+        self.assertEqual(json.loads(self.requests[0].content), {'content_type': {'title': 'Blog'}})
+
+    async def test_login_stores_authtoken(self):
+        """Test that the async login stores the authtoken on the client"""
+        self.client.client.session = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={'user': {'authtoken': 'new_token'}})))
+        response = await self.client.login('user@example.com', 'password')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.authtoken, 'new_token')
+
+    async def test_retries_use_retry_policy(self):
+        """Test that retryable statuses are retried on the async transport"""
+        statuses = [503, 200]
+        self.client.client.retry_policy = RetryPolicy(max_retries=2)
+        self.client.client.session = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(statuses.pop(0))))
+        with patch('contentstack_management._async_api_client.asyncio.sleep') as mock_sleep:
+            mock_sleep.return_value = None
+            response = await self.client.stack('api_key').content_types().find()
+        self.assertEqual(response.status_code, 200)
+        mock_sleep.assert_called_once()
+
+    async def test_cached_reads_are_awaitable(self):
+        """Test that cached responses are returned as awaitables without a request"""
+        self.client.client.cache = ResponseCache()
+        content_type = self.client.stack('api_key').content_types('blog')
+        first = await content_type.fetch()
+        second = await content_type.fetch()
+        self.assertIs(second, first)
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_sync_context_manager_is_rejected(self):
+        """Test that the async client cannot be used as a synchronous context manager"""
+        with self.assertRaises(TypeError):
+            with self.client:
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
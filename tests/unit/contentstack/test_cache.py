@@ -0,0 +1,127 @@
+import unittest
+from unittest.mock import patch
+
+import contentstack_management
+from contentstack_management._cache import ResponseCache
+from contentstack_management._transport import StubTransport
+
+
+class ResponseCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = StubTransport()
+        self.transport.add('GET', 'content_types/blog', json={'content_type': {'uid': 'blog'}})
+        self.transport.add('GET', 'content_types', json={'content_types': []})
+        self.transport.add('PUT', 'content_types/blog', json={'notice': 'updated'})
+        self.transport.add('GET', 'entries', json={'entries': []})
+        self.cache = ResponseCache(ttl=60, maxsize=2)
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport, cache=self.cache)
+
+    def test_repeated_reads_are_served_from_cache(self):
+        """Test that a second fetch of a cached resource does not reach the API"""
+        content_type = self.client.stack('api_key').content_types('blog')
+        first = content_type.fetch()
+        second = content_type.fetch()
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(len(self.transport.calls), 1)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_key_covers_stack_branch_params_and_credentials(self):
+        """Test that responses are not shared across stacks, branches, params or users"""
+        self.client.stack('api_key_a').content_types('blog').fetch()
+        self.client.stack('api_key_b').content_types('blog').fetch()
+        self.client.stack('api_key_a').content_types('blog', branch='dev').fetch()
+        other_user = contentstack_management.Client(authtoken='other', transport=self.transport, cache=self.cache)
+        other_user.stack('api_key_a').content_types('blog').fetch()
+        content_type = self.client.stack('api_key_a').content_types('blog')
+        content_type.add_param('include_global_field_schema', True)
+        content_type.fetch()
+        self.assertEqual(len(self.transport.calls), 5)
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_writes_invalidate_path_and_collection(self):
+        """Test that updating a resource drops its cached responses and its collection"""
+        stack = self.client.stack('api_key')
+        stack.content_types('blog').fetch()
+        stack.content_types().find()
+        stack.content_types('blog').update({'content_type': {'title': 'Blog'}})
+        self.assertEqual(len(self.cache), 0)
+        stack.content_types('blog').fetch()
+        self.assertEqual(len(self.transport.calls), 4)
+
+    def test_entries_expire_and_are_evicted(self):
+        """Test that entries expire after the TTL and the least recently used one is evicted"""
+        stack = self.client.stack('api_key')
+        with patch('contentstack_management._cache.time.monotonic', return_value=0):
+            stack.content_types('blog').fetch()
+        with patch('contentstack_management._cache.time.monotonic', return_value=61):
+            stack.content_types('blog').fetch()
+        self.assertEqual(len(self.transport.calls), 2)
+        self.client.stack('api_key_b').content_types('blog').fetch()
+        self.client.stack('api_key_c').content_types('blog').fetch()
+        self.assertEqual(len(self.cache), 2)
+
+    def test_only_configured_paths_are_cached(self):
+        """Test that volatile resources such as entries are not cached by default"""
+        self.assertFalse(self.cache.is_cacheable('content_types/blog/entries'))
+        self.assertTrue(self.cache.is_cacheable('stacks/settings'))
+        self.assertTrue(ResponseCache(paths=None).is_cacheable('content_types/blog/entries'))
+
+    def test_errors_are_not_cached(self):
+        """Test that unsuccessful responses are never stored"""
+        self.client.stack('api_key').content_types('missing').fetch()
+        self.client.stack('api_key').content_types('missing').fetch()
+        self.assertEqual(len(self.transport.calls), 2)
+
+
+class ConditionalRequestTests(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = StubTransport()
+        self.cache = ResponseCache(ttl=60)
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport, cache=self.cache)
+
+    def test_exports_are_revalidated_with_etag(self):
+        """Test that exports are always revalidated and a 304 serves the cached body"""
+        self.transport.add('GET', 'content_types/blog/export', json={'uid': 'blog'}, headers={'ETag': '"v1"'})
+        self.transport.add('GET', 'content_types/blog/export', status_code=304, headers={'ETag': '"v1"'})
+        content_type = self.client.stack('api_key').content_types('blog')
+        first = content_type.export()
+        second = content_type.export()
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json(), {'uid': 'blog'})
+        self.assertNotIn('If-None-Match', self.transport.calls[0].headers)
+        self.assertEqual(self.transport.calls[1].headers['If-None-Match'], '"v1"')
+        self.assertIs(second, first)
+        self.assertEqual(self.cache.revalidations, 1)
+
+    def test_changed_resources_are_replaced(self):
+        """Test that a 200 reply to a conditional request replaces the cached response"""
+        self.transport.add('GET', 'global_fields/seo/export', json={'version': 1},
+                           headers={'Last-Modified': 'Wed, 21 Oct 2026 07:28:00 GMT'})
+        self.transport.add('GET', 'global_fields/seo/export', json={'version': 2},
+                           headers={'Last-Modified': 'Thu, 22 Oct 2026 07:28:00 GMT'})
+        global_field = self.client.stack('api_key').global_fields('seo')
+        global_field.export()
+        self.assertEqual(global_field.export().json(), {'version': 2})
+        self.assertEqual(self.transport.calls[1].headers['If-Modified-Since'], 'Wed, 21 Oct 2026 07:28:00 GMT')
+        global_field.export()
+        self.assertEqual(self.transport.calls[2].headers['If-Modified-Since'], 'Thu, 22 Oct 2026 07:28:00 GMT')
+
+    def test_expired_entries_with_validators_are_revalidated(self):
+        """Test that expired responses are revalidated instead of fetched again"""
+        self.transport.add('GET', 'locales', json={'locales': []}, headers={'ETag': '"l1"'})
+        self.transport.add('GET', 'locales', status_code=304)
+        locales = self.client.stack('api_key').locale()
+        with patch('contentstack_management._cache.time.monotonic', return_value=0):
+            locales.find()
+        with patch('contentstack_management._cache.time.monotonic', return_value=61):
+            self.assertEqual(locales.find().json(), {'locales': []})
+        with patch('contentstack_management._cache.time.monotonic', return_value=62):
+            locales.find()
+        self.assertEqual(len(self.transport.calls), 2)
+        self.assertEqual(self.transport.calls[1].headers['If-None-Match'], '"l1"')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -288,14 +288,14 @@ class ContentstackRegionUnitTests(unittest.TestCase):
         user_obj = client.user()
         self.assertIsNotNone(user_obj)
         # Verify it's the correct type by checking if it has the expected client attribute
-        self.assertEqual(user_obj.client, client.client)
+        self.assertIs(user_obj.client.api_client, client.client)
 
     def test_organizations_method_without_uid(self):
         """Test the organizations method without organization_uid"""
         client = contentstack_management.Client()
         org_obj = client.organizations()
         self.assertIsNotNone(org_obj)
-        self.assertEqual(org_obj.client, client.client)
+        self.assertIs(org_obj.client.api_client, client.client)
         self.assertIsNone(org_obj.organization_uid)
 
     def test_organizations_method_with_uid(self):
@@ -304,7 +304,7 @@ class ContentstackRegionUnitTests(unittest.TestCase):
         org_uid = 'test_org_uid'
         org_obj = client.organizations(org_uid)
         self.assertIsNotNone(org_obj)
-        self.assertEqual(org_obj.client, client.client)
+        self.assertIs(org_obj.client.api_client, client.client)
         self.assertEqual(org_obj.organization_uid, org_uid)
 
     def test_stack_method_without_api_key(self):
@@ -312,7 +312,7 @@ class ContentstackRegionUnitTests(unittest.TestCase):
         client = contentstack_management.Client()
         stack_obj = client.stack()
         self.assertIsNotNone(stack_obj)
-        self.assertEqual(stack_obj.client, client.client)
+        self.assertIs(stack_obj.client.api_client, client.client)
         # Skip api_key check as it might not be exposed as an attribute
 
     def test_stack_method_with_api_key(self):
@@ -321,7 +321,7 @@ class ContentstackRegionUnitTests(unittest.TestCase):
         api_key = 'test_api_key'
         stack_obj = client.stack(api_key)
         self.assertIsNotNone(stack_obj)
-        self.assertEqual(stack_obj.client, client.client)
+        self.assertIs(stack_obj.client.api_client, client.client)
         # Skip api_key check as it might not be exposed as an attribute
 
     def test_login_method_signature(self):
@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+import contentstack_management
+from contentstack_management._instrumentation import LatencyAggregator, RequestEvent, route_template
+from contentstack_management._transport import StubTransport
+from contentstack_management.oauth.oauth_interceptor import OAuthInterceptor
+
+
+class RouteTemplateTests(unittest.TestCase):
+
+    def test_identifiers_are_templated(self):
+        """Test that identifiers in the path are replaced by {uid}"""
+        endpoint = 'https://api.contentstack.io/v3/'
+        self.assertEqual(route_template(f'{endpoint}content_types/blog/entries/blt1?locale=en', endpoint),
+                         'content_types/{uid}/entries/{uid}')
+        self.assertEqual(route_template(f'{endpoint}stacks/settings', endpoint), 'stacks/settings')
+        self.assertEqual(route_template(f'{endpoint}content_types/blog/entries/blt1/versions/2/name', endpoint),
+                         'content_types/{uid}/entries/{uid}/versions/{uid}/name')
+
+
+class HookTests(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = StubTransport()
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport)
+        self.before, self.after = [], []
+        self.client.add_hook(before_request=self.before.append, after_response=self.after.append)
+
+    def test_events_describe_the_call(self):
+        """Test that hooks receive method, route, status and byte counts"""
+        self.transport.add('POST', 'content_types', json={'notice': 'created'}, status_code=201)
+        self.client.stack('api_key').content_types().create({'content_type': {'title': 'Blog'}})
+        self.assertEqual(len(self.before), 1)
+        event = self.after[0]
+        self.assertIs(event, self.before[0])
+        self.assertEqual((event.method, event.route, event.status_code), ('POST', 'content_types', 201))
+        self.assertEqual(event.bytes_out, len('{"content_type": {"title": "Blog"}}'))
+        self.assertEqual(event.bytes_in, len('{"notice": "created"}'))
+        self.assertGreaterEqual(event.duration, 0)
+        self.assertEqual(event.retries, 0)
+
+    def test_retries_and_errors_are_reported(self):
+        """Test that retries, backoff and errors are recorded on the event"""
+        self.transport.add('GET', 'assets', status_code=503)
+        self.transport.add('GET', 'assets', error=requests.ConnectionError())
+        self.client.client.retry_policy.max_retries = 1
+        with patch('contentstack_management._api_client.time.sleep'):
+            with self.assertRaises(requests.ConnectionError):
+                self.client.stack('api_key').assets().find()
+        event = self.after[0]
+        self.assertEqual(event.retries, 1)
+        self.assertGreater(event.backoff, 0)
+        self.assertIsInstance(event.error, requests.ConnectionError)
+
+    def test_removed_hooks_are_not_called(self):
+        """Test that remove_hook stops a hook from being called"""
+        self.client.remove_hook(self.after.append)
+        self.transport.add('GET', 'assets', json={'assets': []})
+        self.client.stack('api_key').assets().find()
+        self.assertEqual(len(self.before), 1)
+        self.assertEqual(self.after, [])
+
+    def test_oauth_interceptor_reports_requests(self):
+        """Test that requests sent by the OAuth interceptor are reported to its hooks"""
+        api_client = self.client.client
+        interceptor = OAuthInterceptor(MagicMock(api_client=api_client))
+        events = []
+        interceptor.add_hook(after_response=events.append)
+        self.transport.add('POST', 'token', json={'access_token': 'token'})
+        interceptor.execute_request('POST', 'https://developerhub-api.contentstack.com/token', data={})
+        self.assertEqual(events[0].route, 'token')
+        self.assertEqual(events[0].status_code, 200)
+
+
+class LatencyAggregatorTests(unittest.TestCase):
+
+    def _event(self, route, duration, status_code=200):
+        event = RequestEvent('GET', f'https://api.contentstack.io/v3/{route}', route)
+        event.duration = duration
+        event.status_code = status_code
+        return event
+
+    def test_percentiles_per_route(self):
+        """Test that p50/p95/p99 and totals are kept per route and sorted by wall time"""
+        aggregator = LatencyAggregator()
+        for i in range(1, 101):
+            aggregator(self._event('content_types/{uid}', i / 100))
+        aggregator(self._event('locales', 100, status_code=500))
+        summary = aggregator.summary()
+        self.assertEqual(list(summary), ['GET locales', 'GET content_types/{uid}'])
+        stats = summary['GET content_types/{uid}']
+        self.assertEqual((stats['p50'], stats['p95'], stats['p99']), (0.5, 0.95, 0.99))
+        self.assertEqual(stats['count'], 100)
+        self.assertEqual(summary['GET locales']['errors'], 1)
+
+    def test_window_bounds_samples(self):
+        """Test that only the latest samples are used for percentiles"""
+        aggregator = LatencyAggregator(window=2)
+        for duration in (10, 1, 1):
+            aggregator(self._event('locales', duration))
+        stats = aggregator.summary()['GET locales']
+        self.assertEqual(stats['p99'], 1)
+        self.assertEqual(stats['total'], 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
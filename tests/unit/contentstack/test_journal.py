@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+
+from contentstack_management import Journal, SqliteJournal
+from contentstack_management._transport import _build_response
+
+
+class JournalTests(unittest.TestCase):
+
+    journal_class = Journal
+    filename = 'jobs.journal'
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, self.filename)
+
+    def test_records_survive_reopening(self):
+        """Test that completed operations and their results are loaded when the journal is reopened"""
+        with self.journal_class(self.path) as journal:
+            journal.record('entries/a', {'uid': 'new_a'}, data={'title': 'A'})
+            journal.record('entries/b')
+        with self.journal_class(self.path) as journal:
+            self.assertEqual(len(journal), 2)
+            self.assertEqual(journal.get('entries/a'), {'uid': 'new_a'})
+            self.assertIn('entries/b', journal)
+            self.assertNotIn('entries/c', journal)
+            self.assertEqual(journal.get('entries/c', 'missing'), 'missing')
+
+    def test_done_compares_content_hash(self):
+        """Test that an operation only counts as done when run with the same content"""
+        with self.journal_class(self.path) as journal:
+            journal.record('entries/a', data={'title': 'A', 'tags': ['x']})
+            self.assertTrue(journal.done('entries/a'))
+            self.assertTrue(journal.done('entries/a', {'tags': ['x'], 'title': 'A'}))
+            self.assertFalse(journal.done('entries/a', {'title': 'B', 'tags': ['x']}))
+
+    def test_run_skips_completed_operations(self):
+        """Test that run calls the operation once per content and records its JSON response"""
+        calls = []
+
+        def update():
+            calls.append(1)
+            return _build_response('PUT', 'https://api.contentstack.io/v3/entries/a', {}, 200, 'OK',
+                                   {'Content-Type': 'application/json'}, b'{"notice": "updated"}')
+
+        with self.journal_class(self.path) as journal:
+            self.assertEqual(journal.run('entries/a', update, {'title': 'A'}), {'notice': 'updated'})
+            self.assertEqual(journal.run('entries/a', update, {'title': 'A'}), {'notice': 'updated'})
+            journal.run('entries/a', update, {'title': 'B'})
+        self.assertEqual(len(calls), 2)
+
+    def test_failed_operations_are_not_recorded(self):
+        """Test that an operation whose response is an error is not marked as done"""
+        def fail():
+            return _build_response('PUT', 'https://api.contentstack.io/v3/entries/a', {}, 422, 'Unprocessable',
+                                   {'Content-Type': 'application/json'}, b'{}')
+
+        with self.journal_class(self.path) as journal:
+            with self.assertRaises(Exception):
+                journal.run('entries/a', fail)
+            self.assertNotIn('entries/a', journal)
+
+
+class SqliteJournalTests(JournalTests):
+
+    journal_class = SqliteJournal
+    filename = 'jobs.db'
+
+
+class JournalFileTests(unittest.TestCase):
+
+    def test_truncated_last_line_is_ignored(self):
+        """Test that a record cut short by a crash does not prevent loading the journal"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'jobs.journal')
+        with Journal(path) as journal:
+            journal.record('entries/a')
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write('{"key": "entries/b", "dig')
+        with Journal(path) as journal:
+            self.assertEqual(len(journal), 1)
+            journal.record('entries/c')
+        with Journal(path) as journal:
+            self.assertEqual(len(journal), 2)
+            self.assertIn('entries/c', journal)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import json
+import threading
+import time
+import unittest
+
+import requests
+
+import contentstack_management
+from contentstack_management._transport import StubTransport, Transport, _build_response
+
+
+def _dumps(body):
+    return json.dumps(body).encode('utf-8')
+
+
+class _PagedTransport(Transport):
+    """
+    Serves `total` assets, paged by the `skip` and `limit` params, later pages replying first.
+    Pages are capped at `cap` items, as the API caps them at 100.
+    """
+
+    def __init__(self, total, cap=None):
+        self.total = total
+        self.cap = cap
+        self.skips = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def request(self, method, url, headers=None, params=None, data=None, json=None, files=None, timeout=None,
+                stream=False):
+        skip, limit = params['skip'], min(params['limit'], self.cap or params['limit'])
+        with self._lock:
+            self.skips.append(skip)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05 if skip == 0 else 0.2 / (1 + skip))
+        with self._lock:
+            self.active -= 1
+        body = {'assets': [{'uid': str(index)} for index in range(skip, min(skip + limit, self.total))]}
+        if params.get('include_count'):
+            body['count'] = self.total
+        return _build_response(method, url, headers or {}, 200, 'OK', {'Content-Type': 'application/json'},
+                               _dumps(body))
+
+
+class PaginationTests(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = StubTransport()
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport)
+        self.stack = self.client.stack('api_key')
+
+    def test_iter_all_follows_pages_until_count(self):
+        """Test that iter_all requests pages with limit and skip until count items were seen"""
+        self.transport.add('GET', 'entries', json={'entries': [{'uid': 'a'}, {'uid': 'b'}], 'count': 4})
+        self.transport.add('GET', 'entries', json={'entries': [{'uid': 'c'}, {'uid': 'd'}]})
+        entries = self.stack.content_types('blog').entry()
+        entries.add_param('locale', 'fr-fr')
+        uids = [entry['uid'] for entry in entries.iter_all(limit=2)]
+        self.assertEqual(uids, ['a', 'b', 'c', 'd'])
+        self.assertEqual(len(self.transport.calls), 2)
+        self.assertEqual(self.transport.calls[0].params,
+                         {'locale': 'fr-fr', 'skip': 0, 'limit': 2, 'include_count': True})
+        self.assertEqual(self.transport.calls[1].params, {'locale': 'fr-fr', 'skip': 2, 'limit': 2})
+        self.assertEqual(entries.params, {'locale': 'fr-fr'})
+
+    def test_short_page_ends_iteration_without_count(self):
+        """Test that a page smaller than the limit is the last one"""
+        self.transport.add('GET', 'assets', json={'assets': [{'uid': 'a'}, {'uid': 'b'}]})
+        self.transport.add('GET', 'assets', json={'assets': [{'uid': 'c'}]})
+        self.assertEqual(len(self.stack.assets().find_all(limit=2)), 3)
+        self.assertEqual(len(self.transport.calls), 2)
+
+    def test_iteration_is_lazy(self):
+        """Test that the next page is only requested once the current one is consumed"""
+        self.transport.add('GET', 'content_types', json={'content_types': [{'uid': 'a'}], 'count': 3})
+        iterator = self.stack.content_types().iter_all(limit=1)
+        next(iterator)
+        self.assertEqual(len(self.transport.calls), 1)
+
+    def test_list_keys_of_resources(self):
+        """Test that each list resource reads the items from its own response key"""
+        self.transport.add('GET', 'audit-logs', json={'logs': [{'uid': 'log'}]})
+        self.transport.add('GET', 'branch_aliases', json={'branch_aliases': [{'uid': 'alias'}]})
+        self.transport.add('GET', 'publish-queue', json={'queue': [{'uid': 'job'}]})
+        self.assertEqual(self.stack.auditlog().find_all(), [{'uid': 'log'}])
+        self.assertEqual(self.stack.alias().find_all(), [{'uid': 'alias'}])
+        self.assertEqual(self.stack.publish_queue().find_all(), [{'uid': 'job'}])
+
+    def test_errors_are_raised(self):
+        """Test that a failed page raises instead of ending the iteration silently"""
+        self.transport.add('GET', 'branches', status_code=422, json={'error_message': 'invalid'})
+        with self.assertRaises(requests.HTTPError):
+            self.stack.branch().find_all()
+
+    def test_ignored_skip_ends_iteration(self):
+        """Test that a page repeating the previous one stops the iteration instead of looping forever"""
+        self.transport.add('GET', 'releases', json={'releases': [{'uid': str(index)} for index in range(2)]})
+        uids = [release['uid'] for release in self.stack.releases().iter_all(limit=2)]
+        self.assertEqual(uids, ['0', '1'])
+        self.assertEqual(len(self.transport.calls), 2)
+
+    def test_ignored_limit_ends_iteration(self):
+        """Test that a page longer than the limit, without a count, is the last one"""
+        self.transport.add('GET', 'releases', json={'releases': [{'uid': str(index)} for index in range(150)]})
+        self.assertEqual(len(self.stack.releases().find_all(limit=100)), 150)
+        self.assertEqual(len(self.transport.calls), 1)
+
+
+class ParallelPaginationTests(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = _PagedTransport(total=95)
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport)
+
+    def test_parallel_pages_are_yielded_in_order(self):
+        """Test that pages fetched in parallel are yielded in list order with a bounded pool"""
+        uids = [asset['uid'] for asset in self.client.stack('api_key').assets().iter_all(limit=10, workers=3)]
+        self.assertEqual(uids, [str(index) for index in range(95)])
+        self.assertEqual(sorted(self.transport.skips), list(range(0, 95, 10)))
+        self.assertGreater(self.transport.peak, 1)
+        self.assertLessEqual(self.transport.peak, 3)
+
+    def test_unordered_mode_yields_pages_as_they_arrive(self):
+        """Test that unordered iteration returns every item, faster pages first"""
+        assets = list(self.client.stack('api_key').assets().iter_all(limit=10, workers=9, ordered=False))
+        uids = [asset['uid'] for asset in assets]
+        self.assertEqual(sorted(uids, key=int), [str(index) for index in range(95)])
+        self.assertNotEqual(uids, [str(index) for index in range(95)])
+
+    def test_capped_pages_are_followed_until_count(self):
+        """Test that pages shorter than the limit are not taken as the last one while count is not reached"""
+        for workers in (1, 3):
+            with self.subTest(workers=workers):
+                transport = _PagedTransport(total=250, cap=100)
+                client = contentstack_management.Client(authtoken='authtoken', transport=transport)
+                assets = client.stack('api_key').assets().find_all(limit=500, workers=workers)
+                self.assertEqual([asset['uid'] for asset in assets], [str(index) for index in range(250)])
+                self.assertEqual(sorted(transport.skips), [0, 100, 200])
+
+    def test_find_all_with_workers(self):
+        """Test that find_all collects parallel pages in order"""
+        assets = self.client.stack('api_key').assets().find_all(limit=50, workers=4)
+        self.assertEqual([asset['uid'] for asset in assets], [str(index) for index in range(95)])
+        self.assertEqual(len(self.transport.skips), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+import contentstack_management
+from contentstack_management._rate_limiter import RateLimiter
+from tests.responses import make_response
+
+
+class RateLimiterTests(unittest.TestCase):
+
+    def test_burst_is_free_then_requests_wait(self):
+        """Test that requests within the burst are not delayed and later ones are spaced out"""
+        limiter = RateLimiter(rate=2, burst=2)
+        self.assertEqual(limiter.reserve('stack'), 0.0)
+        self.assertEqual(limiter.reserve('stack'), 0.0)
+        self.assertAlmostEqual(limiter.reserve('stack'), 0.5, places=2)
+        self.assertAlmostEqual(limiter.reserve('stack'), 1.0, places=2)
+
+    def test_buckets_are_per_stack(self):
+        """Test that each api_key gets its own bucket"""
+        limiter = RateLimiter(rate=1, burst=1)
+        self.assertEqual(limiter.reserve('stack_a'), 0.0)
+        self.assertEqual(limiter.reserve('stack_b'), 0.0)
+        self.assertGreater(limiter.reserve('stack_a'), 0.0)
+
+    def test_remaining_header_drains_bucket(self):
+        """Test that X-RateLimit-Remaining caps the locally available tokens"""
+        limiter = RateLimiter(rate=10)
+        limiter.update('stack', make_response(200, {'X-RateLimit-Limit': '10', 'X-RateLimit-Remaining': '0'}))
+        self.assertGreater(limiter.reserve('stack'), 0.0)
+
+    def test_rate_adapts_to_limit_header_and_429(self):
+        """Test that the rate follows X-RateLimit-Limit and halves after a 429"""
+        limiter = RateLimiter(rate=4, burst=4, min_rate=1)
+        limiter.update('stack', make_response(429))
+        self.assertEqual(limiter._buckets['stack'].rate, 2)
+        for _ in range(10):
+            limiter.update('stack', make_response(200, {'X-RateLimit-Limit': '6'}))
+        self.assertEqual(limiter._buckets['stack'].rate, 6)
+
+
+class APIClientRateLimitTests(unittest.TestCase):
+
+    def test_client_throttles_by_stack_api_key(self):
+        """Test that the client acquires a slot keyed by the stack api_key and feeds responses back"""
+        limiter = MagicMock(spec=RateLimiter)
+        client = contentstack_management.Client(authtoken='authtoken', rate_limiter=limiter)
+        response = make_response(200, {'X-RateLimit-Remaining': '5'})
+        with patch.object(requests.Session, 'request', return_value=response):
+            client.stack('api_key').content_types().find()
+        limiter.acquire.assert_called_once_with('api_key')
+        limiter.update.assert_called_once_with('api_key', response)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+import io
+import unittest
+from email.utils import formatdate
+import time
+from unittest.mock import patch
+
+import requests
+
+from contentstack_management._api_client import _APIClient
+from contentstack_management._retry import RetryBudget, RetryPolicy
+from tests.responses import make_response
+
+
+class RetryPolicyTests(unittest.TestCase):
+
+    def test_429_is_retried_for_every_method(self):
+        """Test that 429 responses are retryable regardless of the method"""
+        policy = RetryPolicy()
+        self.assertTrue(policy.is_retryable('POST', response=make_response(429)))
+        self.assertTrue(policy.is_retryable('GET', response=make_response(429)))
+
+    def test_server_errors_only_retried_for_idempotent_methods(self):
+        """Test that 5xx responses and connection errors are not retried for POST"""
+        policy = RetryPolicy()
+        self.assertTrue(policy.is_retryable('PUT', response=make_response(503)))
+        self.assertFalse(policy.is_retryable('POST', response=make_response(503)))
+        self.assertFalse(policy.is_retryable('GET', response=make_response(501)))
+        self.assertTrue(policy.is_retryable('GET', error=requests.ConnectionError()))
+        self.assertFalse(policy.is_retryable('POST', error=requests.ConnectionError()))
+
+    def test_dns_failures_are_not_retried(self):
+        """Test that name resolution errors are returned without retrying"""
+        from urllib3.exceptions import MaxRetryError, NameResolutionError
+        reason = NameResolutionError('api.invalid', None, 'Name or service not known')
+        error = requests.ConnectionError(MaxRetryError(None, '/v3/', reason))
+        self.assertFalse(RetryPolicy().is_retryable('GET', error=error))
+
+    def test_retry_after_seconds_and_date(self):
+        """Test that Retry-After is parsed in both seconds and HTTP-date forms"""
+        self.assertEqual(RetryPolicy.retry_after(make_response(429, {'Retry-After': '3'})), 3.0)
+        delay = RetryPolicy.retry_after(make_response(429, {'Retry-After': formatdate(time.time() + 20, usegmt=True)}))
+        self.assertTrue(15 < delay <= 20)
+        self.assertIsNone(RetryPolicy.retry_after(make_response(429, {'Retry-After': 'soon'})))
+
+    def test_backoff_is_capped(self):
+        """Test that the jittered backoff never exceeds max_backoff"""
+        policy = RetryPolicy(backoff_factor=1, max_backoff=4)
+        for attempt in range(10):
+            self.assertLessEqual(policy.backoff(attempt), 4)
+
+    def test_next_delay_respects_max_retries_and_long_retry_after(self):
+        """Test that next_delay stops after max_retries and on excessive Retry-After"""
+        policy = RetryPolicy(max_retries=2, max_backoff=10)
+        self.assertEqual(policy.next_delay('GET', 0, response=make_response(429, {'Retry-After': '1'})), 1.0)
+        self.assertIsNone(policy.next_delay('GET', 2, response=make_response(429)))
+        self.assertIsNone(policy.next_delay('GET', 0, response=make_response(429, {'Retry-After': '60'})))
+
+    def test_budget_limits_retries(self):
+        """Test that the retry budget allows min_retries plus a ratio of requests"""
+        budget = RetryBudget(ratio=0.5, min_retries=1)
+        for _ in range(4):
+            budget.record_request()
+        self.assertTrue(budget.try_spend())
+        self.assertTrue(budget.try_spend())
+        self.assertTrue(budget.try_spend())
+        self.assertFalse(budget.try_spend())
+
+
+class RetryDeadlineTests(unittest.TestCase):
+
+    def test_retry_past_deadline_is_refused(self):
+        """Test that no retry is started that would end after the deadline"""
+        policy = RetryPolicy(max_retries=18, deadline=10)
+        response = make_response(429, {'Retry-After': '4'})
+        self.assertEqual(policy.next_delay('GET', 0, response=response, elapsed=6), 4.0)
+        self.assertIsNone(policy.next_delay('GET', 1, response=response, elapsed=6.5))
+        self.assertEqual(RetryPolicy(deadline=None).next_delay('GET', 0, response=response, elapsed=600), 4.0)
+
+    def test_client_stops_retrying_at_deadline(self):
+        """Test that the client returns the last response once the deadline is used up"""
+        api_client = _APIClient('https://api.contentstack.io/v3/', {'authtoken': 'authtoken'},
+                                retry_policy=RetryPolicy(max_retries=18, deadline=5))
+        clock = []
+
+        def sleep(delay):
+            clock.append(delay)
+
+        with patch('contentstack_management._api_client.time.sleep', side_effect=sleep), \
+                patch('contentstack_management._api_client.time.monotonic', side_effect=lambda: sum(clock)), \
+                patch.object(requests.Session, 'request',
+                             return_value=make_response(503, {'Retry-After': '2'})) as mock_request:
+            response = api_client.get('content_types')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(clock, [2.0, 2.0])
+
+
+class APIClientRetryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.api_client = _APIClient('https://api.contentstack.io/v3/', {'authtoken': 'authtoken'}, max_retries=3)
+        sleep_patcher = patch('contentstack_management._api_client.time.sleep')
+        self.mock_sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def test_retries_until_success(self):
+        """Test that retryable responses are retried and the final response is returned"""
+        responses = [make_response(503), make_response(429, {'Retry-After': '2'}), make_response(200)]
+        with patch.object(requests.Session, 'request', side_effect=responses) as mock_request:
+            response = self.api_client.get('content_types')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(self.mock_sleep.call_args_list[-1].args[0], 2.0)
+
+    def test_gives_up_after_max_retries(self):
+        """Test that the last response is returned once max_retries is exhausted"""
+        with patch.object(requests.Session, 'request', return_value=make_response(500)) as mock_request:
+            response = self.api_client.get('content_types')
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(mock_request.call_count, 4)
+
+    def test_post_is_not_retried_on_server_error(self):
+        """Test that non-idempotent requests are not retried on 5xx"""
+        with patch.object(requests.Session, 'request', return_value=make_response(502)) as mock_request:
+            self.api_client.post('content_types', data='{}')
+        self.assertEqual(mock_request.call_count, 1)
+
+    def test_connection_errors_are_retried_then_raised(self):
+        """Test that connection errors are retried for GET and re-raised at the end"""
+        with patch.object(requests.Session, 'request', side_effect=requests.ConnectionError()) as mock_request:
+            with self.assertRaises(requests.ConnectionError):
+                self.api_client.get('content_types')
+        self.assertEqual(mock_request.call_count, 4)
+
+    def test_uploaded_files_are_rewound_between_attempts(self):
+        """Test that seekable upload files are rewound before each retry"""
+        upload = io.BytesIO(b'asset')
+        positions = []
+
+        def send(*args, **kwargs):
+            positions.append(upload.tell())
+            upload.read()
+            return make_response(429) if len(positions) == 1 else make_response(200)
+
+        with patch.object(requests.Session, 'request', side_effect=send):
+            self.api_client.put('assets/uid', files={'asset': upload})
+        self.assertEqual(positions, [0, 0])
+
+    def test_streamed_bodies_are_not_retried(self):
+        """Test that requests whose body cannot be replayed are sent once"""
+        body = iter([b'chunk'])
+        with patch.object(requests.Session, 'request', return_value=make_response(429)) as mock_request:
+            self.api_client.put('assets/uid', data=body)
+        self.assertEqual(mock_request.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import requests
+
+import contentstack_management
+from tests.responses import make_response
+
+
+class ScopedHeadersTests(unittest.TestCase):
+
+    def setUp(self):
+        self.client = contentstack_management.Client(authtoken='authtoken')
+        patcher = patch.object(requests.Session, 'request', return_value=make_response())
+        self.mock_request = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _sent_headers(self, call=-1):
+        return self.mock_request.call_args_list[call].kwargs['headers']
+
+    def test_stack_headers_do_not_touch_client_headers(self):
+        """Test that stack and branch headers stay on their own handles"""
+        self.client.stack('api_key_a').content_types(branch='dev')
+        self.assertNotIn('api_key', self.client.client.headers)
+        self.assertNotIn('branch', self.client.client.headers)
+
+    def test_handles_do_not_leak_headers(self):
+        """Test that a branch set on one handle is not sent by another"""
+        stack = self.client.stack('api_key_a')
+        stack.content_types(branch='dev').find()
+        self.client.stack('api_key_b').content_types().find()
+        self.assertEqual(self._sent_headers(0)['branch'], 'dev')
+        self.assertEqual(self._sent_headers(0)['api_key'], 'api_key_a')
+        self.assertNotIn('branch', self._sent_headers(1))
+        self.assertEqual(self._sent_headers(1)['api_key'], 'api_key_b')
+
+    def test_client_headers_are_shared_with_existing_handles(self):
+        """Test that an authtoken set on the client after a handle was created is still sent"""
+        stack = self.client.stack('api_key')
+        self.client.client.headers['authtoken'] = 'new_token'
+        stack.content_types().find()
+        self.assertEqual(self._sent_headers()['authtoken'], 'new_token')
+
+    def test_none_removes_header_for_one_request(self):
+        """Test that a request header set to None is not sent and the client keeps it"""
+        webhook = self.client.stack('api_key').webhooks('webhook_uid')
+        webhook.delete()
+        self.assertNotIn('Content-Type', self._sent_headers())
+        self.assertEqual(self.client.client.headers['Content-Type'], 'application/json')
+        webhook.fetch()
+        self.assertEqual(self._sent_headers()['Content-Type'], 'application/json')
+
+    def test_upload_content_type_is_not_kept(self):
+        """Test that an upload sends its multipart Content-Type without changing the client's"""
+        assets = self.client.stack('api_key').assets()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'image.png')
+            with open(path, 'wb') as upload:
+                upload.write(b'image')
+            assets.upload(path)
+        self.assertTrue(self._sent_headers()['Content-Type'].startswith('multipart/form-data; boundary='))
+        self.assertEqual(self.client.client.headers['Content-Type'], 'application/json')
+        assets.find()
+        self.assertEqual(self._sent_headers()['Content-Type'], 'application/json')
+
+    def test_per_request_headers_are_not_kept(self):
+        """Test that headers passed to a single call do not stick to the handle"""
+        bulk = self.client.stack('api_key').bulk_operation()
+        bulk.job_status('job_uid', headers={'bulk_version': '2.0'})
+        bulk.job_status('job_uid')
+        self.assertEqual(self._sent_headers(0)['bulk_version'], '2.0')
+        self.assertNotIn('bulk_version', self._sent_headers(1))
+
+    def test_concurrent_stacks_send_their_own_api_key(self):
+        """Test that stacks used from many threads always send their own api_key"""
+        def call(index):
+            self.client.stack(f'api_key_{index}').content_types().find()
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        sent = sorted(c.kwargs['headers']['api_key'] for c in self.mock_request.call_args_list)
+        self.assertEqual(sent, sorted(f'api_key_{i}' for i in range(20)))
+
+
+if __name__ == '__main__':
+    unittest.main()
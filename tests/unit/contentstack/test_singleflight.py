@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import httpx
+
+import contentstack_management
+from contentstack_management._singleflight import SingleFlight
+from contentstack_management._transport import StubTransport
+
+
+class _BlockingTransport(StubTransport):
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def request(self, *args, **kwargs):
+        self.release.wait(5)
+        return super().request(*args, **kwargs)
+
+
+class SingleFlightTests(unittest.TestCase):
+
+    def test_concurrent_calls_share_one_result(self):
+        """Test that callers with the same key wait for the call in flight and share its result"""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        fn = MagicMock(side_effect=lambda: (started.set(), release.wait(5), 'result')[2])
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do('key', fn)))
+        leader.start()
+        started.wait(5)
+        followers = [threading.Thread(target=lambda: results.append(flight.do('key', fn))) for _ in range(5)]
+        for follower in followers:
+            follower.start()
+        release.set()
+        for thread in [leader] + followers:
+            thread.join()
+        self.assertEqual(results, ['result'] * 6)
+        fn.assert_called_once()
+        self.assertEqual(len(flight), 0)
+
+    def test_errors_are_raised_to_every_caller(self):
+        """Test that the error of the shared call is raised and the key is released"""
+        flight = SingleFlight()
+        with self.assertRaises(ValueError):
+            flight.do('key', MagicMock(side_effect=ValueError()))
+        self.assertEqual(flight.do('key', lambda: 'retry'), 'retry')
+
+
+class APIClientCoalescingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = _BlockingTransport()
+        self.transport.add('GET', 'content_types/blog', json={'content_type': {'uid': 'blog'}})
+
+    def _fetch_concurrently(self, client, api_keys):
+        responses = []
+        threads = [threading.Thread(target=lambda k=k: responses.append(client.stack(k).content_types('blog').fetch()))
+                   for k in api_keys]
+        for thread in threads:
+            thread.start()
+        while len(client.client.singleflight) < len(set(api_keys)):
+            time.sleep(0.01)
+        time.sleep(0.2)  # let the other threads reach the pending call
+        self.transport.release.set()
+        for thread in threads:
+            thread.join()
+        return responses
+
+    def test_identical_gets_are_coalesced(self):
+        """Test that identical concurrent GETs send one request and share the response"""
+        client = contentstack_management.Client(authtoken='authtoken', transport=self.transport)
+        responses = self._fetch_concurrently(client, ['api_key'] * 8)
+        self.assertEqual(len(self.transport.calls), 1)
+        self.assertTrue(all(response is responses[0] for response in responses))
+
+    def test_different_scopes_are_not_coalesced(self):
+        """Test that GETs for different stacks are sent separately"""
+        client = contentstack_management.Client(authtoken='authtoken', transport=self.transport)
+        self._fetch_concurrently(client, ['api_key_a', 'api_key_b'])
+        self.assertEqual(len(self.transport.calls), 2)
+
+    def test_coalescing_can_be_disabled(self):
+        """Test that coalesce_requests=False sends every request"""
+        client = contentstack_management.Client(authtoken='authtoken', transport=self.transport,
+                                                coalesce_requests=False)
+        self.assertIsNone(client.client.singleflight)
+        self.transport.release.set()
+        client.stack('api_key').content_types('blog').fetch()
+        client.stack('api_key').content_types('blog').fetch()
+        self.assertEqual(len(self.transport.calls), 2)
+
+
+class AsyncCoalescingTests(unittest.IsolatedAsyncioTestCase):
+
+    async def test_identical_gets_are_coalesced(self):
+        """Test that identical GETs awaited together send one request"""
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={'content_type': {'uid': 'blog'}})
+
+        client = contentstack_management.AsyncClient(authtoken='authtoken', transport=httpx.MockTransport(handler))
+        content_type = client.stack('api_key').content_types('blog')
+        responses = await asyncio.gather(*[content_type.fetch() for _ in range(8)])
+        await client.close()
+        self.assertEqual(len(requests), 1)
+        self.assertTrue(all(response is responses[0] for response in responses))
+
+
+if __name__ == '__main__':
+    unittest.main()
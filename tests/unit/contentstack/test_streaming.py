@@ -0,0 +1,105 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import contentstack_management
+from contentstack_management._streaming import ItemStream
+from contentstack_management._transport import StubTransport, Urllib3Transport, _build_response
+
+
+class _EntriesHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        payload = json.dumps({'entries': [{'uid': f'entry_{index}', 'title': 'é' * 50} for index in range(500)],
+                              'count': 500}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class ItemStreamTests(unittest.TestCase):
+
+    def _items(self, body, key='entries', chunk_size=1):
+        response = _build_response('GET', 'https://api.contentstack.io/v3/entries', {}, 200, 'OK',
+                                   {'Content-Type': 'application/json'}, body.encode('utf-8'))
+        stream = ItemStream(response, key, chunk_size=chunk_size)
+        return list(stream), stream.members
+
+    def test_items_are_decoded_across_chunk_boundaries(self):
+        """Test that items, numbers and multi-byte characters split across chunks are decoded"""
+        body = json.dumps({'notice': 'ok', 'entries': [{'uid': 'a', 'title': 'Café ☕'}, 12345, [1, [2]], None],
+                           'count': 4})
+        for chunk_size in (1, 2, 7, 1024):
+            items, members = self._items(body, chunk_size=chunk_size)
+            self.assertEqual(items, [{'uid': 'a', 'title': 'Café ☕'}, 12345, [1, [2]], None])
+            self.assertEqual(members, {'notice': 'ok', 'count': 4})
+
+    def test_split_floats_and_exponents(self):
+        """Test that numbers cut before or inside their fraction or exponent are read whole"""
+        bodies = {
+            '{"entries":[1.5,2.25],"total":3.75}': ([1.5, 2.25], {'total': 3.75}),
+            '{"entries":[1.5e3,-2E-2,7e+1],"total":10}': ([1500.0, -0.02, 70.0], {'total': 10}),
+            '{"entries":[0.125]}': ([0.125], {}),
+        }
+        for body, expected in bodies.items():
+            for chunk_size in (1, 2, 3, 7):
+                with self.subTest(body=body, chunk_size=chunk_size):
+                    self.assertEqual(self._items(body, chunk_size=chunk_size), expected)
+
+    def test_empty_and_missing_arrays(self):
+        """Test that empty or missing arrays yield nothing and keep the other members"""
+        self.assertEqual(self._items(' { "entries" : [ ] , "count" : 0 } '), ([], {'count': 0}))
+        self.assertEqual(self._items('{"assets": [1]}'), ([], {'assets': [1]}))
+        self.assertEqual(self._items('{}'), ([], {}))
+
+    def test_invalid_json_raises(self):
+        """Test that truncated or malformed bodies raise a JSON decoding error"""
+        for body in ('{"entries": [{"uid": "a"}', '{"entries": [1 2]}', '[1, 2]', ''):
+            with self.assertRaises(json.JSONDecodeError):
+                self._items(body)
+
+
+class StreamedPaginationTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _EntriesHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = f'127.0.0.1:{cls.server.server_port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_iter_all_streams_pages(self):
+        """Test that streamed pagination decodes every item and reads the count after the array"""
+        for transport in (None, Urllib3Transport()):
+            client = contentstack_management.Client(host=self.host, scheme='http://', authtoken='authtoken',
+                                                     transport=transport)
+            entries = client.stack('api_key').content_types('blog').entry().iter_all(limit=500, stream=True)
+            uids = [entry['uid'] for entry in entries]
+            self.assertEqual(uids, [f'entry_{index}' for index in range(500)])
+            client.close()
+
+    def test_streamed_requests_bypass_cache(self):
+        """Test that streamed responses are never stored in or served from the response cache"""
+        transport = StubTransport()
+        transport.add('GET', 'content_types', json={'content_types': [{'uid': 'blog'}], 'count': 1})
+        cache = contentstack_management.ResponseCache()
+        client = contentstack_management.Client(authtoken='authtoken', transport=transport, cache=cache)
+        content_types = client.stack('api_key').content_types()
+        self.assertEqual(content_types.find_all(), [{'uid': 'blog'}])
+        self.assertEqual(list(content_types.iter_all(stream=True)), [{'uid': 'blog'}])
+        self.assertEqual(len(transport.calls), 2)
+        self.assertEqual(len(cache), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
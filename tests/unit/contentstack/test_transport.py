@@ -0,0 +1,155 @@
+import io
+import json
+import socket
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import requests
+import urllib3
+
+import contentstack_management
+from contentstack_management._transport import RequestsTransport, StubTransport, Urllib3Transport
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+
+    def _echo(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8', 'replace')
+        payload = json.dumps({'method': self.command, 'path': self.path,
+                              'headers': dict(self.headers), 'body': body}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _echo
+
+    def log_message(self, *args):
+        pass
+
+
+class StubTransportTests(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = StubTransport()
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport)
+
+    def test_serves_canned_responses(self):
+        """Test that resources receive the canned response registered for their path"""
+        self.transport.add('GET', 'content_types', json={'content_types': []})
+        response = self.client.stack('api_key').content_types().find()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'content_types': []})
+        call = self.transport.calls[0]
+        self.assertEqual(call.method, 'GET')
+        self.assertEqual(call.headers['api_key'], 'api_key')
+
+    def test_longest_route_wins_and_unmatched_is_404(self):
+        """Test that the most specific route is used and unknown paths get a 404"""
+        self.transport.add('GET', 'entries', json={'entries': []})
+        self.transport.add('GET', 'content_types/blog/entries/uid', json={'entry': {'uid': 'uid'}})
+        entry = self.client.stack('api_key').content_types('blog').entry('uid').fetch()
+        self.assertEqual(entry.json(), {'entry': {'uid': 'uid'}})
+        self.assertEqual(self.client.stack('api_key').assets().find().status_code, 404)
+
+    def test_replies_are_served_in_order_for_retries(self):
+        """Test that queued replies and errors drive the retry policy"""
+        self.transport.add('GET', 'assets', error=requests.ConnectionError())
+        self.transport.add('GET', 'assets', status_code=503)
+        self.transport.add('GET', 'assets', json={'assets': []})
+        with patch('contentstack_management._api_client.time.sleep'):
+            response = self.client.stack('api_key').assets().find()
+        self.assertEqual(response.json(), {'assets': []})
+        self.assertEqual(len(self.transport.calls), 3)
+
+
+class Urllib3TransportTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _EchoHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.host = f'127.0.0.1:{cls.server.server_port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.client = contentstack_management.Client(host=self.host, scheme='http://', authtoken='authtoken',
+                                                     transport=Urllib3Transport())
+
+    def test_get_encodes_params_like_requests(self):
+        """Test that query parameters are encoded the same way as with requests"""
+        assets = self.client.stack('api_key').assets()
+        assets.add_param('include_count', True)
+        assets.add_param('limit', 10)
+        echoed = assets.find().json()
+        self.assertEqual(echoed['method'], 'GET')
+        self.assertEqual(echoed['path'], '/v3/assets?include_count=True&limit=10')
+        self.assertEqual(echoed['headers']['api_key'], 'api_key')
+        self.assertEqual(echoed['headers']['authtoken'], 'authtoken')
+
+    def test_post_sends_body(self):
+        """Test that string bodies are sent unchanged with the client headers"""
+        echoed = self.client.stack('api_key').content_types().create({'content_type': {'title': 'Blog'}}).json()
+        self.assertEqual(echoed['method'], 'POST')
+        self.assertEqual(json.loads(echoed['body']), {'content_type': {'title': 'Blog'}})
+        self.assertEqual(echoed['headers']['Content-Type'], 'application/json')
+
+    def test_files_are_sent_as_multipart(self):
+        """Test that uploads are encoded as multipart form data"""
+        transport = Urllib3Transport()
+        response = transport.request('PUT', f'http://{self.host}/v3/assets/uid',
+                                     files={'asset': ('image.png', io.BytesIO(b'image-bytes'), 'image/png')})
+        echoed = response.json()
+        self.assertTrue(echoed['headers']['Content-Type'].startswith('multipart/form-data; boundary='))
+        self.assertIn('filename="image.png"', echoed['body'])
+        self.assertIn('image-bytes', echoed['body'])
+
+    def test_connection_errors_are_requests_errors(self):
+        """Test that connection failures surface as requests exceptions"""
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        with self.assertRaises(requests.ConnectionError) as raised:
+            Urllib3Transport().request('POST', f'http://127.0.0.1:{port}/v3/assets', timeout=2)
+        self.assertNotIsInstance(raised.exception, requests.ConnectTimeout)
+
+    def test_errors_are_mapped_like_requests(self):
+        """Test that urllib3 errors become the requests exceptions HTTPAdapter raises for them"""
+        pool, url = urllib3.HTTPConnectionPool('example.invalid'), 'http://example.invalid/v3/assets'
+        cases = [
+            (urllib3.exceptions.NameResolutionError('example.invalid', None, OSError('no such host')),
+             requests.ConnectionError),
+            (urllib3.exceptions.NewConnectionError(None, 'refused'), requests.ConnectionError),
+            (urllib3.exceptions.ConnectTimeoutError(None, 'timed out'), requests.ConnectTimeout),
+            (urllib3.exceptions.ReadTimeoutError(pool, url, 'timed out'), requests.ReadTimeout),
+            (urllib3.exceptions.ProtocolError('reset'), requests.ConnectionError),
+        ]
+        transport = Urllib3Transport()
+        for reason, expected in cases:
+            for error in (reason, urllib3.exceptions.MaxRetryError(pool, url, reason)):
+                with self.subTest(error=type(error).__name__, reason=type(reason).__name__):
+                    with patch.object(transport.pool_manager, 'request', side_effect=error):
+                        with self.assertRaises(requests.RequestException) as raised:
+                            transport.request('GET', url)
+                    self.assertIs(type(raised.exception), expected)
+
+
+class DefaultTransportTests(unittest.TestCase):
+
+    def test_requests_transport_is_default(self):
+        """Test that the client uses a pooled requests session unless configured otherwise"""
+        client = contentstack_management.Client(authtoken='authtoken')
+        self.assertIsInstance(client.client.session, RequestsTransport)
+        client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
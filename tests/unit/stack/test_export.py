@@ -0,0 +1,110 @@
+import json
+import os
+import tempfile
+import unittest
+
+import requests
+
+import contentstack_management
+from contentstack_management._transport import StubTransport
+
+
+class StackExportTests(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = StubTransport()
+        self.transport.add('GET', 'locales', json={'locales': [{'code': 'en-us'}, {'code': 'fr-fr'}]})
+        for path, key in (('environments', 'environments'), ('workflows', 'workflows'), ('webhooks', 'webhooks'),
+                          ('releases', 'releases')):
+            self.transport.add('GET', path, json={key: [{'uid': f'{key}_1'}], 'count': 1})
+        self.transport.add('GET', 'assets', json={'assets': [{'uid': 'a1', 'filename': 'logo.png', 'file_size': '3'}],
+                                                  'count': 1})
+        self.transport.add('GET', 'assets/api_key/a1', content=b'png')
+        self.transport.add('GET', 'global_fields', json={'global_fields': [{'uid': 'seo'}], 'count': 1})
+        self.transport.add('GET', 'content_types', json={'content_types': [{'uid': 'blog'}, {'uid': 'page'}],
+                                                         'count': 2})
+        self.transport.add('GET', 'content_types/blog/entries',
+                           json={'entries': [{'uid': 'b1', 'title': 'Café', 'locale': 'en-us'},
+                                             {'uid': 'b1', 'title': 'Café', 'locale': 'fr-fr'},
+                                             {'uid': 'b2', 'locale': 'en-us'}], 'count': 3})
+        self.transport.add('GET', 'content_types/page/entries', json={'entries': [], 'count': 0})
+        self.transport.add('GET', 'taxonomies', json={'taxonomies': [{'uid': 'regions'}], 'count': 1})
+        self.transport.add('GET', 'taxonomies/regions/terms', json={'terms': [{'uid': 'emea'}], 'count': 1})
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def _read(self, name):
+        with open(os.path.join(self.directory, f"{name}.ndjson"), encoding='utf-8') as file:
+            return [json.loads(line) for line in file]
+
+    def test_export_writes_every_module_as_ndjson(self):
+        """Test that every module, the entries of each content type and the terms of each taxonomy are exported"""
+        manifest = self.client.stack('api_key').export_to(self.directory, workers=3)
+        self.assertEqual(manifest['files'], {
+            'assets': 1, 'assets/files': 1, 'content_types': 2, 'entries/blog/en-us': 2, 'entries/blog/fr-fr': 1,
+            'entries/page/en-us': 0, 'entries/page/fr-fr': 0, 'environments': 1, 'global_fields': 1, 'locales': 2,
+            'releases': 1, 'taxonomies': 1, 'terms/regions': 1, 'webhooks': 1, 'workflows': 1})
+        self.assertEqual(self._read('entries/blog/en-us'), [{'uid': 'b1', 'title': 'Café', 'locale': 'en-us'},
+                                                            {'uid': 'b2', 'locale': 'en-us'}])
+        self.assertEqual(self._read('entries/blog/fr-fr'), [{'uid': 'b1', 'title': 'Café', 'locale': 'fr-fr'}])
+        entry_locales = sorted(call.params['locale'] for call in self.transport.calls
+                               if call.url.endswith('content_types/blog/entries'))
+        self.assertEqual(entry_locales, ['en-us', 'fr-fr'])
+        self.assertEqual(self._read('terms/regions'), [{'uid': 'emea'}])
+        with open(os.path.join(self.directory, 'assets', 'a1', 'logo.png'), 'rb') as file:
+            self.assertEqual(file.read(), b'png')
+        with open(os.path.join(self.directory, 'manifest.json'), encoding='utf-8') as file:
+            self.assertEqual(json.load(file), manifest)
+        self.assertTrue(all(call.headers['api_key'] == 'api_key' for call in self.transport.calls))
+        self.assertFalse([name for name in os.listdir(self.directory) if name.endswith('.tmp')])
+
+    def test_export_selected_modules_with_streaming(self):
+        """Test that only the requested modules are exported and streamed pages are decoded"""
+        manifest = self.client.stack('api_key').export_to(self.directory, modules=['content_types'], stream=True)
+        self.assertEqual(manifest['files'], {'content_types': 2, 'entries/blog/en-us': 2, 'entries/blog/fr-fr': 1,
+                                             'entries/page/en-us': 0, 'entries/page/fr-fr': 0})
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'assets.ndjson')))
+
+    def test_journal_resumes_interrupted_export(self):
+        """Test that files recorded in the journal are not exported again"""
+        journal = os.path.join(self.directory, 'export.journal')
+        self.client.stack('api_key').export_to(self.directory, modules=['content_types', 'assets'], journal=journal)
+        sent = len(self.transport.calls)
+        os.remove(os.path.join(self.directory, 'assets.ndjson'))
+        manifest = self.client.stack('api_key').export_to(self.directory, modules=['content_types', 'assets'],
+                                                          journal=journal)
+        self.assertEqual(manifest['files'], {'assets': 1, 'assets/files': 1, 'content_types': 2,
+                                             'entries/blog/en-us': 2, 'entries/blog/fr-fr': 1,
+                                             'entries/page/en-us': 0, 'entries/page/fr-fr': 0})
+        self.assertEqual([call.url.rsplit('/', 1)[1] for call in self.transport.calls[sent:]], ['locales', 'assets'])
+
+    def test_asset_files_can_be_left_out(self):
+        """Test that only the asset metadata is exported when asset files are not requested"""
+        manifest = self.client.stack('api_key').export_to(self.directory, modules=['assets'], asset_files=False)
+        self.assertEqual(manifest['files'], {'assets': 1})
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'assets')))
+
+    def test_failed_asset_download_fails_the_export(self):
+        """Test that an asset file that cannot be downloaded is reported instead of silently missing"""
+        self.transport.routes = [route for route in self.transport.routes if route[1] != 'assets/api_key/a1']
+        with self.assertRaises(Exception) as raised:
+            self.client.stack('api_key').export_to(self.directory, modules=['assets'])
+        self.assertIn('a1', str(raised.exception))
+
+    def test_failed_module_fails_the_export(self):
+        """Test that an API error stops the export and leaves no partial file"""
+        transport = StubTransport()
+        transport.add('GET', 'locales', json={'locales': [{'code': 'en-us'}]})
+        transport.add('GET', 'content_types', json={'content_types': [{'uid': 'broken'}], 'count': 1})
+        transport.add('GET', 'content_types/broken/entries', status_code=422, json={'error_message': 'invalid'})
+        client = contentstack_management.Client(authtoken='authtoken', transport=transport)
+        with self.assertRaises(requests.HTTPError):
+            client.stack('api_key').export_to(self.directory, modules=['content_types'])
+        self.assertEqual(os.listdir(os.path.join(self.directory, 'entries', 'broken')), [])
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'manifest.json')))
+
+
+if __name__ == '__main__':
+    unittest.main()
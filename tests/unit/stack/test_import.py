@@ -0,0 +1,168 @@
+import json
+import os
+import tempfile
+import unittest
+
+import contentstack_management
+from contentstack_management._transport import StubTransport
+from contentstack_management.stack._import import schema_references
+from requests_toolbelt.multipart.decoder import MultipartDecoder
+
+
+def _write(directory, name, items):
+    path = os.path.join(directory, f"{name}.ndjson")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        for item in items:
+            file.write(json.dumps(item) + '\n')
+
+
+def _reference(uid, *targets):
+    return {'uid': uid, 'title': uid, 'schema': [{'uid': 'ref', 'data_type': 'reference', 'reference_to': list(targets)}]}
+
+
+class StackImportTests(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        _write(self.directory, 'locales', [{'code': 'en-us', 'name': 'English'},
+                                           {'code': 'fr-ca', 'name': 'French (Canada)', 'fallback_locale': 'fr-fr'},
+                                           {'code': 'fr-fr', 'name': 'French', 'fallback_locale': 'en-us'}])
+        _write(self.directory, 'environments', [{'uid': 'env', 'name': 'production', 'urls': [], '_version': 3}])
+        _write(self.directory, 'global_fields', [
+            {'uid': 'meta', 'schema': [{'uid': 'seo', 'data_type': 'global_field', 'reference_to': 'seo'}]},
+            {'uid': 'seo', 'schema': [{'uid': 'title', 'data_type': 'text'}]}])
+        _write(self.directory, 'content_types', [_reference('blog', 'author'), {'uid': 'author', 'schema': []}])
+        _write(self.directory, 'assets', [{'uid': 'a1', 'filename': 'logo.png'}, {'uid': 'a2', 'filename': 'gone.png'}])
+        os.makedirs(os.path.join(self.directory, 'assets', 'a1'))
+        with open(os.path.join(self.directory, 'assets', 'a1', 'logo.png'), 'wb') as file:
+            file.write(b'png')
+        _write(self.directory, 'entries/blog/en-us', [
+            {'uid': 'b1', 'title': 'First', 'locale': 'en-us', 'created_at': 'x', 'image': 'a1', 'banner': 'a2',
+             'ref': [{'uid': 'b2', '_content_type_uid': 'blog'}]},
+            {'uid': 'b2', 'title': 'Second', 'locale': 'en-us', 'ref': []}])
+        _write(self.directory, 'releases', [{'uid': 'r1', 'name': 'Launch', 'items': [
+            {'uid': 'b1', 'content_type_uid': 'blog', 'version': 7, 'action': 'publish', 'locale': 'en-us'}]}])
+
+        self.transport = StubTransport()
+        self.transport.add('GET', 'stacks', json={'stack': {'master_locale': 'en-us'}})
+        self.transport.add('POST', 'locales', json={'locale': {}})
+        self.transport.add('POST', 'environments', json={'environment': {}})
+        self.transport.add('POST', 'global_fields/import', json={'global_field': {}})
+        self.transport.add('POST', 'content_types/import', json={'content_type': {}})
+        self.transport.add('POST', 'assets', json={'asset': {'uid': 'new_a1', '_version': 1}})
+        self.transport.add('POST', 'content_types/blog/entries/import', json={'entry': {'uid': 'new_b1', '_version': 1}})
+        self.transport.add('POST', 'content_types/blog/entries/import', json={'entry': {'uid': 'new_b2', '_version': 1}})
+        self.transport.add('PUT', 'content_types/blog/entries/new_b1', json={'entry': {'uid': 'new_b1', '_version': 2}})
+        self.transport.add('POST', 'releases', json={'release': {'uid': 'new_r1'}})
+        self.transport.add('POST', 'releases/new_r1/items', json={'notice': 'added'})
+        self.client = contentstack_management.Client(authtoken='authtoken', transport=self.transport)
+
+    def _calls(self, method, suffix):
+        return [call for call in self.transport.calls if call.method == method and call.url.endswith(suffix)]
+
+    @staticmethod
+    def _uploaded(call, field):
+        decoder = MultipartDecoder(call.data, call.headers['Content-Type'])
+        for part in decoder.parts:
+            if f'name="{field}"' in part.headers[b'Content-Disposition'].decode():
+                return json.loads(part.content)
+
+    def test_import_follows_dependency_order_and_remaps_uids(self):
+        """Test that modules are imported in dependency order and entry references use the new uids"""
+        result = self.client.stack('api_key').import_from(self.directory, workers=1)
+        self.assertEqual(result['created'], {'assets': 1, 'content_types': 2, 'entries': 2, 'environments': 1,
+                                             'global_fields': 2, 'locales': 2, 'releases': 1})
+        self.assertEqual(result['skipped'], {'assets': 1})
+        locales = [json.loads(call.data)['locale']['code'] for call in self._calls('POST', 'locales')]
+        self.assertEqual(locales, ['fr-fr', 'fr-ca'])
+        global_fields = [self._uploaded(call, 'global_field')['uid'] for call in self._calls('POST', 'global_fields/import')]
+        self.assertEqual(global_fields, ['seo', 'meta'])
+        content_types = [self._uploaded(call, 'content_type')['uid'] for call in self._calls('POST', 'content_types/import')]
+        self.assertEqual(content_types, ['author', 'blog'])
+        first = self._uploaded(self._calls('POST', 'entries/import')[0], 'entry')['entry']
+        # The file of a2 was not supplied, so the field is removed instead of keeping its old uid
+        self.assertEqual(first, {'title': 'First', 'locale': 'en-us', 'image': 'new_a1', 'ref': []})
+        linked = json.loads(self._calls('PUT', 'entries/new_b1')[0].data)['entry']
+        self.assertEqual(linked['ref'], [{'uid': 'new_b2', '_content_type_uid': 'blog'}])
+        self.assertEqual(len(self._calls('PUT', 'entries/new_b2')), 0)
+        items = json.loads(self._calls('POST', 'releases/new_r1/items')[0].data)['items']
+        self.assertEqual(items[0]['uid'], 'new_b1')
+        self.assertEqual(items[0]['version'], 2)
+
+    def test_localized_entries_are_saved_on_the_master_entry(self):
+        """Test that entries exported in another locale become localizations of the entry created in the master locale"""
+        _write(self.directory, 'entries/blog/fr-fr', [{'uid': 'b1', 'title': 'Premier', 'locale': 'fr-fr', 'ref': []}])
+        result = self.client.stack('api_key').import_from(self.directory, workers=1)
+        self.assertEqual(result['created']['entries'], 2)
+        self.assertEqual(result['created']['localized_entries'], 1)
+        self.assertEqual([call.params['locale'] for call in self._calls('POST', 'entries/import')], ['en-us', 'en-us'])
+        localized = [call for call in self._calls('PUT', 'entries/new_b1') if call.params['locale'] == 'fr-fr']
+        self.assertEqual(len(localized), 1)
+        self.assertEqual(json.loads(localized[0].data)['entry']['title'], 'Premier')
+        rerun = self.client.stack('api_key').import_from(self.directory, workers=1)
+        self.assertEqual(rerun['skipped']['entries'], 3)
+
+    def test_rerun_skips_imported_items(self):
+        """Test that items recorded in the checkpoint journal are not imported again"""
+        self.transport.add('PUT', 'content_types/blog/entries/new_b2', json={'entry': {'uid': 'new_b2', '_version': 2}})
+        self.client.stack('api_key').import_from(self.directory, workers=4)
+        sent = len(self.transport.calls)
+        result = self.client.stack('api_key').import_from(self.directory, workers=4)
+        self.assertEqual(result['created'], {})
+        self.assertEqual([call.method for call in self.transport.calls[sent:]], ['GET'])
+
+    def test_sqlite_journal_records_new_uids(self):
+        """Test that a SQLite journal keeps the uid remapping table of the import"""
+        path = os.path.join(self.directory, 'import.db')
+        self.client.stack('api_key').import_from(self.directory, workers=1, journal=path)
+        with contentstack_management.SqliteJournal(path) as journal:
+            self.assertEqual(journal.get('entries/b1'), {'uid': 'new_b1', 'version': 2})
+            self.assertEqual(journal.get('assets/a1'), {'uid': 'new_a1', 'version': 1})
+            self.assertIn('content_types/blog', journal)
+
+    def test_cyclic_content_types_are_imported_in_two_passes(self):
+        """Test that content types referencing each other are created without references, then updated"""
+        _write(self.directory, 'content_types', [_reference('a', 'b'), _reference('b', 'a')])
+        for name in ('locales', 'environments', 'global_fields', 'assets', 'entries/blog/en-us', 'releases'):
+            os.remove(os.path.join(self.directory, f"{name}.ndjson"))
+        self.transport.add('PUT', 'content_types/a', json={'content_type': {}})
+        self.transport.add('PUT', 'content_types/b', json={'content_type': {}})
+        result = self.client.stack('api_key').import_from(self.directory, workers=2)
+        self.assertEqual(result['created'], {'content_types': 2})
+        for call in self._calls('POST', 'content_types/import'):
+            self.assertEqual(self._uploaded(call, 'content_type')['schema'], [])
+        updated = [json.loads(call.data)['content_type'] for call in self.transport.calls if call.method == 'PUT']
+        self.assertEqual(sorted(item['uid'] for item in updated), ['a', 'b'])
+        self.assertTrue(all(item['schema'][0]['data_type'] == 'reference' for item in updated))
+
+    def test_global_fields_referencing_content_types_are_completed_last(self):
+        """Test that a global field with a reference field is imported without it, then updated after the content types"""
+        _write(self.directory, 'global_fields', [_reference('byline', 'author')])
+        _write(self.directory, 'content_types', [{'uid': 'author', 'schema': []}])
+        for name in ('locales', 'environments', 'assets', 'entries/blog/en-us', 'releases'):
+            os.remove(os.path.join(self.directory, f"{name}.ndjson"))
+        self.transport.add('PUT', 'global_fields/byline', json={'global_field': {}})
+        result = self.client.stack('api_key').import_from(self.directory, workers=2)
+        self.assertEqual(result['created'], {'content_types': 1, 'global_fields': 1})
+        urls = [call.url for call in self.transport.calls if call.method in ('POST', 'PUT')]
+        self.assertEqual([url.split('/v3/')[1] for url in urls],
+                         ['global_fields/import', 'content_types/import', 'global_fields/byline'])
+        self.assertEqual(self._uploaded(self._calls('POST', 'global_fields/import')[0], 'global_field')['schema'], [])
+        updated = json.loads(self._calls('PUT', 'global_fields/byline')[0].data)['global_field']
+        self.assertEqual(updated['schema'][0]['reference_to'], ['author'])
+
+    def test_schema_references_walk_nested_fields(self):
+        """Test that references inside groups, modular blocks and global field blocks are found"""
+        schema = [{'uid': 'group', 'data_type': 'group', 'schema': [
+            {'uid': 'author', 'data_type': 'reference', 'reference_to': ['author']}]},
+                  {'uid': 'blocks', 'data_type': 'blocks', 'blocks': [
+                      {'uid': 'hero', 'schema': [{'uid': 'seo', 'data_type': 'global_field', 'reference_to': 'seo'}]},
+                      {'uid': 'meta', 'reference_to': 'meta'}]}]
+        self.assertEqual(schema_references(schema), ({'author'}, {'seo', 'meta'}))
+
+
+if __name__ == '__main__':
+    unittest.main()